@@ -0,0 +1,89 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Time DupeChecker.filter_dupes on a synthetic season-pack search.
+
+Usage (from the repository root):
+    python bin/dupe_benchmark.py
+    python bin/dupe_benchmark.py --dupes 200 --files 100 -t MTV -t AITHER
+
+The upload is a season pack of --files episodes and the tracker returns --dupes other season
+packs with the same number of files, none sharing a filename with the upload, so every local
+file is compared with every remote file of every result: the worst case for filename matching.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.dupe_checking import DupeChecker  # noqa: E402
+
+
+def season_files(name: str, count: int) -> list[str]:
+    return [f"{name.replace('S01', f'S01E{episode:02d}')}.mkv" for episode in range(1, count + 1)]
+
+
+def synthetic_search(dupe_count: int, file_count: int) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    name = "Some.Show.S01.1080p.WEB-DL.DDP5.1.H.264-OURS"
+    meta: dict[str, Any] = {
+        'name': name.replace('.', ' '),
+        'uuid': name,
+        'category': 'TV',
+        'tv_pack': 1,
+        'season': 'S01',
+        'episode': '',
+        'resolution': '1080p',
+        'type': 'WEBDL',
+        'source': 'Web',
+        'tag': '-OURS',
+        'hdr': '',
+        'video_encode': 'H.264',
+        'sd': 0,
+        'source_size': 123456789,
+        'filelist': [f"/media/{name}/{filename}" for filename in season_files(name, file_count)],
+    }
+    dupes: list[dict[str, Any]] = []
+    for index in range(dupe_count):
+        dupe_name = f"Some.Show.S01.1080p.WEB-DL.DDP5.1.H.264-GRP{index}"
+        dupes.append({
+            'name': dupe_name,
+            'size': 987654321 + index,
+            'files': season_files(dupe_name, file_count),
+            'file_count': file_count,
+            'link': f"https://tracker.example/torrents/{index}",
+            'id': index,
+        })
+    return meta, dupes
+
+
+async def time_tracker(checker: DupeChecker, tracker: str, dupe_count: int, file_count: int, rounds: int) -> tuple[list[float], int]:
+    timings: list[float] = []
+    kept = 0
+    for _ in range(rounds):
+        meta, dupes = synthetic_search(dupe_count, file_count)
+        start = time.perf_counter()
+        kept = len(await checker.filter_dupes(dupes, meta, tracker))
+        timings.append(time.perf_counter() - start)
+    return timings, kept
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dupe filtering on a synthetic season pack.")
+    parser.add_argument("--dupes", type=int, default=100, help="results returned by the tracker (default: 100)")
+    parser.add_argument("--files", type=int, default=60, help="files in the upload and in each result (default: 60)")
+    parser.add_argument("--rounds", type=int, default=5, help="timed rounds per tracker (default: 5)")
+    parser.add_argument("-t", "--tracker", action="append", help="tracker rules to apply, repeatable (default: MTV and AITHER)")
+    args = parser.parse_args()
+
+    checker = DupeChecker({'DEFAULT': {}, 'TRACKERS': {}})
+    for tracker in args.tracker or ["MTV", "AITHER"]:
+        timings, kept = await time_tracker(checker, tracker, args.dupes, args.files, max(1, args.rounds))
+        print(f"{tracker}: {args.dupes} results x {args.files} files: median {statistics.median(timings) * 1000:.1f} ms "
+              f"(min {min(timings) * 1000:.1f} ms, max {max(timings) * 1000:.1f} ms), {kept} kept as dupes")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Compare the per-frame and single-pass screenshot capture engines on one video.
+
+Usage (from the repository root):
+    python bin/screenshot_benchmark.py /path/to/video.mkv
+    python bin/screenshot_benchmark.py /path/to/video.mkv -n 12 --workers 2 --tonemap
+
+Both engines capture the same evenly spaced timestamps into a temporary directory with the
+same filter chain, so only process and decoder set-up differ. --tonemap applies the zscale
+HDR chain (libplacebo needs a Vulkan device and is not exercised here).
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import takescreens  # noqa: E402
+from src.exportmi import parse_mediainfo_outputs  # noqa: E402
+
+
+def video_geometry(path: str) -> tuple[float, float, float]:
+    """(duration seconds, width, height) of the first video track."""
+    _, json_text = parse_mediainfo_outputs(path)
+    tracks = json.loads(json_text)['media']['track']
+    video = next(track for track in tracks if track.get('@type') == 'Video')
+    duration = float(video.get('Duration') or tracks[0].get('Duration') or 0)
+    return duration, float(video.get('Width', 1920)), float(video.get('Height', 1080))
+
+
+async def run_per_frame(path: str, targets: list[tuple[int, float, str]], workers: int, width: float, height: float, hdr: bool, meta: dict[str, Any]) -> int:
+    semaphore = asyncio.Semaphore(workers)
+
+    async def one(target: tuple[int, float, str]) -> Any:
+        index, ss_time, image_path = target
+        async with semaphore:
+            return await takescreens.capture_screenshot((index, path, ss_time, image_path, width, height, 1.0, 1.0, 'error', hdr, meta))
+
+    results = await asyncio.gather(*[one(target) for target in targets])
+    return sum(1 for result in results if result and result[1])
+
+
+async def run_single_pass(path: str, targets: list[tuple[int, float, str]], workers: int, width: float, height: float, hdr: bool, meta: dict[str, Any]) -> int:
+    results = await takescreens.capture_screenshots_batched(path, targets, workers, width, height, 1.0, 1.0, 'error', hdr, meta)
+    return sum(1 for _, image_path in results if image_path)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark screenshot capture engines.")
+    parser.add_argument("video", help="video file to capture from")
+    parser.add_argument("-n", "--frames", type=int, default=6, help="screenshots per run (default: 6)")
+    parser.add_argument("--workers", type=int, default=1, help="concurrent ffmpeg processes, like process_limit (default: 1)")
+    parser.add_argument("--rounds", type=int, default=3, help="timed rounds per engine (default: 3)")
+    parser.add_argument("--tonemap", action="store_true", help="apply the zscale tonemap chain")
+    args = parser.parse_args()
+
+    takescreens.TakeScreensManager({'DEFAULT': {'use_libplacebo': False}})  # applies the screenshot settings module-wide
+    duration, width, height = video_geometry(args.video)
+    if duration <= 0:
+        raise SystemExit("Could not read the video duration")
+    meta: dict[str, Any] = {'debug': False, 'libplacebo': False, 'frame_overlay': False, '_libplacebo_warmed': True}
+    times = [duration * (i + 1) / (args.frames + 1) for i in range(args.frames)]
+
+    engines = {'per-frame': run_per_frame, 'single-pass': run_single_pass}
+    timings: dict[str, list[float]] = {name: [] for name in engines}
+    with tempfile.TemporaryDirectory(prefix="ua-screens-") as tmp:
+        for _ in range(max(1, args.rounds)):
+            for name, engine in engines.items():
+                targets = [(i, ss_time, os.path.join(tmp, f"{name}-{i}.png")) for i, ss_time in enumerate(times)]
+                start = time.perf_counter()
+                captured = await engine(args.video, targets, args.workers, width, height, args.tonemap, meta)
+                timings[name].append(time.perf_counter() - start)
+                if captured != len(targets):
+                    print(f"warning: {name} captured {captured}/{len(targets)} frames")
+
+    print(f"{args.frames} frames of {os.path.basename(args.video)} ({int(width)}x{int(height)}, {duration:.0f}s), "
+          f"{args.workers} worker(s){', tonemapped' if args.tonemap else ''}")
+    for name, samples in timings.items():
+        print(f"  {name:<12} best {min(samples):6.2f}s  mean {sum(samples) / len(samples):6.2f}s")
+    print(f"  speed-up     {min(timings['per-frame']) / min(timings['single-pass']):.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Measure cold-start import cost with `python -X importtime`.
+
+Usage (from the repository root):
+    python bin/startup_benchmark.py                      # import upload.py, 5 runs, top 25 modules
+    python bin/startup_benchmark.py -m src.trackersetup -n 10 --top 40
+
+Each run is a fresh interpreter, so the numbers include everything a CLI invocation or a
+web-UI-spawned subprocess pays before main() starts. Bytecode caches are left in place;
+run once beforehand to warm them.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_once(module: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    """Return (wall seconds, {module: (self us, cumulative us)}) for one fresh import of `module`."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - start
+    timings: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        timings[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    if not timings:
+        raise RuntimeError(f"import {module} produced no -X importtime output:\n{result.stderr[-2000:]}")
+    return elapsed, timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report interpreter start-up and import time.")
+    parser.add_argument("-m", "--module", default="upload", help="module to import (default: upload)")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="fresh interpreters to time (default: 5)")
+    parser.add_argument("--top", type=int, default=25, help="slowest modules to list (default: 25)")
+    args = parser.parse_args()
+
+    walls: list[float] = []
+    runs: list[dict[str, tuple[int, int]]] = []
+    for _ in range(max(1, args.runs)):
+        wall, timings = import_once(args.module)
+        walls.append(wall)
+        runs.append(timings)
+
+    # Per-module medians smooth out disk-cache and scheduler noise between runs
+    modules = set().union(*runs)
+    medians = {
+        name: (
+            statistics.median(run.get(name, (0, 0))[0] for run in runs),
+            statistics.median(run.get(name, (0, 0))[1] for run in runs),
+        )
+        for name in modules
+    }
+    tracker_modules = [name for name in modules if name.startswith("src.trackers.")]
+
+    print(f"import {args.module}: median wall {statistics.median(walls) * 1000:.0f} ms over {len(walls)} runs "
+          f"(min {min(walls) * 1000:.0f} ms, max {max(walls) * 1000:.0f} ms)")
+    print(f"modules imported: {len(modules)}, of which src.trackers.*: {len(tracker_modules)} "
+          f"({sum(medians[name][0] for name in tracker_modules) / 1000:.1f} ms self time)")
+    print()
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, (self_us, cumulative_us) in sorted(medians.items(), key=lambda item: item[1][1], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
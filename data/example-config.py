@@ -58,6 +58,12 @@ config = {
         # utp.pm API key
         "utppm_api": "",
 
+        # Remember which image hosts already hold each screenshot (by content hash) in data/image_hosts,
+        # so uploading identical bytes to the same host again reuses the existing links.
+        "image_upload_cache": True,
+        # Days a remembered upload is reused before checking that the host still serves it.
+        "image_upload_cache_verify_days": 7,
+
         # GETTING METADATA
 
         # btn api key used to get details from btn
@@ -71,9 +77,24 @@ config = {
         # Set to true to always just use the largest playlist on a blu-ray, without selection prompt.
         "use_largest_playlist": False,
 
+        # Number of Blu-ray playlists BDInfo scans at the same time when several are selected.
+        # Finished reports are cached in data/bdinfo and reused when the same disc is scanned again.
+        "bdinfo_parallel_scans": 2,
+
         # Set False to skip getting images from tracker descriptions
         "keep_images": True,
 
+        # Validate images from tracker descriptions by reading only the start of each file for its resolution
+        # The full images are downloaded later, and only if they need rehosting. Set False to download every image while checking
+        "header_only_image_checks": True,
+
+        # Cache TMDB, IMDb, TVmaze and AniList responses in data/metadata, so re-runs and season packs fetch each title once
+        # Use --refresh-metadata to ignore the cache for one run
+        "metadata_cache": True,
+
+        # Size limit of the metadata cache in MB; the least recently used responses are removed past it
+        "metadata_cache_size_mb": 256,
+
         # set true to only grab meta id's from trackers, not descriptions
         "only_id": False,
 
@@ -135,6 +156,25 @@ config = {
         # This places an additional limitation on ffmpeg to reduce CPU usage
         "ffmpeg_limit": False,
 
+        # Set false to capture each screenshot with its own ffmpeg process
+        # When true, each of the process_limit ffmpeg processes captures several frames in one run,
+        # so ffmpeg start-up and tonemap (libplacebo) set-up happen once per process instead of once per frame
+        "single_pass_screenshots": True,
+
+        # Set false to take screenshots at exactly evenly spaced times
+        # When true, each time is moved to the first keyframe after it (read from the container index, no decoding),
+        # so ffmpeg does not decode up to a whole GOP of frames per screenshot on long-GOP encodes
+        "snap_screenshots_to_keyframes": True,
+
+        # Losslessly recompress screenshots in background threads while the rest are captured
+        # Uses oxipng when installed (pip install pyoxipng); images over an image host's size limit get the strongest settings
+        # Without oxipng, only screenshots over the image host's size limit are recompressed, with Pillow
+        "optimize_screenshots": True,
+
+        # Upload each screenshot to the image host as soon as it is captured, instead of after all captures finish
+        # Not used for discs; if any streamed upload fails, screenshots are uploaded after capture as before, with image host fallback
+        "stream_screenshot_uploads": True,
+
         # Tonemap HDR - DV+HDR screenshots
         "tone_map": True,
 
@@ -307,11 +347,21 @@ config = {
         # Does not override MTV preference for small pieces
         "prefer_max_16_torrent": False,
 
+        # Piece hashes are cached under data/piece_layers so trackers with piece size limits (HDB, MTV, PTP)
+        # can get their own .torrent without reading the content again.
+        # "trackers" also hashes those trackers' piece sizes while creating the BASE torrent (used instead of mkbrr then),
+        # "all" hashes every piece size from 32 KiB to 128 MiB in that same pass (CPU heavy), "off" disables the cache
+        "piece_layer_cache": "trackers",
+
         # Tracker based rehashing cooldown.
         # For trackers that might need specific piece size rehashing, using a value higher than 0 will add the specified cooldown
         # in (seconds) before rehashing begins, to allow other tasks to complete quickly, before resources are consumed by rehashing
         "rehash_cooldown": "0",
 
+        # When processing a --queue, prepare this many upcoming files in the background (MediaInfo, and the BASE piece
+        # layers when piece_layer_cache is enabled) while the current file uploads. Set to 0 to disable. Can be overridden with --queue-lookahead
+        "queue_lookahead": "1",
+
         # POST UPLOAD
 
         # Delay (in seconds) before injecting the torrent to allow the tracker to register the hash and avoid 'unregistered torrent' errors.
@@ -322,6 +372,10 @@ config = {
         # Useful for knowing which trackers are slowing down the overall upload process
         "show_upload_duration": True,
 
+        # Whether or not to print how long each stage (prep, dupe checks, screenshots, image upload, torrent hashing,
+        # description) and each tracker's rehost/upload/client chain took. Always printed in debug mode
+        "show_stage_timings": False,
+
         # Set true to print the tracker api messages from uploads
         "print_tracker_messages": False,
 
@@ -4,6 +4,7 @@ import json
 import os
 import random
 import re
+import time
 from collections.abc import Mapping, MutableMapping, Sequence
 from pathlib import Path
 from typing import Any, Optional, cast
@@ -14,12 +15,74 @@ from bs4 import BeautifulSoup
 from bs4.element import AttributeValueList
 from rich.console import Console
 
+from src.http_pool import pooled_client
+
 console = Console()
 
 Meta = MutableMapping[str, Any]
 Release = MutableMapping[str, Any]
 MovieLink = MutableMapping[str, Any]
 
+# blu-ray.com answers "No index" when release pages are requested too quickly
+RELEASE_FETCH_RATE = 1.0  # sustained requests per second
+RELEASE_FETCH_BURST = 3
+RELEASE_FETCH_CONCURRENCY = 3
+# Parsed release specs are kept in data/bluray_com; bump the version when parse_release_details changes
+RELEASE_CACHE_VERSION = 1
+RELEASE_CACHE_TTL = 30 * 86400
+
+
+class TokenBucket:
+    """Allow `rate` acquisitions per second on average, with bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(float(self.capacity), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def release_cache_path(base_dir: str, release_id: str) -> str:
+    return os.path.join(base_dir, "data", "bluray_com", f"{release_id}.json")
+
+
+def _load_release_record(cache_path: str) -> Optional[dict[str, Any]]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    record_dict = cast(dict[str, Any], record)
+    if record_dict.get('version') != RELEASE_CACHE_VERSION or not isinstance(record_dict.get('specs'), dict):
+        return None
+    if float(record_dict.get('fetched_at', 0)) + RELEASE_CACHE_TTL < time.time():
+        return None
+    return record_dict
+
+
+def _store_release_record(cache_path: str, record: dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
 
 def _style_contains(style: Optional[str], token: str) -> bool:
     return bool(style and token in style)
@@ -92,7 +155,7 @@ async def search_bluray(meta: Meta) -> Optional[str]:
 
             if meta.get('debug'):
                 console.print(f"[yellow]Sending request to blu-ray.com (attempt {retry_count + 1}/{max_retries + 1})...[/yellow]")
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
+            async with pooled_client(timeout=10.0, follow_redirects=True) as client:
                 response = await client.get(url, headers=headers)
 
                 if response.status_code == 200 and "No index" not in response.text:
@@ -415,7 +478,7 @@ async def get_bluray_releases(meta: Meta) -> list[Release]:
 
             while retry_count <= max_retries:
                 try:  # noqa: PERF203
-                    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+                    async with pooled_client(timeout=15.0, follow_redirects=True) as client:
                         response = await client.get(ajax_url, headers=headers)
 
                         if response.status_code == 200 and "No index" not in response.text:
@@ -780,7 +843,7 @@ async def download_cover_images(meta: Meta) -> bool:
     downloaded_images: dict[str, str] = {}
     console.print("[blue]Downloading cover images...[/blue]")
 
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+    async with pooled_client(timeout=30.0, follow_redirects=True) as client:
         cover_images = cast(Mapping[str, str], meta.get('cover_images', {}))
         for img_type, url in cover_images.items():
             file_ext = os.path.splitext(url)[1]
@@ -895,10 +958,26 @@ def clean_image_url(url: Optional[str]) -> Optional[str]:
     return url
 
 
-async def fetch_release_details(release: Release, meta: Meta) -> Release:
+async def fetch_release_details(release: Release, meta: Meta, bucket: Optional[TokenBucket] = None) -> Release:
+    """Fill in release['specs'] (and cover images) from the release page.
+
+    Parsed records are reused from data/bluray_com across runs. Requests go through `bucket`,
+    shared by concurrent callers to stay under blu-ray.com's rate limit.
+    """
     release_url = release['url']
     release_id = release.get('release_id', '0000000')
     debug_filename = f"{meta.get('base_dir', '')}/tmp/{meta.get('uuid', '')}/debug_release_{release_id}.html"
+    cache_path = release_cache_path(str(meta.get('base_dir', '')), str(release_id)) if release_id != '0000000' else None
+    if cache_path:
+        record = await asyncio.to_thread(_load_release_record, cache_path)
+        if record is not None:
+            release['specs'] = record['specs']
+            if meta.get('use_bluray_images', False) and record.get('cover_images'):
+                release['cover_images'] = record['cover_images']
+            if meta.get('debug'):
+                console.print(f"[green]Using cached details for release ID {release_id}[/green]")
+            return release
+
     if meta.get('debug'):
         console.print(f"[yellow]Fetching details for: {release['title']} - {release_url}[/yellow]")
 
@@ -912,17 +991,15 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
             response_text = await asyncio.to_thread(Path(debug_filename).read_text, encoding="utf-8")
 
             if response_text and "No index" not in response_text:
-                return await parse_release_details(response_text, release, meta)
+                return await _parse_and_cache_release(response_text, release, meta, cache_path)
             else:
                 console.print("[yellow]Cached file exists but appears to be invalid, will fetch fresh data[/yellow]")
     except Exception as e:
         console.print(f"[yellow]Error reading cached file: {str(e)}[/yellow]")
 
     # If we're here, we need to make a request
-    delay = random.uniform(2, 4)  # nosec B311 - Rate limiting delay, not cryptographic
-    if meta.get('debug'):
-        console.print(f"[dim]Waiting {delay:.2f} seconds before request...[/dim]")
-    await asyncio.sleep(delay)
+    if bucket is None:
+        bucket = TokenBucket(RELEASE_FETCH_RATE, RELEASE_FETCH_BURST)
 
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -942,10 +1019,11 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
 
     while retry_count <= max_retries:
         try:
+            await bucket.acquire()
             if meta.get('debug'):
                 console.print(f"[yellow]Sending request to {release_url} (attempt {retry_count + 1}/{max_retries + 1})...[/yellow]")
 
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+            async with pooled_client(timeout=15.0, follow_redirects=True) as client:
                 response = await client.get(release_url, headers=headers)
 
                 if response.status_code == 200 and "No index" not in response.text:
@@ -998,8 +1076,20 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
         console.print("[red]Failed to retrieve release details after all attempts[/red]")
         return release
     else:
-        release = await parse_release_details(response_text, release, meta)
-        return release
+        return await _parse_and_cache_release(response_text, release, meta, cache_path)
+
+
+async def _parse_and_cache_release(response_text: str, release: Release, meta: Meta, cache_path: Optional[str]) -> Release:
+    release = await parse_release_details(response_text, release, meta)
+    if cache_path and isinstance(release.get('specs'), dict):
+        # Cover images are stored even when not wanted now, so a later run with use_bluray_images can reuse the record
+        try:
+            cover_images = release.get('cover_images') or extract_cover_images(response_text)
+            record = {'version': RELEASE_CACHE_VERSION, 'fetched_at': time.time(), 'specs': release['specs'], 'cover_images': cover_images}
+            await asyncio.to_thread(_store_release_record, cache_path, record)
+        except Exception as e:
+            console.print(f"[dim]Could not cache release details: {str(e)}[/dim]")
+    return release
 
 
 def extract_section(specs_td: Any, section_title: str) -> Optional[str]:
@@ -1107,11 +1197,16 @@ async def process_all_releases(releases: Sequence[Release], meta: Meta) -> list[
         else:
             console.print(f"[red]BD_SUMMARY file not found: {bd_summary_path}[/red]")
 
-    detailed_releases: list[Release] = []
-    for idx, release in enumerate(releases, 1):
-        console.print(f"[cyan]Processing release {idx}/{len(releases)}: {release['title']} ({release['country']})")
-        detailed_release = await fetch_release_details(release, meta)
-        detailed_releases.append(detailed_release)
+    # Release pages are fetched concurrently; the shared bucket paces the requests
+    bucket = TokenBucket(RELEASE_FETCH_RATE, RELEASE_FETCH_BURST)
+    semaphore = asyncio.Semaphore(RELEASE_FETCH_CONCURRENCY)
+
+    async def fetch(idx: int, release: Release) -> Release:
+        async with semaphore:
+            console.print(f"[cyan]Processing release {idx}/{len(releases)}: {release['title']} ({release['country']})")
+            return await fetch_release_details(release, meta, bucket)
+
+    detailed_releases: list[Release] = list(await asyncio.gather(*[fetch(idx, release) for idx, release in enumerate(releases, 1)]))
 
     if meta.get('debug'):
         console.print()
@@ -14,6 +14,7 @@ from typing import Any, Optional
 import psutil
 
 from src.console import console
+from src.http_pool import close_pools
 
 if os.name == "posix":
     import termios
@@ -24,12 +25,25 @@ IS_ANDROID = ('android' in platform.platform().lower() or
               'ANDROID_ROOT' in os.environ)
 
 running_subprocesses: set[subprocess.Popen[Any]] = set()
+# Pipeline stages (src/pipeline.py) and the hashing processes they own keep
+# running through the mid-run cleanup() calls made after screenshot capture.
+protected_tasks: set[asyncio.Task[Any]] = set()
+protected_pids: set[int] = set()
+# Per-tracker chains fanned out by src/pipeline.gather_stages(). While any run, a mid-run
+# cleanup would cancel their sub-tasks and kill their child processes (mkbrr, etc.).
+running_chains: set[asyncio.Task[Any]] = set()
 thread_executor: Optional[ThreadPoolExecutor] = None
 IS_MACOS = sys.platform == 'darwin'
 erase_key: Optional[str] = None
 
 
 class CleanupManager:
+    async def cleanup_between_stages(self) -> None:
+        """Mid-run cleanup after screenshot capture, skipped while tracker chains run concurrently."""
+        if running_chains:
+            return
+        await self.cleanup()
+
     async def cleanup(self) -> None:
         """Ensure all running tasks, threads, and subprocesses are properly cleaned up before exiting."""
         # console.print("[yellow]Cleaning up tasks before exiting...[/yellow]")
@@ -82,9 +96,18 @@ class CleanupManager:
         with contextlib.suppress(RuntimeError):
             await asyncio.sleep(0.1)
 
+        # 🔹 Close pooled keep-alive HTTP connections before tasks are cancelled,
+        # unless protected stages are still using them
+        if not protected_tasks:
+            with contextlib.suppress(Exception):
+                await close_pools()
+
         # 🔹 Step 5: Cancel all running asyncio tasks **gracefully**
         try:
-            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            tasks = [
+                t for t in asyncio.all_tasks()
+                if t is not asyncio.current_task() and t not in protected_tasks
+            ]
             # console.print(f"[yellow]Cancelling {len(tasks)} remaining tasks...[/yellow]")
 
             for task in tasks:
@@ -150,7 +173,10 @@ class CleanupManager:
             # Standard process cleanup for non-Android systems
             try:
                 current_process = psutil.Process()
-                children = current_process.children(recursive=True)
+                children = [
+                    child for child in current_process.children(recursive=True)
+                    if child.pid not in protected_pids
+                ]
 
                 for child in children:
                     # console.print(f"[yellow]Terminating process {child.pid}...[/yellow]")
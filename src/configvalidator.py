@@ -30,6 +30,8 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "lensdump_api": (str,),
     "ptscreens_api": (str,),
     "onlyimage_api": (str,),
+    "image_upload_cache": (bool,),
+    "image_upload_cache_verify_days": (int,),
     "add_logo": (bool,),
     "logo_size": (str, int),
     "episode_overview": (bool,),
@@ -45,6 +47,10 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "process_limit": (str, int),
     "threads": (str, int),
     "ffmpeg_limit": (bool,),
+    "single_pass_screenshots": (bool,),
+    "snap_screenshots_to_keyframes": (bool,),
+    "optimize_screenshots": (bool,),
+    "stream_screenshot_uploads": (bool,),
     "multiScreens": (str, int),
     "pack_thumb_size": (str, int),
     "charLimit": (str, int),
@@ -55,12 +61,18 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "sfx_on_prompt": (bool,),
     "tracker_pass_checks": (str, int),
     "use_largest_playlist": (bool,),
+    "bdinfo_parallel_scans": (int,),
     "keep_images": (bool,),
+    "header_only_image_checks": (bool,),
+    "metadata_cache": (bool,),
+    "metadata_cache_size_mb": (int,),
     "only_id": (bool,),
     "use_sonarr": (bool,),
     "use_radarr": (bool,),
     "mkbrr": (bool,),
     "mkbrr_threads": (str, int),
+    "queue_lookahead": (str, int),
+    "piece_layer_cache": (str,),
     "user_overrides": (bool,),
     "ping_unit3d": (bool,),
     "get_bluray_info": (bool,),
@@ -71,6 +83,7 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "bluray_single_score": (float, int),
     "keep_meta": (bool,),
     "show_upload_duration": (bool,),
+    "show_stage_timings": (bool,),
     "print_tracker_messages": (bool,),
     "print_tracker_links": (bool,),
     "emby_dir": (str, type(None)),
@@ -410,7 +423,7 @@ def _validate_default_section(default: dict[str, Any]) -> tuple[list[str], list[
     # Validate numeric string values can be parsed
     numeric_keys = ["screens", "cutoff_screens", "thumbnail_size", "process_limit", "threads",
                     "multiScreens", "pack_thumb_size", "charLimit", "fileLimit", "processLimit",
-                    "tracker_pass_checks", "mkbrr_threads", "ffmpeg_compression"]
+                    "tracker_pass_checks", "mkbrr_threads", "ffmpeg_compression", "queue_lookahead"]
     for key in numeric_keys:
         if key in default:
             value = default[key]
@@ -1,5 +1,6 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import hashlib
 import json
 import os
 import platform
@@ -23,6 +24,38 @@ from src.exportmi import setup_mediainfo_library
 PlaylistItem = dict[str, Any]
 PlaylistInfo = dict[str, Any]
 
+# Bump when the BDInfo binary or report handling changes in a way that invalidates cached reports
+BDINFO_CACHE_VERSION = 1
+
+
+def bdinfo_cache_path(base_dir: str, path: str, playlist: PlaylistInfo) -> Optional[str]:
+    """data/bdinfo cache file for one playlist of the disc at `path`.
+
+    The key hashes the MPLS, the CLPI of every clip it plays and the clip sizes, plus the disc
+    folder name BDInfo reports as the label, so the same disc is recognised wherever it is mounted.
+    """
+    digest = hashlib.sha256(f"{BDINFO_CACHE_VERSION}:{os.path.basename(os.path.dirname(path))}".encode())
+    try:
+        with open(playlist['path'], "rb") as f:
+            digest.update(f.read())
+        for item in sorted(playlist['items'], key=lambda item: item['file']):
+            clip_name = os.path.splitext(os.path.basename(item['file']))[0]
+            digest.update(f"{clip_name}:{item['size']}".encode())
+            clpi_path = os.path.join(path, "CLIPINF", f"{clip_name}.clpi")
+            if os.path.exists(clpi_path):
+                with open(clpi_path, "rb") as f:
+                    digest.update(f.read())
+    except (OSError, KeyError):
+        return None
+    return os.path.join(base_dir, "data", "bdinfo", f"{digest.hexdigest()}.txt")
+
+
+def _store_bdinfo_report(report_path: str, cache_path: str) -> None:
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    shutil.copyfile(report_path, tmp_path)
+    os.replace(tmp_path, cache_path)
+
 
 class DiscParse:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -106,6 +139,8 @@ class DiscParse:
         if meta.get('emby', False):
             return discs, meta_discs
 
+        # (disc index, disc path, selected playlists, all valid playlists) of each disc that needs scanning
+        disc_selections: list[tuple[int, str, list[PlaylistInfo], list[PlaylistInfo]]] = []
         for i in range(len(discs)):
             bdinfo_text = None
             path = os.path.abspath(discs[i]['path'])
@@ -255,163 +290,216 @@ class DiscParse:
                                 except ValueError:
                                     console.print("[bold red]Invalid input. Please try again.")
 
-                for idx, playlist in enumerate(selected_playlists):
-                    console.print(f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
-                    playlist_number = playlist['file'].replace(".mpls", "")
-                    playlist_report_path = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
+                disc_selections.append((i, path, selected_playlists, valid_playlists))
 
-                    if os.path.exists(playlist_report_path):
-                        bdinfo_text = playlist_report_path
-                    else:
-                        try:
-                            bdinfo_executable = None
-                            # Prefer the bundled bdinfo binary for the detected OS/arch
-                            system = platform.system().lower()
-                            machine = platform.machine().lower()
-                            if system == "linux":
-                                if machine in ("x86_64", "amd64"):
-                                    folder = "linux/amd64"
-                                elif machine in ("arm64", "aarch64"):
-                                    folder = "linux/arm64"
-                                else:
-                                    folder = "linux/arm"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, '-m', playlist['file'], save_dir]
-                            elif system == "darwin":
-                                folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, '-m', playlist['file'], save_dir]
-                            elif system == "windows":
-                                # Windows builds are provided as x64
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, '-m', playlist['file'], path, save_dir]
-
-                            # Fallback to system-installed commands if bundled binary not present
-                            if bdinfo_executable is None:
-                                if shutil.which("bdinfo"):
-                                    bdinfo_executable = ["bdinfo", path, '-m', playlist['file'], save_dir]
-                                elif shutil.which("BDInfo"):
-                                    bdinfo_executable = ["BDInfo", path, '-m', playlist['file'], save_dir]
-                                else:
-                                    console.print(f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]")
-                                    continue
+            else:
+                discs = meta_discs
 
-                            if bdinfo_executable:
-                                proc = await asyncio.create_subprocess_exec(
-                                    *bdinfo_executable
-                                )
-                                await proc.wait()
+        # Scan the selected playlists of every disc, a few at a time
+        max_scans = max(1, int(self.config['DEFAULT'].get('bdinfo_parallel_scans', 2) or 1))
+        semaphore = asyncio.Semaphore(max_scans)
+        scan_jobs = [
+            (i, idx, self._scan_playlist(base_dir, save_dir, i, path, playlist, semaphore, bool(meta.get('debug'))))
+            for i, path, selected_playlists, _ in disc_selections
+            for idx, playlist in enumerate(selected_playlists)
+        ]
+        scan_results = await asyncio.gather(*[job for _, _, job in scan_jobs])
+        reports = {(i, idx): report for (i, idx, _), report in zip(scan_jobs, scan_results)}
+
+        for i, path, selected_playlists, valid_playlists in disc_selections:
+            for idx, playlist in enumerate(selected_playlists):
+                bdinfo_text = reports.get((i, idx))
+                if bdinfo_text is None:
+                    continue
+                playlist_number = playlist['file'].replace(".mpls", "")
 
-                                if proc.returncode != 0:
-                                    console.print(f"[bold red]BDInfo failed with return code {proc.returncode}[/bold red]")
-                                    continue
+                # Process the BDInfo report in the while True loop
+                while True:
+                    try:
+                        if not os.path.exists(bdinfo_text):
+                            console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
+                            break
+
+                        text = await asyncio.to_thread(Path(bdinfo_text).read_text, encoding="utf-8", errors="replace")
+                        result = text.split("QUICK SUMMARY:", 2)
+                        files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
+                        result2 = result[1].rstrip(" \n")
+                        result = result2.split("********************", 1)
+                        bd_summary = result[0].rstrip(" \n")
+
+                        result = text.split("[code]", 3)
+                        result2 = result[2].rstrip(" \n")
+                        result = result2.split("FILES:", 1)
+                        ext_bd_summary = result[0].rstrip(" \n")
+
+                        # Save summaries and bdinfo for each playlist
+                        if idx == 0:
+                            summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
+                            extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
+                        else:
+                            summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
+                            extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
+
+                        # Strip multiple spaces to single spaces before saving
+                        bd_summary_cleaned = re.sub(r' +', ' ', bd_summary.strip())
+                        ext_bd_summary_cleaned = re.sub(r' +', ' ', ext_bd_summary.strip())
+
+                        await asyncio.to_thread(Path(summary_file).write_text, bd_summary_cleaned, encoding="utf-8", errors="replace")
+                        await asyncio.to_thread(Path(extended_summary_file).write_text, ext_bd_summary_cleaned, encoding="utf-8", errors="replace")
+
+                        bdinfo = self.parse_bdinfo(bd_summary_cleaned, files[1], path)
+
+                        # Prompt user for custom edition if conditions are met
+                        if len(selected_playlists) > 1:
+                            current_label = bdinfo.get('label', f"Playlist {idx}")
+                            console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
+
+                            if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
+                                console.print("[bold green]You can create a custom Edition for this playlist.")
+                                user_input_raw = cli_ui.ask_string(f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): ")
+                                user_input = (user_input_raw or "").strip()
+                                if user_input:
+                                    bdinfo['edition'] = user_input
+                                    selected_playlists[idx]['edition'] = user_input
+                                    console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
+                            else:
+                                console.print("[bold yellow]Unattended mode: Custom edition not added.")
+
+                        # Save to discs array
+                        if idx == 0:
+                            discs[i]['summary'] = bd_summary_cleaned
+                            discs[i]['bdinfo'] = bdinfo
+                            discs[i]['playlists'] = selected_playlists
+                            if valid_playlists and meta['unattended'] and not meta.get('unattended_confirm', False):
+                                simplified_playlists: list[dict[str, Any]] = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
+                                duration_map: dict[int, dict[str, Any]] = {}
+
+                                # Store simplified version with only file and duration, keeping only one per unique duration
+                                for playlist in valid_playlists:
+                                    rounded_duration = round(float(playlist["duration"]))
+                                    if rounded_duration in duration_map:
+                                        continue
+
+                                    duration_map[rounded_duration] = {
+                                        "file": playlist["file"],
+                                        "duration": playlist["duration"]
+                                    }
+
+                                simplified_playlists = list(duration_map.values())
+                                simplified_playlists.sort(key=lambda x: float(x["duration"]), reverse=True)
+                                discs[i]['all_valid_playlists'] = simplified_playlists
+
+                                if meta['debug']:
+                                    console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
+                        else:
+                            discs[i][f'summary_{idx}'] = bd_summary_cleaned
+                            discs[i][f'bdinfo_{idx}'] = bdinfo
 
-                                # Rename the output to playlist_report_path
-                                for file in os.listdir(save_dir):
-                                    if file.startswith("BDINFO") and file.endswith(".txt"):
-                                        bdinfo_text = os.path.join(save_dir, file)
-                                        shutil.move(bdinfo_text, playlist_report_path)
-                                        bdinfo_text = playlist_report_path  # Update bdinfo_text to the renamed file
-                                        break
-                        except Exception as e:
-                            console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
-                            continue
+                    except Exception:
+                        console.print(traceback.format_exc())
+                        await asyncio.sleep(5)
+                        continue
+                    break
 
-                    # Process the BDInfo report in the while True loop
-                    while True:
-                        try:
-                            if not os.path.exists(bdinfo_text):
-                                console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
-                                break
+        return discs, discs[0]['bdinfo']
 
-                            text = await asyncio.to_thread(Path(bdinfo_text).read_text, encoding="utf-8", errors="replace")
-                            result = text.split("QUICK SUMMARY:", 2)
-                            files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
-                            result2 = result[1].rstrip(" \n")
-                            result = result2.split("********************", 1)
-                            bd_summary = result[0].rstrip(" \n")
-
-                            result = text.split("[code]", 3)
-                            result2 = result[2].rstrip(" \n")
-                            result = result2.split("FILES:", 1)
-                            ext_bd_summary = result[0].rstrip(" \n")
-
-                            # Save summaries and bdinfo for each playlist
-                            if idx == 0:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
-                            else:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
-
-                            # Strip multiple spaces to single spaces before saving
-                            bd_summary_cleaned = re.sub(r' +', ' ', bd_summary.strip())
-                            ext_bd_summary_cleaned = re.sub(r' +', ' ', ext_bd_summary.strip())
-
-                            await asyncio.to_thread(Path(summary_file).write_text, bd_summary_cleaned, encoding="utf-8", errors="replace")
-                            await asyncio.to_thread(Path(extended_summary_file).write_text, ext_bd_summary_cleaned, encoding="utf-8", errors="replace")
-
-                            bdinfo = self.parse_bdinfo(bd_summary_cleaned, files[1], path)
-
-                            # Prompt user for custom edition if conditions are met
-                            if len(selected_playlists) > 1:
-                                current_label = bdinfo.get('label', f"Playlist {idx}")
-                                console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
-
-                                if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
-                                    console.print("[bold green]You can create a custom Edition for this playlist.")
-                                    user_input_raw = cli_ui.ask_string(f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): ")
-                                    user_input = (user_input_raw or "").strip()
-                                    if user_input:
-                                        bdinfo['edition'] = user_input
-                                        selected_playlists[idx]['edition'] = user_input
-                                        console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
-                                else:
-                                    console.print("[bold yellow]Unattended mode: Custom edition not added.")
-
-                            # Save to discs array
-                            if idx == 0:
-                                discs[i]['summary'] = bd_summary_cleaned
-                                discs[i]['bdinfo'] = bdinfo
-                                discs[i]['playlists'] = selected_playlists
-                                if valid_playlists and meta['unattended'] and not meta.get('unattended_confirm', False):
-                                    simplified_playlists: list[dict[str, Any]] = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
-                                    duration_map: dict[int, dict[str, Any]] = {}
-
-                                    # Store simplified version with only file and duration, keeping only one per unique duration
-                                    for playlist in valid_playlists:
-                                        rounded_duration = round(float(playlist["duration"]))
-                                        if rounded_duration in duration_map:
-                                            continue
-
-                                        duration_map[rounded_duration] = {
-                                            "file": playlist["file"],
-                                            "duration": playlist["duration"]
-                                        }
-
-                                    simplified_playlists = list(duration_map.values())
-                                    simplified_playlists.sort(key=lambda x: float(x["duration"]), reverse=True)
-                                    discs[i]['all_valid_playlists'] = simplified_playlists
-
-                                    if meta['debug']:
-                                        console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
-                            else:
-                                discs[i][f'summary_{idx}'] = bd_summary_cleaned
-                                discs[i][f'bdinfo_{idx}'] = bdinfo
+    def _bdinfo_command(self, base_dir: str, path: str, playlist_file: str, output_dir: str) -> Optional[list[str]]:
+        # Prefer the bundled bdinfo binary for the detected OS/arch
+        system = platform.system().lower()
+        machine = platform.machine().lower()
+        if system == "linux":
+            if machine in ("x86_64", "amd64"):
+                folder = "linux/amd64"
+            elif machine in ("arm64", "aarch64"):
+                folder = "linux/arm64"
+            else:
+                folder = "linux/arm"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, '-m', playlist_file, output_dir]
+        elif system == "darwin":
+            folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, '-m', playlist_file, output_dir]
+        elif system == "windows":
+            # Windows builds are provided as x64
+            bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, '-m', playlist_file, path, output_dir]
+
+        # Fallback to system-installed commands if bundled binary not present
+        if shutil.which("bdinfo"):
+            return ["bdinfo", path, '-m', playlist_file, output_dir]
+        if shutil.which("BDInfo"):
+            return ["BDInfo", path, '-m', playlist_file, output_dir]
+        return None
 
-                        except Exception:
-                            console.print(traceback.format_exc())
-                            await asyncio.sleep(5)
-                            continue
+    async def _scan_playlist(
+        self,
+        base_dir: str,
+        save_dir: str,
+        disc_index: int,
+        path: str,
+        playlist: PlaylistInfo,
+        semaphore: asyncio.Semaphore,
+        debug: bool = False,
+    ) -> Optional[str]:
+        """Path of the BDInfo report for one playlist, scanning it only if no copy exists.
+
+        Reports are reused from tmp/<uuid> first, then from the data/bdinfo cache.
+        Each scan writes into its own directory so concurrent scans cannot pick up each other's output.
+        """
+        playlist_number = playlist['file'].replace(".mpls", "")
+        playlist_report_path = os.path.join(save_dir, f"Disc{disc_index + 1}_{playlist_number}_FULL.txt")
+        if os.path.exists(playlist_report_path):
+            return playlist_report_path
+
+        cache_path = await asyncio.to_thread(bdinfo_cache_path, base_dir, path, playlist)
+        if cache_path and os.path.exists(cache_path):
+            await asyncio.to_thread(shutil.copyfile, cache_path, playlist_report_path)
+            console.print(f"[bold green]Reusing cached BDInfo report for playlist {playlist['file']}")
+            return playlist_report_path
+
+        async with semaphore:
+            console.print(f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
+            scan_dir = os.path.join(save_dir, f"bdinfo_scan_{disc_index}_{playlist_number}")
+            try:
+                os.makedirs(scan_dir, exist_ok=True)
+                bdinfo_executable = self._bdinfo_command(base_dir, path, playlist['file'], scan_dir)
+                if bdinfo_executable is None:
+                    console.print(f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]")
+                    return None
+
+                proc = await asyncio.create_subprocess_exec(
+                    *bdinfo_executable
+                )
+                await proc.wait()
+
+                if proc.returncode != 0:
+                    console.print(f"[bold red]BDInfo failed with return code {proc.returncode}[/bold red]")
+                    return None
+
+                # Rename the output to playlist_report_path
+                for file in os.listdir(scan_dir):
+                    if file.startswith("BDINFO") and file.endswith(".txt"):
+                        shutil.move(os.path.join(scan_dir, file), playlist_report_path)
                         break
+                else:
+                    return None
+            except Exception as e:
+                console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
+                return None
+            finally:
+                shutil.rmtree(scan_dir, ignore_errors=True)
 
-            else:
-                discs = meta_discs
-
-        return discs, discs[0]['bdinfo']
+        if cache_path:
+            try:
+                await asyncio.to_thread(_store_bdinfo_report, playlist_report_path, cache_path)
+            except OSError as e:
+                if debug:
+                    console.print(f"[yellow]Could not cache BDInfo report: {e}[/yellow]")
+        return playlist_report_path
 
     def parse_bdinfo_files(self, files: str) -> list[dict[str, str]]:
         """
@@ -8,7 +8,7 @@ from typing_extensions import TypeAlias
 
 from cogs.redaction import Redaction
 from src.console import console
-from src.trackers.HUNO import HUNO
+from src.trackersetup import tracker_class_map
 
 Meta: TypeAlias = MutableMapping[str, Any]
 
@@ -40,6 +40,68 @@ class AttributeCheck(TypedDict):
     exclude_msg: Callable[[str], str]
 
 
+def normalize_mtv_name(name: str) -> str:
+    # Handle audio format variations: DDP.5.1 <-> DDP5.1
+    name = re.sub(r'\.DDP\.(\d)', r'.DDP\1', name)
+    name = re.sub(r'\.DD\.(\d)', r'.DD\1', name)
+    name = re.sub(r'\.AC3\.(\d)', r'.AC3\1', name)
+    name = re.sub(r'\.DTS\.(\d)', r'.DTS\1', name)
+    return name
+
+
+# Slice length of the substring pre-filter used for MTV, AR and RTF filename matching
+MATCH_GRAM = 8
+EPISODE_RE = re.compile(r"[eE]\d{2}", re.IGNORECASE)
+
+
+class SeasonEpisodeMatcher:
+    """Our season and episode, parsed once and matched against any number of dupe names."""
+
+    def __init__(self, target_season: Optional[Union[str, int]], target_episode: Optional[Union[str, int]]) -> None:
+        season_match = re.search(r'[sS](\d+)', str(target_season))
+        target_season_value = int(season_match.group(1)) if season_match else None
+
+        # Handle daily-style episodes where the episode value is a date (YYYY-MM-DD / YYYY.MM.DD).
+        self.daily_date: Optional[re.Pattern[str]] = None
+        date_match = re.search(r'(?<!\d)((?:19|20)\d{2})[.\-_/\s](\d{1,2})[.\-_/\s](\d{1,2})(?!\d)', str(target_episode or ""))
+        if date_match:
+            year = int(date_match.group(1))
+            month = int(date_match.group(2))
+            day = int(date_match.group(3))
+            self.daily_date = re.compile(rf"(?<!\d){year}[.\-_/\s]?{month:02d}[.\-_/\s]?{day:02d}(?!\d)", re.IGNORECASE)
+
+        target_episodes = [int(ep) for ep in re.findall(r'\d+', str(target_episode))] if target_episode else []
+        self.has_episodes = bool(target_episodes)
+        self.season: Optional[re.Pattern[str]] = (
+            re.compile(rf"[sS]{target_season_value:02}", re.IGNORECASE) if target_season_value is not None else None
+        )
+        self.episodes = [re.compile(rf"[eE]{ep:02}", re.IGNORECASE) for ep in target_episodes]
+
+    def match(self, filename: str) -> tuple[bool, bool]:
+        """(matches, is season pack or season match), as DupeChecker.is_season_episode_match returns."""
+        if self.daily_date is not None:
+            return (bool(self.daily_date.search(filename)), False)
+
+        # Determine if filename represents a season pack (no explicit episode pattern)
+        is_season_pack = not EPISODE_RE.search(filename)
+
+        # If `target_episode` is empty, match only season packs
+        if not self.has_episodes:
+            season_matches = bool(self.season and self.season.search(filename))
+            return (season_matches and is_season_pack, season_matches)
+
+        # If `target_episode` is provided, match both season packs and episode files
+        if self.season is not None:
+            if is_season_pack:
+                return (bool(self.season.search(filename)), True)  # Match season pack
+            return (
+                bool(self.season.search(filename)) and any(ep.search(filename) for ep in self.episodes),
+                False,
+            )  # Match episode file
+
+        return (False, False)  # No match
+
+
 class DupeChecker:
     def __init__(self, config: dict[str, Any]) -> None:
         self.config = config
@@ -175,6 +237,33 @@ class DupeChecker:
             if meta.get('debug'):
                 console.log(f"dupe checking filenames: {filenames[:10]}{'...' if len(filenames) > 10 else ''}")
 
+        # Our filenames are lowercased once per call: a set for exact matches, and joined by newlines
+        # (which never occur in a filename) so a remote file is tested against all of them in one search.
+        local_names = {filename.lower() for filename in filenames}
+        local_names_joined = "\n".join(filename.lower() for filename in filenames)
+        first_local_name = filenames[0].lower() if filenames else ""
+        # Every MATCH_GRAM-character slice of our filenames; a remote file whose first or last slice is
+        # missing cannot be a substring of any of them, which rules out most files without a search.
+        local_grams = {
+            name[i:i + MATCH_GRAM] for name in local_names for i in range(len(name) - MATCH_GRAM + 1)
+        }
+        season_episode_matcher = SeasonEpisodeMatcher(target_season, target_episode)
+        # Tracker-specific forms of our release name, built on first use
+        target_names: dict[str, str] = {}
+
+        async def target_name_for(tracker: str) -> str:
+            if tracker not in target_names:
+                if tracker == "MTV":
+                    target_names[tracker] = normalize_mtv_name(str(meta.get('name', '')).replace(' ', '.').replace('DD+', 'DDP'))
+                elif tracker == "BHD":
+                    target_names[tracker] = str(meta.get('name', '')).replace('DD+', 'DDP')
+                elif tracker == "HUNO":
+                    huno = tracker_class_map['HUNO'](config=self.config)
+                    huno_name_result: Any = await huno.get_name(cast(dict[str, Any], meta))
+                    huno_name_map = cast(dict[str, Any], huno_name_result)
+                    target_names[tracker] = str(huno_name_map.get('name', huno_name_result)) if isinstance(huno_name_result, dict) else str(huno_name_result)
+            return target_names[tracker]
+
         attribute_checks: list[AttributeCheck] = [
             {
                 "key": "remux",
@@ -209,6 +298,7 @@ class DupeChecker:
             if files and len(files) == 1 and ',' in files[0]:
                 # Split comma-separated string into individual filenames
                 files = [f.strip() for f in files[0].split(',')]
+            files_lower = [f.lower() for f in files]
 
             file_count_raw = entry.get('file_count', 0)
             file_count = coerce_int(file_count_raw) or 0
@@ -282,42 +372,47 @@ class DupeChecker:
                 remember_match('trumpable_id')
 
             if not meta.get('is_disc'):
-                for file in filenames:
-                    if tracker_name in ["MTV", "AR", "RTF"]:
-                        # MTV: check if any dupe file is a substring of our file (ignoring extension)
-                        if any(f.lower() in file.lower() for f in files):
-                            meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                            remember_match('filename')
-                            if file_count and file_count == len(filelist):
-                                meta['file_count_match'] = file_count
-                                remember_match('file_count')
-                                return False
-                        entry_size = coerce_int(entry.get('size'))
-                        source_size = coerce_int(meta.get('source_size'))
-                        if entry_size is not None and source_size is not None and entry_size == source_size:
-                            meta['size_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                            remember_match('size')
+                if filenames and tracker_name in ["MTV", "AR", "RTF"]:
+                    # MTV: check if any dupe file is a substring of our file (ignoring extension).
+                    # A size match returns after comparing our first file, so only that one counts then.
+                    entry_size = coerce_int(entry.get('size'))
+                    source_size = coerce_int(meta.get('source_size'))
+                    size_matches = entry_size is not None and source_size is not None and entry_size == source_size
+                    searched = first_local_name if size_matches else local_names_joined
+                    if any(
+                        (len(f) < MATCH_GRAM or (f[:MATCH_GRAM] in local_grams and f[-MATCH_GRAM:] in local_grams)) and f in searched
+                        for f in files_lower
+                    ):
+                        meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
+                        remember_match('filename')
+                        if file_count and file_count == len(filelist):
+                            meta['file_count_match'] = file_count
+                            remember_match('file_count')
                             return False
-                        if meta.get('debug') and entry_size is None and meta.get('source_size') is not None:
-                            console.log(
-                                f"[debug] Size comparison failed due to ValueError: entry_size={entry.get('size')}, source_size={meta.get('source_size')}"
-                            )
-                    else:
+                    if size_matches:
+                        meta['size_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
+                        remember_match('size')
+                        return False
+                    if meta.get('debug') and entry_size is None and meta.get('source_size') is not None:
+                        console.log(
+                            f"[debug] Size comparison failed due to ValueError: entry_size={entry.get('size')}, source_size={meta.get('source_size')}"
+                        )
+                elif filenames:
+                    if meta.get('debug'):
+                        console.log(f"[debug] Comparing files: {filenames[:10]}{'...' if len(filenames) > 10 else ''} against dupe files list.")
+                        console.log(f"[debug] Dupe files list: {files[:10]}{'...' if len(files) > 10 else files}")
+                    if not local_names.isdisjoint(files_lower):
+                        meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
                         if meta.get('debug'):
-                            console.log(f"[debug] Comparing file: {file} against dupe files list.")
-                            console.log(f"[debug] Dupe files list: {files[:10]}{'...' if len(files) > 10 else files}")
-                        if any(file.lower() == f.lower() for f in files):
-                            meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
+                            console.log(f"[debug] Filename match found: {meta['filename_match']}")
+                        remember_match('filename')
+                        remember_match('id')
+                        if file_count and file_count == len(filelist):
+                            meta['file_count_match'] = file_count
                             if meta.get('debug'):
-                                console.log(f"[debug] Filename match found: {meta['filename_match']}")
-                            remember_match('filename')
-                            remember_match('id')
-                            if file_count and file_count == len(filelist):
-                                meta['file_count_match'] = file_count
-                                if meta.get('debug'):
-                                    console.log(f"[debug] File count match found: {meta['file_count_match']}")
-                                remember_match('file_count')
-                                return False
+                                console.log(f"[debug] File count match found: {meta['file_count_match']}")
+                            remember_match('file_count')
+                            return False
                 if tracker_name in ["BHD"]:
                     # BHD: compare sizes
                     entry_size = coerce_int(entry.get('size'))
@@ -357,37 +452,13 @@ class DupeChecker:
                 await log_exclusion('repack release', each)
                 return True
 
-            if tracker_name == "MTV":
-                target_name = str(meta.get('name', '')).replace(' ', '.').replace('DD+', 'DDP')
-                dupe_name = str(entry.get('name', ''))
-
-                def normalize_mtv_name(name: str) -> str:
-                    # Handle audio format variations: DDP.5.1 <-> DDP5.1
-                    name = re.sub(r'\.DDP\.(\d)', r'.DDP\1', name)
-                    name = re.sub(r'\.DD\.(\d)', r'.DD\1', name)
-                    name = re.sub(r'\.AC3\.(\d)', r'.AC3\1', name)
-                    name = re.sub(r'\.DTS\.(\d)', r'.DTS\1', name)
-                    return name
-
-                normalized_target = normalize_mtv_name(target_name)
-                if normalized_target == dupe_name:
-                    meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                    return False
-
-            if tracker_name == "BHD":
-                target_name = str(meta.get('name', '')).replace('DD+', 'DDP')
-                if str(entry.get('name')) == target_name:
-                    meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                    return False
+            if tracker_name == "MTV" and str(entry.get('name', '')) == await target_name_for(tracker_name):
+                meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
+                return False
 
-            if tracker_name == "HUNO":
-                huno = HUNO(config=self.config)
-                huno_name_result: Any = await huno.get_name(cast(dict[str, Any], meta))
-                huno_name_map = cast(dict[str, Any], huno_name_result)
-                huno_name = str(huno_name_map.get('name', huno_name_result)) if isinstance(huno_name_result, dict) else str(huno_name_result)
-                if str(entry.get('name')) == huno_name:
-                    meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                    return False
+            if tracker_name in ["BHD", "HUNO"] and str(entry.get('name')) == await target_name_for(tracker_name):
+                meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
+                return False
 
             if tracker_name in ["BHD", "MTV", "RTF", "AR"] and (
                 ('2160p' in target_resolution and '2160p' in each)
@@ -483,7 +554,7 @@ class DupeChecker:
                         return True
 
             if meta.get('category') == "TV":
-                season_episode_match, is_season = await DupeChecker.is_season_episode_match(normalized, target_season, target_episode)
+                season_episode_match, is_season = season_episode_matcher.match(normalized)
                 if meta.get('debug'):
                     console.log(f"[debug] Season/Episode match result: {season_episode_match}")
                     console.log(f"[debug] is_season: {is_season}")
@@ -649,50 +720,7 @@ class DupeChecker:
         """
         Check if the filename matches the given season and episode.
         """
-        season_match = re.search(r'[sS](\d+)', str(target_season))
-        target_season_value = int(season_match.group(1)) if season_match else None
-
-        # Handle daily-style episodes where the episode value is a date (YYYY-MM-DD / YYYY.MM.DD).
-        target_episode_str = str(target_episode or "")
-        date_match = re.search(r'(?<!\d)((?:19|20)\d{2})[.\-_/\s](\d{1,2})[.\-_/\s](\d{1,2})(?!\d)', target_episode_str)
-        if date_match:
-            year = int(date_match.group(1))
-            month = int(date_match.group(2))
-            day = int(date_match.group(3))
-            daily_date_pattern = rf"(?<!\d){year}[.\-_/\s]?{month:02d}[.\-_/\s]?{day:02d}(?!\d)"
-            if re.search(daily_date_pattern, filename, re.IGNORECASE):
-                return (True, False)
-            return (False, False)
-
-        if target_episode:
-            episode_matches = re.findall(r'\d+', str(target_episode))
-            target_episodes = [int(ep) for ep in episode_matches]
-        else:
-            target_episodes = []
-
-        season_pattern = rf"[sS]{target_season_value:02}" if target_season_value is not None else None
-        episode_patterns = [rf"[eE]{ep:02}" for ep in target_episodes] if target_episodes else []
-
-        # Determine if filename represents a season pack (no explicit episode pattern)
-        is_season_pack = not re.search(r"[eE]\d{2}", filename, re.IGNORECASE)
-
-        # If `target_episode` is empty, match only season packs
-        if not target_episodes:
-            season_matches = bool(season_pattern and re.search(season_pattern, filename, re.IGNORECASE))
-            return (season_matches and is_season_pack, season_matches)
-
-        # If `target_episode` is provided, match both season packs and episode files
-        if season_pattern:
-            if is_season_pack:
-                return (bool(re.search(season_pattern, filename, re.IGNORECASE)), True)  # Match season pack
-            if episode_patterns:
-                return (
-                    bool(re.search(season_pattern, filename, re.IGNORECASE))
-                    and any(re.search(ep, filename, re.IGNORECASE) for ep in episode_patterns),
-                    False,
-                )  # Match episode file
-
-        return (False, False)  # No match
+        return SeasonEpisodeMatcher(target_season, target_episode).match(filename)
 
     @staticmethod
     async def refine_hdr_terms(hdr: Optional[str]) -> set[str]:
@@ -1,5 +1,7 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import contextlib
+import hashlib
 import json
 import os
 import platform
@@ -159,6 +161,82 @@ async def mi_resolution(
     return resolution
 
 
+# Bump when the cached payload layout or the way it is produced changes.
+MEDIAINFO_CACHE_VERSION = 1
+# Entries kept under data/mediainfo; the least recently used are pruned after each store.
+MEDIAINFO_CACHE_ENTRIES = 2000
+
+
+def mediainfo_cache_path(base_dir: str, video: str, is_dvd: bool = False) -> Optional[str]:
+    """Return the data/mediainfo cache file for video, keyed by (device, inode, size, mtime).
+
+    The key follows the file rather than its name, so renamed or hardlinked copies
+    still hit, while any rewrite of the content changes size or mtime and misses.
+    """
+    try:
+        st = os.stat(video)
+    except OSError:
+        return None
+    identity = f"{MEDIAINFO_CACHE_VERSION}:{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}:{int(bool(is_dvd))}"
+    digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+    return os.path.join(base_dir, "data", "mediainfo", f"{digest}.json")
+
+
+def load_cached_mediainfo(cache_path: str, video: str) -> Optional[tuple[str, dict[str, Any]]]:
+    """Return (text, json) from a cache entry, rewritten for the path video is opened under."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(cache_path)
+    cached_dict = cast(dict[str, Any], cached)
+    text = cached_dict.get("text")
+    data = cached_dict.get("json")
+    cached_video = cached_dict.get("path")
+    if not isinstance(text, str) or not isinstance(data, dict) or not isinstance(cached_video, str):
+        return None
+    data_dict = cast(dict[str, Any], data)
+    if cached_video != video:
+        text = text.replace(cached_video, video)
+        media = data_dict.get("media")
+        if isinstance(media, dict) and cast(dict[str, Any], media).get("@ref") == cached_video:
+            cast(dict[str, Any], media)["@ref"] = video
+    return text, data_dict
+
+
+def store_cached_mediainfo(cache_path: str, video: str, text: str, data: dict[str, Any], debug: bool = False) -> None:
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"path": video, "text": text, "json": data}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+        if debug:
+            console.print(f"[green]Cached MediaInfo to {cache_path}[/green]")
+    except Exception as e:
+        if debug:
+            console.print(f"[yellow]Failed to write MediaInfo cache for {video}: {e}[/yellow]")
+        return
+    prune_mediainfo_cache(os.path.dirname(cache_path))
+
+
+def prune_mediainfo_cache(cache_dir: str, keep: int = MEDIAINFO_CACHE_ENTRIES) -> None:
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.is_file() and entry.name.endswith(".json")]
+        if len(entries) <= keep:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for entry in entries[keep:]:
+        with contextlib.suppress(OSError):
+            os.remove(entry.path)
+
+
 async def exportInfo(
     video: str,
     isdir: bool,
@@ -366,9 +444,15 @@ async def exportInfo(
         return filtered
 
     mediainfo_cmd = None
+    mediainfo_lib = None
     mediainfo_config = None
 
-    if is_dvd:
+    cache_path = mediainfo_cache_path(base_dir, video, is_dvd)
+    cached = await asyncio.to_thread(load_cached_mediainfo, cache_path, video) if cache_path else None
+    if cached is not None:
+        if debug:
+            console.print(f"[cyan]Using cached MediaInfo from {cache_path}[/cyan]")
+    elif is_dvd:
         if debug:
             console.print("[bold yellow]DVD detected, using specialized MediaInfo...")
 
@@ -383,14 +467,13 @@ async def exportInfo(
                 # Configure library if available (Linux only)
                 if mediainfo_config["lib"]:
                     try:
-                        if hasattr(MediaInfo, "_library_file"):
-                            cast(Any, MediaInfo)._library_file = mediainfo_config["lib"]
-
-                        test_parse = MediaInfo.can_parse()
+                        test_parse = MediaInfo.can_parse(library_file=mediainfo_config["lib"])
                         if debug:
                             console.print(f"[green]Configured specialized MediaInfo library (can_parse: {test_parse})[/green]")
 
-                        if not test_parse and debug:
+                        if test_parse:
+                            mediainfo_lib = mediainfo_config["lib"]
+                        elif debug:
                             console.print("[yellow]Library test failed, may fall back to system MediaInfo[/yellow]")
 
                     except Exception as e:
@@ -411,36 +494,20 @@ async def exportInfo(
     if not isdir:
         os.chdir(os.path.dirname(video))
 
-    if mediainfo_cmd and is_dvd:
-        result = None
-        try:
-            # Validate and sanitize the video path
-            safe_video_path = validate_file_path(video)
-            safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
-            cmd = [safe_mediainfo_cmd, safe_video_path]
-            result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0 and result.stdout:
-                media_info = result.stdout
-            else:
-                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
-
-        except subprocess.TimeoutExpired:
-            console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
-        except ValueError as e:
-            console.print(f"[bold red]Path validation error: {e}[/bold red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for text...")
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
-        except (subprocess.CalledProcessError, Exception) as e:
-            console.print(f"[bold red]Error getting text from specialized MediaInfo: {e}")
-            if debug and result is not None:
-                console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
-                console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for text...")
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
+    if cached is not None:
+        media_info, media_info_dict = cached
+    elif mediainfo_cmd and is_dvd and not mediainfo_lib:
+        # CLI-only specialized MediaInfo (Windows) cannot render two formats in one run
+        media_info, media_info_dict = await asyncio.gather(
+            _export_cli_text(mediainfo_cmd, video, debug),
+            _export_cli_json(mediainfo_cmd, video, debug),
+        )
     else:
-        media_info = MediaInfo.parse(video, output="STRING", full=False)
+        media_info, media_info_json = await asyncio.to_thread(parse_mediainfo_outputs, video, mediainfo_lib)
+        media_info_dict = cast(dict[str, Any], json.loads(media_info_json))
+
+    if cached is None and cache_path:
+        await asyncio.to_thread(store_cached_mediainfo, cache_path, video, media_info, media_info_dict, debug)
 
     # Filter out unwanted lines from media info regardless of type
     filtered_media_info = "\n".join(line for line in media_info.splitlines() if not line.strip().startswith("ReportBy") and not line.strip().startswith("Report created by "))
@@ -452,45 +519,6 @@ async def exportInfo(
     if debug:
         console.print("[bold green]MediaInfo Exported.")
 
-    if mediainfo_cmd and is_dvd:
-        result: Optional[subprocess.CompletedProcess[str]] = None
-        try:
-            # Validate and sanitize the video path
-            safe_video_path = validate_file_path(video)
-            safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
-            cmd = [safe_mediainfo_cmd, "--Output=JSON", safe_video_path]
-            result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0 and result.stdout:
-                media_info_json = result.stdout
-                media_info_dict = json.loads(media_info_json)
-            else:
-                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
-
-        except ValueError as e:
-            console.print(f"[bold red]Path validation error: {e}[/bold red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for JSON...")
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
-        except subprocess.TimeoutExpired:
-            console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
-        except (subprocess.CalledProcessError, json.JSONDecodeError, Exception) as e:
-            console.print(f"[bold red]Error getting JSON from specialized MediaInfo: {e}")
-            if debug and result is not None:
-                console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
-                console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
-                if result.stdout:
-                    console.print(f"[red]Subprocess stdout preview: {result.stdout[:200]}...[/red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for JSON...[/bold yellow]")
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
-    else:
-        # Use standard MediaInfo library for non-DVD or when specialized CLI not available
-        media_info_json = MediaInfo.parse(video, output="JSON")
-        media_info_dict = json.loads(media_info_json)
-
     filtered_info = filter_mediainfo(media_info_dict)
 
     async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", "w", encoding="utf-8") as export:
@@ -498,18 +526,117 @@ async def exportInfo(
         if debug:
             console.print(f"[green]JSON file written to: {base_dir}/tmp/{folder_id}/MediaInfo.json[/green]")
 
-    async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", encoding="utf-8") as f:
-        mi = cast(dict[str, Any], json.loads(await f.read()))
+    # Callers keep this on meta['mediainfo']; downstream readers use it via
+    # get_mediainfo_json() instead of re-reading MediaInfo.json.
+    return filtered_info
 
-    # Cleanup: Reset library configuration if we modified it
-    if is_dvd and platform.system().lower() in ["linux", "windows"]:
-        # Reset MediaInfo library file to default (Linux only)
-        if hasattr(MediaInfo, "_library_file"):
-            cast(Any, MediaInfo)._library_file = None
-        if debug:
-            console.print("[blue]Reset MediaInfo library configuration[/blue]")
 
-    return mi
+def parse_mediainfo_outputs(video: str, library_file: Optional[str] = None) -> tuple[str, str]:
+    """Return (text, json) renderings of video from a single libmediainfo parse.
+
+    Both informs are taken from one open handle, so the file is only read once.
+    Falls back to two MediaInfo.parse() passes if the handle cannot be driven directly.
+    """
+    try:
+        lib, handle, _, lib_version = cast(Any, MediaInfo)._get_library(library_file)
+    except Exception:
+        text = cast(str, MediaInfo.parse(video, output="STRING", full=False, library_file=library_file))
+        return text, cast(str, MediaInfo.parse(video, output="JSON", library_file=library_file))
+
+    try:
+        if lib_version >= (18, 3):
+            lib.MediaInfo_Option(handle, "Cover_Data", "")
+        lib.MediaInfo_Option(handle, "CharSet", "UTF-8")
+        lib.MediaInfo_Option(handle, "ParseSpeed", "0.5")
+        lib.MediaInfo_Option(handle, "LegacyStreamDisplay", "")
+        if lib.MediaInfo_Open(handle, video) == 0:
+            if not os.path.exists(video):
+                raise FileNotFoundError(video)
+            raise RuntimeError(f"An error occured while opening {video} with libmediainfo")
+
+        lib.MediaInfo_Option(handle, "Inform", "STRING")
+        lib.MediaInfo_Option(handle, "Complete", "")
+        text = cast(str, lib.MediaInfo_Inform(handle, 0))
+
+        lib.MediaInfo_Option(handle, "Inform", "JSON")
+        lib.MediaInfo_Option(handle, "Complete", "1")
+        json_text = cast(str, lib.MediaInfo_Inform(handle, 0))
+    finally:
+        lib.MediaInfo_Close(handle)
+        lib.MediaInfo_Delete(handle)
+    return text, json_text
+
+
+async def _export_cli_text(mediainfo_cmd: str, video: str, debug: bool) -> str:
+    result = None
+    try:
+        # Validate and sanitize the video path
+        safe_video_path = validate_file_path(video)
+        safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
+        cmd = [safe_mediainfo_cmd, safe_video_path]
+        result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
+
+        if result.returncode == 0 and result.stdout:
+            return result.stdout
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+
+    except subprocess.TimeoutExpired:
+        console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
+    except ValueError as e:
+        console.print(f"[bold red]Path validation error: {e}[/bold red]")
+        console.print("[bold yellow]Falling back to standard MediaInfo for text...")
+    except (subprocess.CalledProcessError, Exception) as e:
+        console.print(f"[bold red]Error getting text from specialized MediaInfo: {e}")
+        if debug and result is not None:
+            console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
+            console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
+        console.print("[bold yellow]Falling back to standard MediaInfo for text...")
+    return cast(str, await asyncio.to_thread(MediaInfo.parse, video, output="STRING", full=False))
+
+
+async def _export_cli_json(mediainfo_cmd: str, video: str, debug: bool) -> dict[str, Any]:
+    result: Optional[subprocess.CompletedProcess[str]] = None
+    try:
+        # Validate and sanitize the video path
+        safe_video_path = validate_file_path(video)
+        safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
+        cmd = [safe_mediainfo_cmd, "--Output=JSON", safe_video_path]
+        result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
+
+        if result.returncode == 0 and result.stdout:
+            return cast(dict[str, Any], json.loads(result.stdout))
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+
+    except ValueError as e:
+        console.print(f"[bold red]Path validation error: {e}[/bold red]")
+        console.print("[bold yellow]Falling back to standard MediaInfo for JSON...")
+    except subprocess.TimeoutExpired:
+        console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
+    except (subprocess.CalledProcessError, json.JSONDecodeError, Exception) as e:
+        console.print(f"[bold red]Error getting JSON from specialized MediaInfo: {e}")
+        if debug and result is not None:
+            console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
+            console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
+            if result.stdout:
+                console.print(f"[red]Subprocess stdout preview: {result.stdout[:200]}...[/red]")
+        console.print("[bold yellow]Falling back to standard MediaInfo for JSON...[/bold yellow]")
+    media_info_json = await asyncio.to_thread(MediaInfo.parse, video, output="JSON")
+    return cast(dict[str, Any], json.loads(cast(str, media_info_json)))
+
+
+async def get_mediainfo_json(meta: dict[str, Any], base_dir: Optional[str] = None, folder_id: Optional[str] = None) -> dict[str, Any]:
+    """Return the filtered MediaInfo JSON for the current upload.
+
+    Prefers the copy exportInfo left on meta['mediainfo'] and only reads
+    tmp/<uuid>/MediaInfo.json when meta does not carry it.
+    """
+    mi = meta.get("mediainfo")
+    if isinstance(mi, dict) and cast(dict[str, Any], mi).get("media"):
+        return cast(dict[str, Any], mi)
+    base_dir = base_dir or str(meta.get("base_dir", ""))
+    folder_id = folder_id or str(meta.get("uuid", ""))
+    async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", encoding="utf-8") as f:
+        return cast(dict[str, Any], json.loads(await f.read()))
 
 
 def validate_mediainfo(meta: dict[str, Any], debug: bool, settings: bool = False) -> bool:
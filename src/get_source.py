@@ -1,14 +1,12 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
-import asyncio
-import json
 import traceback
-from pathlib import Path
 from typing import Any, Callable, Optional, cast
 
 import guessit
 
 from src.console import console
 from src.exceptions import WeirdSystem
+from src.exportmi import get_mediainfo_json
 
 guessit_module: Any = cast(Any, guessit)
 GuessitFn = Callable[[str, Optional[dict[str, Any]]], dict[str, Any]]
@@ -24,8 +22,7 @@ async def get_source(type: str, video: str, path: str, is_disc: str, meta: dict[
     mi: dict[str, Any] = {}
     if meta.get('is_disc') != "BDMV":
         try:
-            mi_text = await asyncio.to_thread(Path(f"{base_dir}/tmp/{folder_id}/MediaInfo.json").read_text, encoding="utf-8")
-            mi = json.loads(mi_text)
+            mi = await get_mediainfo_json(meta, base_dir, folder_id)
         except Exception:
             if meta['debug']:
                 console.print("No mediainfo.json")
@@ -10,10 +10,10 @@ from typing import Any, Callable, Optional, cast
 
 import anitopy
 import guessit
-import httpx
 
 from src.console import console
 from src.exceptions import *  # noqa: F403
+from src.http_pool import pooled_client
 from src.tags import get_tag
 from src.tmdb import TmdbManager
 
@@ -224,7 +224,7 @@ class SeasonEpisodeManager:
                                     'absolute': str(episode_int),
                                 }
                                 url = "https://thexem.info/map/single"
-                                async with httpx.AsyncClient(timeout=30.0) as client:
+                                async with pooled_client(timeout=30.0) as client:
                                     response = (await client.post(url, params=params)).json()
                                 if response['result'] == "failure":
                                     raise XEMNotFound  # noqa: F405
@@ -239,7 +239,7 @@ class SeasonEpisodeManager:
                                 season_int = 1  # Default to 1 if error occurs
                                 season = "S01"
                                 names_url = f"https://thexem.info/map/names?origin=tvdb&id={str(meta['tvdb_id'])}"
-                                async with httpx.AsyncClient(timeout=30.0) as client:
+                                async with pooled_client(timeout=30.0) as client:
                                     names_response = (await client.get(names_url)).json()
                                 if meta['debug']:
                                     console.log(f'[cyan]Matching Season Number from TheXEM\n{names_response}')
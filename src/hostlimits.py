@@ -0,0 +1,201 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import contextlib
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional, cast
+
+import httpx
+
+from src.console import console
+from src.http_pool import pooled_client
+
+# Hosts with a known concurrency cap start there and never learn past it.
+HOST_LIMIT_CAPS = {"onlyimage": 6, "ptscreens": 6, "lensdump": 1, "passtheimage": 6}
+# Concurrency any other host starts at before anything has been learned about it.
+DEFAULT_INITIAL_LIMIT = 4
+MIN_LIMIT = 1
+MAX_LIMIT = 16
+# A throttle signal halves the limit, at most once per interval so one burst of failures counts once.
+DECREASE_FACTOR = 0.5
+DECREASE_INTERVAL = 2.0
+# Longest Retry-After honoured, in seconds.
+MAX_RETRY_AFTER = 300.0
+
+
+class UploadObservation:
+    """Status and Retry-After of the last HTTP response seen by the current upload."""
+
+    __slots__ = ('status', 'retry_after')
+
+    def __init__(self) -> None:
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+    @property
+    def throttled(self) -> bool:
+        return self.status is not None and (self.status == 429 or self.status >= 500)
+
+
+_observation: contextvars.ContextVar[Optional[UploadObservation]] = contextvars.ContextVar('upload_observation', default=None)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, IndexError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+async def _record_response(response: httpx.Response) -> None:
+    observation = _observation.get()
+    if observation is not None:
+        observation.status = response.status_code
+        observation.retry_after = retry_after_seconds(response.headers.get('Retry-After'))
+
+
+def upload_client(**kwargs: Any) -> httpx.AsyncClient:
+    """pooled_client() that reports every response's status and Retry-After to the upload in progress."""
+    kwargs.setdefault('event_hooks', {'response': [_record_response]})
+    return pooled_client(**kwargs)
+
+
+def observe_upload() -> tuple[UploadObservation, contextvars.Token[Optional[UploadObservation]]]:
+    observation = UploadObservation()
+    return observation, _observation.set(observation)
+
+
+def end_observation(token: contextvars.Token[Optional[UploadObservation]]) -> None:
+    _observation.reset(token)
+
+
+def retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the `attempt`th retry (1-based)."""
+    return min(30.0, 2.0 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+
+class HostController:
+    """AIMD concurrency limit for uploads to one image host.
+
+    Each success that finished with every slot in use raises the limit by 1/limit, about one
+    slot per full round of uploads, up to the host's ceiling; a 429, a 5xx or a timeout halves
+    it. A Retry-After pauses new uploads to the host until it has passed.
+    """
+
+    def __init__(self, host: str, limit: float, ceiling: float = float(MAX_LIMIT)) -> None:
+        self.host = host
+        self.ceiling = ceiling
+        self.limit = min(limit, ceiling)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._last_decrease = 0.0
+        self._wakeup = asyncio.Event()
+
+    @property
+    def slots(self) -> int:
+        return max(MIN_LIMIT, int(self.limit))
+
+    async def acquire(self) -> None:
+        while True:
+            pause = self.paused_until - time.monotonic()
+            if pause <= 0 and self.in_flight < self.slots:
+                self.in_flight += 1
+                return
+            self._wakeup.clear()
+            if pause > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=pause)
+            else:
+                await self._wakeup.wait()
+
+    def release(self, success: bool, throttled: bool, retry_after: Optional[float] = None) -> None:
+        # Only an upload that ran alongside a full set of others has tested the current limit
+        at_capacity = self.in_flight >= self.slots
+        self.in_flight -= 1
+        now = time.monotonic()
+        if retry_after:
+            self.paused_until = max(self.paused_until, now + retry_after)
+        if success:
+            if at_capacity:
+                self.limit = min(self.ceiling, self.limit + 1.0 / self.limit)
+        elif throttled and now - self._last_decrease >= DECREASE_INTERVAL:
+            self.limit = max(float(MIN_LIMIT), self.limit * DECREASE_FACTOR)
+            self._last_decrease = now
+            console.print(f"[yellow]{self.host} is throttling uploads; lowering concurrency to {self.slots}[/yellow]")
+        with _learned_lock:
+            _learned[self.host] = self.limit
+        self._wakeup.set()
+
+
+# Controllers hold asyncio primitives, so each event loop gets its own; learned limits are shared.
+_controllers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, HostController]] = weakref.WeakKeyDictionary()
+_learned: dict[str, float] = {}
+_learned_lock = threading.Lock()
+_limits_path: Optional[str] = None
+
+
+def _load_limits(path: str) -> dict[str, float]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            data: Any = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    limits: dict[str, float] = {}
+    for host, limit in cast(dict[str, Any], data).items():
+        if isinstance(limit, (int, float)):
+            limits[host] = min(float(MAX_LIMIT), max(float(MIN_LIMIT), float(limit)))
+    return limits
+
+
+def host_controller(host: str, base_dir: Optional[str] = None) -> HostController:
+    """The running loop's controller for `host`, starting from the limit learned on earlier runs."""
+    global _limits_path
+    with _learned_lock:
+        if _limits_path is None and base_dir:
+            _limits_path = os.path.join(base_dir, 'data', 'image_hosts', 'limits.json')
+            for learned_host, limit in _load_limits(_limits_path).items():
+                _learned.setdefault(learned_host, limit)
+        name = host.split(':', 1)[0]
+        ceiling = float(HOST_LIMIT_CAPS.get(name, MAX_LIMIT))
+        limit = _learned.get(host, float(HOST_LIMIT_CAPS.get(name, DEFAULT_INITIAL_LIMIT)))
+
+    loop = asyncio.get_running_loop()
+    controllers = _controllers.setdefault(loop, {})
+    controller = controllers.get(host)
+    if controller is None:
+        controller = HostController(host, limit, ceiling)
+        controllers[host] = controller
+    return controller
+
+
+def save_host_limits() -> None:
+    """Write the learned limits to data/image_hosts/limits.json for the next run."""
+    with _learned_lock:
+        if _limits_path is None or not _learned:
+            return
+        path = _limits_path
+        snapshot = {host: round(limit, 2) for host, limit in _learned.items()}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        console.print(f"[yellow]Could not save image host limits: {e}[/yellow]")
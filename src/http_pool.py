@@ -0,0 +1,133 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import contextlib
+import importlib.util
+from collections.abc import AsyncIterator
+from typing import Any, Callable, Optional
+
+import httpx
+
+# Caps simultaneous requests to a single scheme/host/port. Trackers and image
+# hosts throttle well below this, it mainly bounds runaway gather() fan-out.
+MAX_CONNECTIONS_PER_HOST = 8
+MAX_KEEPALIVE_CONNECTIONS = 64
+KEEPALIVE_EXPIRY = 30.0
+
+# HTTP/2 is negotiated via ALPN and needs the optional `h2` package.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class _SlotReleasingStream(httpx.AsyncByteStream):
+    """Response stream that frees its per-host slot once the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """Keep-alive transport shared by every client handed out by pooled_client().
+
+    Clients borrowing it keep their own headers, cookies, timeouts and redirect
+    settings. Closing a borrowing client leaves the pooled connections open for
+    the next caller; only close_pools() tears them down.
+    """
+
+    def __init__(self, max_per_host: int = MAX_CONNECTIONS_PER_HOST) -> None:
+        self._transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=None,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        self._max_per_host = max_per_host
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    def _slot_for(self, url: httpx.URL) -> asyncio.Semaphore:
+        key = f"{url.scheme}://{url.host}:{url.port or ''}"
+        slot = self._host_slots.get(key)
+        if slot is None:
+            slot = asyncio.Semaphore(self._max_per_host)
+            self._host_slots[key] = slot
+        return slot
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slot_for(request.url)
+        await slot.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        if isinstance(response.stream, httpx.AsyncByteStream):
+            response.stream = _SlotReleasingStream(response.stream, slot.release)
+        else:
+            slot.release()
+        return response
+
+    async def aclose(self) -> None:
+        # Borrowing clients call this from their own __aexit__; the shared
+        # connections must outlive them.
+        return None
+
+    async def shutdown(self) -> None:
+        await self._transport.aclose()
+        self._host_slots.clear()
+
+
+# One transport per event loop: connections are bound to the loop that opened
+# them, and the web UI runs uploads in their own loops.
+_pools: dict[asyncio.AbstractEventLoop, PooledTransport] = {}
+
+
+def pooled_transport() -> Optional[PooledTransport]:
+    """Return the shared transport for the running loop, or None outside a loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    for stale in [other for other in _pools if other.is_closed()]:
+        _pools.pop(stale, None)
+    transport = _pools.get(loop)
+    if transport is None:
+        transport = PooledTransport()
+        _pools[loop] = transport
+    return transport
+
+
+def pooled_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Drop-in replacement for httpx.AsyncClient(...) that borrows pooled connections."""
+    transport = pooled_transport()
+    if transport is not None:
+        kwargs.setdefault("transport", transport)
+    return httpx.AsyncClient(**kwargs)
+
+
+async def close_pools() -> None:
+    """Close the running loop's pooled connections and forget pools of finished loops."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    for owner in list(_pools):
+        if owner is loop:
+            transport = _pools.pop(owner)
+            with contextlib.suppress(Exception):
+                await transport.shutdown()
+        elif owner.is_closed():
+            _pools.pop(owner, None)
@@ -0,0 +1,178 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Optional
+
+import aiohttp
+
+from src.console import console
+from src.imageprobe import probe_image, probe_session
+
+# Bump when the stored layout changes; older databases are emptied.
+IMAGE_HOST_CACHE_VERSION = 1
+# Days an upload is reused without checking that the host still serves it.
+DEFAULT_VERIFY_DAYS = 7
+# Hosts whose uploads land on a server chosen in the config; the server URL is part of the key.
+_HOST_URL_KEYS = {'zipline': 'zipline_url', 'sharex': 'sharex_url'}
+
+# (img_url, raw_url, web_url)
+HostedImage = tuple[str, str, str]
+
+
+def image_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def host_key(img_host: str, config: Mapping[str, Any]) -> str:
+    url_key = _HOST_URL_KEYS.get(img_host)
+    if url_key:
+        default_config: Mapping[str, Any] = config.get('DEFAULT', {})
+        return f"{img_host}:{default_config.get(url_key) or ''}"
+    return img_host
+
+
+class ImageHostCache:
+    """SQLite record of which image host already holds an image, keyed by the image's sha256.
+
+    Entries older than `verify_after` seconds are only reused after the host is seen to still
+    serve the raw URL; dead links are dropped so the image is uploaded again.
+    """
+
+    def __init__(self, path: str, verify_after: float = DEFAULT_VERIFY_DAYS * 86400) -> None:
+        self.path = path
+        self.verify_after = verify_after
+        self.stats = {'hits': 0, 'verified': 0, 'dead': 0, 'stored': 0}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_ok = True
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or not self._disk_ok:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != IMAGE_HOST_CACHE_VERSION:
+                conn.execute("DROP TABLE IF EXISTS uploads")
+                conn.execute(f"PRAGMA user_version = {IMAGE_HOST_CACHE_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS uploads ("
+                "digest TEXT NOT NULL, host TEXT NOT NULL, img_url TEXT NOT NULL, raw_url TEXT NOT NULL, "
+                "web_url TEXT NOT NULL, uploaded_at REAL NOT NULL, verified_at REAL NOT NULL, "
+                "PRIMARY KEY (digest, host))"
+            )
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            console.print(f"[yellow]Image host cache disabled, cannot open {self.path}: {e}[/yellow]")
+            self._disk_ok = False
+        return self._conn
+
+    def get(self, digest: str, host: str) -> Optional[tuple[HostedImage, float]]:
+        """(urls, verified_at) of `digest` on `host`."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT img_url, raw_url, web_url, verified_at FROM uploads WHERE digest = ? AND host = ?", (digest, host)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            return (str(row[0]), str(row[1]), str(row[2])), float(row[3])
+
+    def put(self, digest: str, host: str, urls: HostedImage) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO uploads (digest, host, img_url, raw_url, web_url, uploaded_at, verified_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (digest, host, *urls, now, now),
+                )
+                conn.commit()
+                self.stats['stored'] += 1
+            except sqlite3.Error as e:
+                console.print(f"[yellow]Could not record image upload: {e}[/yellow]")
+
+    def mark_verified(self, digest: str, host: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("UPDATE uploads SET verified_at = ? WHERE digest = ? AND host = ?", (time.time(), digest, host))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def forget(self, digest: str, host: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM uploads WHERE digest = ? AND host = ?", (digest, host))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+
+_cache: Optional[ImageHostCache] = None
+_cache_lock = threading.Lock()
+
+
+def image_host_cache(meta: Mapping[str, Any], config: Mapping[str, Any]) -> Optional[ImageHostCache]:
+    """The shared cache under data/image_hosts, or None when `image_upload_cache` is off."""
+    global _cache
+    default_config: Mapping[str, Any] = config.get('DEFAULT', {})
+    if not default_config.get('image_upload_cache', True) or not meta.get('base_dir'):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            verify_days = float(default_config.get('image_upload_cache_verify_days', DEFAULT_VERIFY_DAYS) or 0)
+            _cache = ImageHostCache(os.path.join(str(meta['base_dir']), 'data', 'image_hosts', 'uploads.sqlite3'), verify_days * 86400)
+        return _cache
+
+
+async def _still_hosted(raw_url: str) -> bool:
+    timeout = aiohttp.ClientTimeout(total=20, connect=10, sock_connect=10)
+    try:
+        async with probe_session(timeout) as session:
+            return await probe_image(session, raw_url) is not None
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return False
+
+
+async def find_hosted_image(cache: ImageHostCache, digest: str, host: str, debug: bool = False) -> Optional[HostedImage]:
+    """URLs of an earlier upload of the same bytes to `host`, if it is still being served."""
+    found = await asyncio.to_thread(cache.get, digest, host)
+    if found is None:
+        return None
+    urls, verified_at = found
+    if time.time() - verified_at > cache.verify_after:
+        if not await _still_hosted(urls[1]):
+            cache.stats['dead'] += 1
+            await asyncio.to_thread(cache.forget, digest, host)
+            if debug:
+                console.print(f"[yellow]Cached upload {urls[1]} is gone from {host}; uploading again[/yellow]")
+            return None
+        cache.stats['verified'] += 1
+        await asyncio.to_thread(cache.mark_verified, digest, host)
+    cache.stats['hits'] += 1
+    return urls
@@ -0,0 +1,160 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import os
+import re
+from collections.abc import Mapping, MutableMapping
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Optional, cast
+
+import aiohttp
+from PIL import Image
+
+from src.console import console
+
+# Bytes requested per image; PNG dimensions sit in the first 24, JPEG SOF markers
+# follow the APP segments, which stay well under this unless an EXIF thumbnail is embedded.
+HEADER_PROBE_BYTES = 16384
+# Connections per image host while probing; header requests are small enough to run several at once.
+PROBE_CONNECTIONS_PER_HOST = 6
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# SOF0-SOF15 carry the frame size; C4 (DHT), C8 (JPG) and CC (DAC) share the range but do not.
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_CONTENT_RANGE_RE = re.compile(r'bytes \d+-\d+/(\d+)')
+
+# (width, height, total size in bytes if known, full content if it had to be downloaded)
+ImageProbe = tuple[int, int, Optional[int], Optional[bytes]]
+
+
+def image_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """(width, height) from the start of a PNG or JPEG file, or None if the header is not complete."""
+    if data.startswith(_PNG_SIGNATURE):
+        if len(data) < 24 or data[12:16] != b'IHDR':
+            return None
+        return int.from_bytes(data[16:20], 'big'), int.from_bytes(data[20:24], 'big')
+
+    if data.startswith(b'\xff\xd8'):
+        offset = 2
+        while offset + 4 <= len(data):
+            if data[offset] != 0xFF:
+                return None
+            marker = data[offset + 1]
+            if marker == 0xFF:  # fill byte
+                offset += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD9:  # markers without a length
+                offset += 2
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                if offset + 9 > len(data):
+                    return None
+                height = int.from_bytes(data[offset + 5:offset + 7], 'big')
+                width = int.from_bytes(data[offset + 7:offset + 9], 'big')
+                return width, height
+            if marker == 0xDA:  # start of scan without a frame header
+                return None
+            offset += 2 + int.from_bytes(data[offset + 2:offset + 4], 'big')
+        return None
+
+    # Other formats: Pillow only parses headers on open, so a truncated file is usually enough
+    try:
+        with Image.open(BytesIO(data)) as image:
+            return image.width, image.height
+    except Exception:
+        return None
+
+
+def content_range_total(content_range: Optional[str]) -> Optional[int]:
+    match = _CONTENT_RANGE_RE.match(content_range or "")
+    return int(match.group(1)) if match else None
+
+
+def probe_session(timeout: aiohttp.ClientTimeout) -> aiohttp.ClientSession:
+    """One session for every image of a check, so connections to each host are reused."""
+    connector = aiohttp.TCPConnector(limit=PROBE_CONNECTIONS_PER_HOST * 4, limit_per_host=PROBE_CONNECTIONS_PER_HOST)
+    return aiohttp.ClientSession(timeout=timeout, connector=connector)
+
+
+async def probe_image(session: aiohttp.ClientSession, url: str) -> Optional[ImageProbe]:
+    """Read an image's dimensions with a ranged GET of its first HEADER_PROBE_BYTES.
+
+    Hosts that ignore Range are read only up to the header before the connection is dropped.
+    The whole image is downloaded only when its dimensions are not in the header.
+    """
+    async with session.get(url, headers={'Range': f"bytes=0-{HEADER_PROBE_BYTES - 1}"}) as response:
+        if response.status not in (200, 206):
+            console.print(f"[red]Failed to retrieve image: {url} (status code: {response.status})[/red]")
+            return None
+        if 'image' not in response.headers.get('Content-Type', '').lower():
+            console.print(f"[red]Content type is not an image: {url}[/red]")
+            return None
+        total_size = content_range_total(response.headers.get('Content-Range')) if response.status == 206 else response.content_length
+        head = bytearray()
+        while len(head) < HEADER_PROBE_BYTES:
+            chunk = await response.content.read(HEADER_PROBE_BYTES - len(head))
+            if not chunk:
+                break
+            head += chunk
+        dimensions = image_dimensions(bytes(head))
+        if dimensions is not None:
+            return dimensions[0], dimensions[1], total_size, None
+        if response.status == 200:
+            content = bytes(head) + await response.read()
+            return _decode_full(url, content)
+
+    async with session.get(url) as response:
+        if response.status != 200:
+            console.print(f"[red]Failed to retrieve image: {url} (status code: {response.status})[/red]")
+            return None
+        return _decode_full(url, await response.read())
+
+
+def _missing(deferred: Mapping[str, str]) -> dict[str, str]:
+    return {url: path for url, path in deferred.items() if not os.path.exists(path)}
+
+
+def _write_image(path: str, content: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Path(path).write_bytes(content)
+
+
+def _decode_full(url: str, content: bytes) -> Optional[ImageProbe]:
+    try:
+        with Image.open(BytesIO(content)) as image:
+            image.verify()
+            return image.width, image.height, len(content), content
+    except Exception as e:
+        console.print(f"[red]Image verification failed (corrupt image): {url} {e}[/red]")
+        return None
+
+
+async def fetch_deferred_images(meta: MutableMapping[str, Any]) -> None:
+    """Download the images that were validated from their headers only.
+
+    Header-only checks leave meta['deferred_images'] ({url: local path}) instead of saving each
+    image; anything that rehosts or uploads the local copies calls this first.
+    """
+    deferred = cast(Mapping[str, str], meta.get('deferred_images') or {})
+    pending = await asyncio.to_thread(_missing, deferred)
+    if not pending:
+        meta['deferred_images'] = {}
+        return
+
+    timeout = aiohttp.ClientTimeout(total=60, connect=10, sock_connect=10, sock_read=20)
+
+    async def fetch(session: aiohttp.ClientSession, url: str, path: str) -> None:
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    console.print(f"[red]Failed to download image {url}. Status: {response.status}[/red]")
+                    return
+                content = await response.read()
+            await asyncio.to_thread(_write_image, path, content)
+            console.print(f"Saved {url} as {path}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            console.print(f"[red]Error downloading image {url}: {e}[/red]")
+
+    async with probe_session(timeout) as session:
+        await asyncio.gather(*[fetch(session, url, path) for url, path in pending.items()])
+    meta['deferred_images'] = {}
@@ -0,0 +1,235 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import bisect
+import contextlib
+import hashlib
+import json
+import math
+import os
+import re
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional, cast
+
+from src.console import console
+
+# Bump when the cached payload layout or the way it is produced changes.
+KEYFRAME_INDEX_VERSION = 1
+# Entries kept under data/keyframes; the least recently used are pruned after each store.
+KEYFRAME_CACHE_ENTRIES = 2000
+# Seconds probed either side of a wanted timestamp; covers the 10 s GOPs of long-GOP x265 encodes.
+KEYFRAME_WINDOW = 6.0
+
+_TB_RE = re.compile(r'^#tb (\d+): (\d+)/(\d+)$')
+_START_RE = re.compile(r'Duration: .*?, start: (-?\d+\.\d+)')
+
+
+def _floor_us(seconds: float) -> float:
+    # ffmpeg parses -ss to whole microseconds; rounding down keeps the seek target on the keyframe
+    # rather than just past it, and never far enough below it to seek back to the previous one.
+    return math.floor(seconds * 1_000_000 + 1e-3) / 1_000_000
+
+
+class KeyframeIndex:
+    """Sorted keyframe timestamps of the first video stream, in seconds from the start of the file.
+
+    Timestamps are read from stream-copied packets around the wanted times, so the demuxer seeks
+    with the container's cue/index data and nothing is decoded. `covered` records which spans
+    have been read, so a later retake only probes the windows it has not seen.
+    """
+
+    def __init__(self, times: Iterable[float] = (), covered: Iterable[Sequence[float]] = ()) -> None:
+        self.times = array('d', sorted(set(times)))
+        self.covered: list[tuple[float, float]] = [(float(start), float(end)) for start, end in covered]
+
+    def add(self, times: Iterable[float], covered: Iterable[tuple[float, float]]) -> None:
+        self.times = array('d', sorted(set(self.times).union(times)))
+        spans = sorted([*self.covered, *covered])
+        merged: list[tuple[float, float]] = []
+        for start, end in spans:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        self.covered = merged
+
+    def missing_windows(self, ss_times: Iterable[float], window: float = KEYFRAME_WINDOW) -> list[tuple[float, float]]:
+        """Spans that still need probing to snap every time in `ss_times`, merged where they overlap."""
+        wanted: list[tuple[float, float]] = []
+        for ss_time in sorted(ss_times):
+            start, end = max(0.0, ss_time - window), ss_time + window
+            if any(c_start <= start and end <= c_end for c_start, c_end in self.covered):
+                continue
+            if wanted and start <= wanted[-1][1]:
+                wanted[-1] = (wanted[-1][0], end)
+            else:
+                wanted.append((start, end))
+        return wanted
+
+    def nearest(self, ss_time: float, window: float = KEYFRAME_WINDOW) -> Optional[float]:
+        lo = bisect.bisect_left(self.times, ss_time - window)
+        hi = bisect.bisect_right(self.times, ss_time + window)
+        if lo >= hi:
+            return None
+        return min(self.times[lo:hi], key=lambda keyframe: abs(keyframe - ss_time))
+
+    def next_keyframe(self, ss_time: float, window: float = KEYFRAME_WINDOW) -> Optional[float]:
+        """First keyframe at or after `ss_time`, if one is within `window`."""
+        pos = bisect.bisect_left(self.times, ss_time)
+        if pos < len(self.times) and self.times[pos] <= ss_time + window:
+            return self.times[pos]
+        return None
+
+    def snap(self, ss_time: float, window: float = KEYFRAME_WINDOW) -> Optional[float]:
+        """Seek time landing on the first keyframe at or after `ss_time`, or None if none is within `window`.
+
+        Snapping forward keeps the capture from drifting back into the previous scene; the
+        nearest earlier keyframe is only used when the window holds none after `ss_time`.
+        """
+        keyframe = self.next_keyframe(ss_time, window)
+        if keyframe is None:
+            keyframe = self.nearest(ss_time, window)
+        return _floor_us(keyframe) if keyframe is not None else None
+
+    def frame_info(self, ss_time: float, frame_rate: float) -> Optional[dict[str, Any]]:
+        """get_frame_info() result for a time produced by snap(), without running ffmpeg."""
+        keyframe = self.nearest(ss_time, window=1e-3)
+        if keyframe is None or _floor_us(keyframe) != _floor_us(ss_time):
+            return None
+        return {'frame_type': 'I', 'pts_time': keyframe, 'frame_number': int(round(keyframe * frame_rate))}
+
+    def to_json(self) -> dict[str, Any]:
+        return {'version': KEYFRAME_INDEX_VERSION, 'times': list(self.times), 'covered': self.covered}
+
+
+def keyframe_index_path(base_dir: str, video: str) -> Optional[str]:
+    """data/keyframes cache file for video, keyed by (device, inode, size, mtime) like the MediaInfo cache."""
+    try:
+        st = os.stat(video)
+    except OSError:
+        return None
+    identity = f"{KEYFRAME_INDEX_VERSION}:{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+    digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+    return os.path.join(base_dir, "data", "keyframes", f"{digest}.json")
+
+
+def _load(cache_path: str) -> Optional[KeyframeIndex]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if not isinstance(cached, dict) or cast(dict[str, Any], cached).get('version') != KEYFRAME_INDEX_VERSION:
+            return None
+        cached_dict = cast(dict[str, Any], cached)
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
+        return KeyframeIndex(cast(list[float], cached_dict['times']), cast(list[list[float]], cached_dict['covered']))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store(cache_path: str, index: KeyframeIndex) -> None:
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index.to_json(), f, separators=(",", ":"))
+    os.replace(tmp_path, cache_path)
+    prune_keyframe_cache(os.path.dirname(cache_path))
+
+
+def prune_keyframe_cache(cache_dir: str, keep: int = KEYFRAME_CACHE_ENTRIES) -> None:
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.is_file() and entry.name.endswith(".json")]
+        if len(entries) <= keep:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for entry in entries[keep:]:
+        with contextlib.suppress(OSError):
+            os.remove(entry.path)
+
+
+def parse_keyframes(framecrc: str, stderr: str) -> list[float]:
+    """Keyframe times relative to the file start from `-copyts -c copy -f framecrc` output."""
+    start_match = _START_RE.search(stderr)
+    start_time = float(start_match.group(1)) if start_match else 0.0
+    time_bases: dict[str, float] = {}
+    keyframes: list[float] = []
+    for line in framecrc.splitlines():
+        if line.startswith('#'):
+            tb_match = _TB_RE.match(line)
+            if tb_match:
+                time_bases[tb_match.group(1)] = int(tb_match.group(2)) / int(tb_match.group(3))
+            continue
+        fields = [field.strip() for field in line.split(',')]
+        # stream, dts, pts, duration, size, checksum[, F=flags]; keyframes carry no F= field
+        if len(fields) < 6 or fields[0] not in time_bases or any(field.startswith('F=') for field in fields[6:]):
+            continue
+        try:
+            keyframes.append(int(fields[2]) * time_bases[fields[0]] - start_time)
+        except ValueError:
+            continue
+    return keyframes
+
+
+async def _probe(ffmpeg_bin: str, video: str, windows: Sequence[tuple[float, float]]) -> list[float]:
+    # One input per window, each opened with a cue-assisted seek; packets are copied, never decoded.
+    args = ['-hide_banner', '-nostdin', '-copyts']
+    for start, end in windows:
+        args += ['-ss', f"{start:.6f}", '-t', f"{end - start:.6f}", '-i', video]
+    for n in range(len(windows)):
+        args += ['-map', f"{n}:v:0"]
+    args += ['-c', 'copy', '-f', 'framecrc', '-']
+    process = await asyncio.create_subprocess_exec(
+        ffmpeg_bin, *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(stderr.decode('utf-8', errors='replace')[-500:])
+    return parse_keyframes(stdout.decode('utf-8', errors='replace'), stderr.decode('utf-8', errors='replace'))
+
+
+_indexes: dict[str, KeyframeIndex] = {}
+
+
+def _index_key(video: str) -> str:
+    return os.path.abspath(video)
+
+
+def cached_keyframe_index(video: str) -> Optional[KeyframeIndex]:
+    """The index built for video earlier in this run, if any."""
+    return _indexes.get(_index_key(video))
+
+
+async def keyframe_index(ffmpeg_bin: str, base_dir: str, video: str, ss_times: Iterable[float], debug: bool = False) -> Optional[KeyframeIndex]:
+    """Keyframe index for video covering the windows around `ss_times`, probing only what is not cached."""
+    key = _index_key(video)
+    cache_path = keyframe_index_path(base_dir, video)
+    index = _indexes.get(key)
+    if index is None and cache_path:
+        index = await asyncio.to_thread(_load, cache_path)
+    if index is None:
+        index = KeyframeIndex()
+    _indexes[key] = index
+
+    windows = index.missing_windows(ss_times)
+    if not windows:
+        return index
+    try:
+        keyframes = await _probe(ffmpeg_bin, video, windows)
+    except Exception as e:
+        if debug:
+            console.print(f"[yellow]Keyframe probe failed for {video}: {e}[/yellow]")
+        return index
+    index.add(keyframes, windows)
+    if debug:
+        console.print(f"[cyan]Keyframe index: {len(keyframes)} keyframes in {len(windows)} window(s), {len(index.times)} known[/cyan]")
+    if cache_path:
+        try:
+            await asyncio.to_thread(_store, cache_path, index)
+        except OSError as e:
+            if debug:
+                console.print(f"[yellow]Failed to write keyframe index {cache_path}: {e}[/yellow]")
+    return index
@@ -0,0 +1,306 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Optional, cast
+
+import httpx
+
+from src.console import console
+from src.http_pool import pooled_client, pooled_transport
+
+# Bump when the stored layout or the way keys are built changes; older databases are emptied.
+METADATA_CACHE_VERSION = 1
+# Seconds a cached response is served before it is fetched again.
+PROVIDER_TTLS = {
+    'tmdb': 3 * 86400,
+    'imdb': 7 * 86400,
+    'anilist': 7 * 86400,
+    'tvmaze': 86400,
+}
+DEFAULT_TTL = 86400
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Responses kept decoded in memory in front of the database.
+MEMORY_ENTRIES = 512
+
+# Query parameters that authenticate rather than select what is returned; never part of a key.
+_SECRET_PARAMS = frozenset({'api_key', 'apikey', 'token'})
+# Headers describing the original transfer, not the stored (already decoded) body.
+_DROPPED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive', 'set-cookie'})
+
+# (status, headers, decoded body, expires_at, stored_at)
+CachedResponse = tuple[int, list[tuple[str, str]], bytes, float, float]
+
+
+def request_key(provider: str, request: httpx.Request) -> str:
+    """Key for a request: provider, method, URL without credentials, and a digest of any body."""
+    params = sorted((name, value) for name, value in request.url.params.multi_items() if name not in _SECRET_PARAMS)
+    url = request.url.copy_with(query=None, fragment=None)
+    body_digest = hashlib.sha256(request.content).hexdigest() if request.content else ""
+    identity = json.dumps([METADATA_CACHE_VERSION, provider, request.method, str(url), params, body_digest])
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def _cacheable(body: bytes) -> bool:
+    # GraphQL reports failures (rate limits included) with status 200 and an "errors" member
+    try:
+        data: Any = json.loads(body)
+    except ValueError:
+        return False
+    return not (isinstance(data, dict) and cast(dict[str, Any], data).get('errors'))
+
+
+class MetadataCache:
+    """SQLite store of metadata API responses with an in-memory LRU in front.
+
+    Entries expire after their provider's TTL. When the database grows past `max_bytes` the least
+    recently read entries are dropped. With `refresh` set, anything stored before this run started
+    is ignored, so each response is fetched once and then shared for the rest of the run.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES, refresh: bool = False) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.refresh_before = time.time() if refresh else 0.0
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+        self._memory: OrderedDict[str, CachedResponse] = OrderedDict()
+        # Fetches in progress, so identical concurrent requests wait for one response
+        self.inflight: dict[str, asyncio.Future[Optional[CachedResponse]]] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_ok = True
+
+    def set_refresh(self, refresh: bool) -> None:
+        self.refresh_before = time.time() if refresh else 0.0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or not self._disk_ok:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != METADATA_CACHE_VERSION:
+                conn.execute("DROP TABLE IF EXISTS responses")
+                conn.execute(f"PRAGMA user_version = {METADATA_CACHE_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, provider TEXT NOT NULL, status INTEGER NOT NULL, headers TEXT NOT NULL, "
+                "body BLOB NOT NULL, size INTEGER NOT NULL, stored_at REAL NOT NULL, expires_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed_at)")
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            console.print(f"[yellow]Metadata cache disabled, cannot open {self.path}: {e}[/yellow]")
+            self._disk_ok = False
+        return self._conn
+
+    def _fresh(self, entry: CachedResponse) -> bool:
+        return entry[3] > time.time() and entry[4] >= self.refresh_before
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        # Callers hold self._lock; web UI uploads reach the cache from several threads
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def lookup_memory(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if not self._fresh(entry):
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            self.stats['memory_hits'] += 1
+            return entry
+
+    def lookup_disk(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT status, headers, body, expires_at, stored_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                entry: CachedResponse = (int(row[0]), [(str(k), str(v)) for k, v in json.loads(row[1])], bytes(row[2]), float(row[3]), float(row[4]))
+                if not self._fresh(entry):
+                    return None
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+            except (sqlite3.Error, ValueError, TypeError):
+                return None
+            self.stats['disk_hits'] += 1
+            self._remember(key, entry)
+        return entry
+
+    def store(self, key: str, provider: str, entry: CachedResponse) -> None:
+        status, headers, body, expires_at, stored_at = entry
+        with self._lock:
+            self._remember(key, entry)
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, provider, status, json.dumps(headers), body, len(body), stored_at, expires_at, stored_at),
+                )
+                conn.commit()
+                self.stats['stored'] += 1
+                if self.stats['stored'] % 50 == 1:
+                    self._evict(conn)
+            except sqlite3.Error:
+                return
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        cursor = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        self.stats['evicted'] += max(cursor.rowcount, 0)
+        total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0])
+        if total > self.max_bytes:
+            # Drop the least recently read entries until the store is back under 90% of the limit
+            excess = total - int(self.max_bytes * 0.9)
+            dropped = 0
+            for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+                if dropped >= excess:
+                    break
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                dropped += int(size)
+                self.stats['evicted'] += 1
+        conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _build_response(entry: CachedResponse, request: httpx.Request) -> httpx.Response:
+    status, headers, body, _, _ = entry
+    return httpx.Response(status, headers=headers, content=body, request=request)
+
+
+class MetadataCacheTransport(httpx.AsyncBaseTransport):
+    """Serve provider API requests from the metadata cache, fetching through `inner` on a miss.
+
+    Only 200 responses with a JSON body are stored. Concurrent identical requests share one fetch.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, cache: MetadataCache, provider: str) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._provider = provider
+        self._ttl = PROVIDER_TTLS.get(provider, DEFAULT_TTL)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in ('GET', 'POST'):
+            return await self._inner.handle_async_request(request)
+        await request.aread()
+        key = request_key(self._provider, request)
+        cache = self._cache
+
+        loop = asyncio.get_running_loop()
+        entry = cache.lookup_memory(key)
+        if entry is None:
+            pending = cache.inflight.get(key)
+            if pending is not None and pending.get_loop() is loop:
+                entry = await asyncio.shield(pending)
+                if entry is not None:
+                    cache.stats['memory_hits'] += 1
+        if entry is not None:
+            return _build_response(entry, request)
+
+        future: asyncio.Future[Optional[CachedResponse]] = loop.create_future()
+        cache.inflight[key] = future
+        try:
+            entry = await asyncio.to_thread(cache.lookup_disk, key)
+            if entry is not None:
+                future.set_result(entry)
+                return _build_response(entry, request)
+
+            cache.stats['misses'] += 1
+            response = await self._inner.handle_async_request(request)
+            if response.status_code != 200:
+                return response
+            try:
+                raw = b"".join([chunk async for chunk in cast(httpx.AsyncByteStream, response.stream)])
+            finally:
+                await response.aclose()
+            # Decode any Content-Encoding once, so the stored body can be served as is
+            decoded = httpx.Response(response.status_code, headers=response.headers, content=raw, request=request)
+            stored_at = time.time()
+            headers = [(name, value) for name, value in decoded.headers.items() if name.lower() not in _DROPPED_HEADERS]
+            entry = (decoded.status_code, headers, decoded.content, stored_at + self._ttl, stored_at)
+            if _cacheable(decoded.content):
+                await asyncio.to_thread(cache.store, key, self._provider, entry)
+                future.set_result(entry)
+            return _build_response(entry, request)
+        finally:
+            if not future.done():
+                future.set_result(None)
+            if cache.inflight.get(key) is future:
+                del cache.inflight[key]
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+_cache: Optional[MetadataCache] = None
+
+
+def configure_metadata_cache(base_dir: str, config: Mapping[str, Any], refresh: bool = False) -> None:
+    """Set up the cache shared by metadata_client() from the DEFAULT config section."""
+    global _cache
+    default_config = cast(Mapping[str, Any], config.get('DEFAULT', {}))
+    if not default_config.get('metadata_cache', True):
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+        return
+    path = os.path.join(base_dir, 'data', 'metadata', 'cache.sqlite3')
+    try:
+        max_bytes = int(default_config.get('metadata_cache_size_mb', DEFAULT_MAX_BYTES // (1024 * 1024))) * 1024 * 1024
+    except (TypeError, ValueError):
+        max_bytes = DEFAULT_MAX_BYTES
+    if _cache is None or _cache.path != path:
+        if _cache is not None:
+            _cache.close()
+        _cache = MetadataCache(path, max_bytes, refresh)
+    else:
+        _cache.max_bytes = max_bytes
+        _cache.set_refresh(refresh)
+
+
+def metadata_client(provider: str, **kwargs: Any) -> httpx.AsyncClient:
+    """pooled_client() whose responses for `provider` are read through the metadata cache."""
+    transport = pooled_transport()
+    if _cache is None or transport is None or 'transport' in kwargs:
+        return pooled_client(**kwargs)
+    return httpx.AsyncClient(transport=MetadataCacheTransport(transport, _cache, provider), **kwargs)
+
+
+def print_metadata_cache_stats() -> None:
+    if _cache is None:
+        return
+    stats = _cache.stats
+    hits = stats['memory_hits'] + stats['disk_hits']
+    if not hits and not stats['misses']:
+        return
+    console.print(
+        f"[cyan]Metadata cache: {hits} hits ({stats['memory_hits']} memory, {stats['disk_hits']} disk), "
+        f"{stats['misses']} misses, {stats['stored']} stored, {stats['evicted']} evicted[/cyan]"
+    )
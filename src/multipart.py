@@ -0,0 +1,123 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import base64
+import mimetypes
+import os
+import secrets
+from collections.abc import AsyncIterator, Mapping
+from typing import Any, NamedTuple, Optional, Union
+
+import aiofiles
+
+# Bytes read from disk per chunk; a multiple of 3 so base64-encoded chunks join without padding.
+CHUNK_SIZE = 3 * 64 * 1024
+
+
+class StreamedFile(NamedTuple):
+    """A file part sent from disk in chunks instead of being read into memory first."""
+
+    path: str
+    # Defaults to the basename of path
+    filename: Optional[str] = None
+    # Defaults to a guess from the filename
+    content_type: Optional[str] = None
+    # Send the base64 text of the file as a plain form field, for APIs that take images that way
+    base64: bool = False
+
+
+# Either streamed from disk, or httpx-style (filename, content[, content_type]) held in memory
+FileValue = Union[StreamedFile, tuple[str, bytes], tuple[str, bytes, str]]
+
+
+def _quote(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+def _form_value(value: Any) -> bytes:
+    # Same conversions as httpx applies to data= values
+    if value is True:
+        return b'true'
+    if value is False:
+        return b'false'
+    if value is None:
+        return b''
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode('utf-8')
+
+
+class MultipartStream:
+    """multipart/form-data body that streams StreamedFile parts from disk.
+
+    Send it with client.post(url, content=body, headers=body.headers). The Content-Length is
+    known up front, so hosts that refuse chunked requests still accept it, and the body can be
+    iterated again for retries and redirects. Memory use stays at one chunk per upload.
+    """
+
+    def __init__(self, data: Optional[Mapping[str, Any]] = None, files: Optional[Mapping[str, FileValue]] = None) -> None:
+        self.boundary = secrets.token_hex(16)
+        self._parts: list[Union[bytes, StreamedFile]] = []
+        self.content_length = 0
+
+        for name, value in (data or {}).items():
+            values: list[Any] = list(value) if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                self._add(f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'.encode() + _form_value(item) + b'\r\n')
+
+        for name, file_value in (files or {}).items():
+            if isinstance(file_value, StreamedFile):
+                filename = file_value.filename or os.path.basename(file_value.path)
+                size = os.path.getsize(file_value.path)
+                if file_value.base64:
+                    self._add(f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'.encode())
+                    size = (size + 2) // 3 * 4
+                else:
+                    content_type = file_value.content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                    self._add(self._file_header(name, filename, content_type))
+                self._parts.append(file_value)
+                self.content_length += size
+                self._add(b'\r\n')
+            else:
+                filename, content = file_value[0], file_value[1]
+                content_type = file_value[2] if len(file_value) > 2 else (mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+                self._add(self._file_header(name, filename, content_type) + content + b'\r\n')
+
+        self._add(f'--{self.boundary}--\r\n'.encode())
+
+    def _add(self, chunk: bytes) -> None:
+        self._parts.append(chunk)
+        self.content_length += len(chunk)
+
+    def _file_header(self, name: str, filename: str, content_type: str) -> bytes:
+        return (
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(filename)}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        ).encode()
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            'Content-Type': f'multipart/form-data; boundary={self.boundary}',
+            'Content-Length': str(self.content_length),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+                continue
+            async with aiofiles.open(part.path, 'rb') as f:
+                while True:
+                    chunk = await f.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield base64.b64encode(chunk) if part.base64 else chunk
+
+
+def multipart_request(
+    data: Optional[Mapping[str, Any]] = None,
+    files: Optional[Mapping[str, FileValue]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> dict[str, Any]:
+    """`content=` and `headers=` keyword arguments for an httpx request with a streamed multipart body."""
+    body = MultipartStream(data, files)
+    return {'content': body, 'headers': {**(headers or {}), **body.headers}}
@@ -0,0 +1,248 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Optional
+
+from src.console import console
+
+# Seconds between background refreshes. A refresh stats every directory and only relists
+# the ones whose mtime changed, so it stays cheap on large, mostly static libraries.
+# Searches also refresh before matching (see sync()), so they never miss a new file.
+NAME_INDEX_REFRESH_SECONDS = 60
+# Directories modified this recently are relisted on the next refresh as well, in case a
+# filesystem with coarse mtimes records a second change under the same timestamp.
+_MTIME_SETTLE_NS = 2_000_000_000
+
+# Separators between name tokens: whitespace, dots, dashes and underscores
+NAME_SEP_RE = re.compile(r'[\s.\-_]+')
+
+
+def name_tokens(name: str) -> list[str]:
+    return [t for t in NAME_SEP_RE.split(name.lower()) if t]
+
+
+def tokens_in_order(name_tokens: Sequence[str], query_tokens: Sequence[str]) -> bool:
+    """True if query_tokens appear as whole tokens of the name, in order."""
+    pos = 0
+    for qt in query_tokens:
+        while pos < len(name_tokens) and name_tokens[pos] != qt:
+            pos += 1
+        if pos == len(name_tokens):
+            return False
+        pos += 1
+    return True
+
+
+@dataclass(frozen=True)
+class IndexedEntry:
+    name: str
+    path: str
+    is_dir: bool
+    is_link: bool
+    # The name, or a directory between it and the index root, starts with "."
+    hidden: bool
+    lower: str
+    tokens: tuple[str, ...]
+
+
+class NameIndex:
+    """In-memory token index of every file and directory under one root.
+
+    A daemon thread builds the index and keeps it current between searches; sync() brings it
+    up to date before a search. Symlinked directories are indexed but not followed, like os.walk.
+    """
+
+    def __init__(self, root: str, refresh_seconds: float = NAME_INDEX_REFRESH_SECONDS) -> None:
+        self.root = os.path.abspath(root)
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        # One refresh at a time, whether from the daemon thread or a search
+        self._refresh_lock = threading.Lock()
+        self._entries: dict[str, IndexedEntry] = {}
+        # token -> paths of the entries whose name contains it
+        self._postings: dict[str, set[str]] = {}
+        # directory -> (mtime_ns when listed, paths of its children)
+        self._dirs: dict[str, tuple[int, list[str]]] = {}
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"name-index {self.root}", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the first full build has finished."""
+        return self._ready.wait(timeout)
+
+    def sync(self) -> None:
+        """Wait for the first build, then re-stat every directory so entries added since the
+        last background refresh are found, as the os.walk these searches replaced would."""
+        self.wait_ready()
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            try:
+                self.refresh()
+            except Exception as e:
+                console.print(f"[yellow]Name index refresh of {self.root} failed: {e}[/yellow]")
+            finally:
+                if not self._ready.is_set():
+                    console.print(f"[cyan]Indexed {len(self._entries)} names under {self.root} in {time.perf_counter() - started:.1f}s[/cyan]")
+                    self._ready.set()
+            self._stop.wait(self.refresh_seconds)
+
+    def refresh(self) -> None:
+        """Bring the index up to date, relisting only directories whose mtime changed."""
+        with self._refresh_lock:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        stack: list[tuple[str, bool]] = [(self.root, False)]
+        while stack:
+            dirpath, hidden = stack.pop()
+            try:
+                mtime = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                with self._lock:
+                    self._forget_children(dirpath)
+                continue
+
+            known = self._dirs.get(dirpath)
+            if known is None or known[0] != mtime:
+                children = self._list(dirpath, hidden)
+                if time.time_ns() - mtime < _MTIME_SETTLE_NS:
+                    mtime = -1
+                with self._lock:
+                    self._replace_children(dirpath, mtime, children)
+
+            for child in self._dirs[dirpath][1]:
+                entry = self._entries[child]
+                if entry.is_dir and not entry.is_link:
+                    stack.append((child, entry.hidden))
+
+    def _list(self, dirpath: str, hidden: bool) -> list[IndexedEntry]:
+        entries: list[IndexedEntry] = []
+        try:
+            with os.scandir(dirpath) as it:
+                for dir_entry in it:
+                    name = dir_entry.name
+                    try:
+                        is_dir = dir_entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    try:
+                        is_link = dir_entry.is_symlink()
+                    except OSError:
+                        is_link = False
+                    entries.append(IndexedEntry(
+                        name=name,
+                        path=os.path.join(dirpath, name),
+                        is_dir=is_dir,
+                        is_link=is_link,
+                        hidden=hidden or name.startswith("."),
+                        lower=name.lower(),
+                        tokens=tuple(name_tokens(name)),
+                    ))
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            pass
+        return entries
+
+    def _replace_children(self, dirpath: str, mtime: int, children: list[IndexedEntry]) -> None:
+        old_paths = self._dirs[dirpath][1] if dirpath in self._dirs else []
+        new_by_path = {entry.path: entry for entry in children}
+        for path in old_paths:
+            new_entry = new_by_path.get(path)
+            old_entry = self._entries.get(path)
+            if new_entry is None or old_entry is None or (old_entry.is_dir, old_entry.is_link) != (new_entry.is_dir, new_entry.is_link):
+                self._remove(path)
+        for path, entry in new_by_path.items():
+            if path not in self._entries:
+                self._entries[path] = entry
+                for token in set(entry.tokens):
+                    self._postings.setdefault(token, set()).add(path)
+        self._dirs[dirpath] = (mtime, list(new_by_path))
+
+    def _forget_children(self, dirpath: str) -> None:
+        state = self._dirs.pop(dirpath, None)
+        if state is not None:
+            for child in state[1]:
+                self._remove(child)
+
+    def _remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        for token in set(entry.tokens):
+            paths = self._postings.get(token)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self._postings[token]
+        if entry.is_dir:
+            self._forget_children(path)
+
+    def match_tokens(self, query: str) -> list[IndexedEntry]:
+        """Entries whose name contains the query's tokens as whole tokens, in order."""
+        query_tokens = name_tokens(query)
+        if not query_tokens:
+            return []
+        with self._lock:
+            postings = [self._postings.get(token) for token in set(query_tokens)]
+            if any(p is None for p in postings):
+                return []
+            ordered = sorted((p for p in postings if p is not None), key=len)
+            candidates = ordered[0].intersection(*ordered[1:])
+            entries = [self._entries[path] for path in candidates]
+        return [entry for entry in entries if tokens_in_order(entry.tokens, query_tokens)]
+
+    def match_substrings(self, words: Iterable[str]) -> list[IndexedEntry]:
+        """Entries whose lowercased name contains every word, compared as given (callers lowercase the query)."""
+        words = list(words)
+        with self._lock:
+            candidates: Optional[set[str]] = None
+            for word in words:
+                # A run of non-separators inside the word must lie inside a single token of the name
+                pieces = name_tokens(word)
+                if not pieces:
+                    continue
+                piece = max(pieces, key=len)
+                matched: set[str] = set()
+                for token, paths in self._postings.items():
+                    if piece in token:
+                        matched |= paths
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return []
+            entries = list(self._entries.values()) if candidates is None else [self._entries[path] for path in candidates]
+        return [entry for entry in entries if all(word in entry.lower for word in words)]
+
+
+_indexes: dict[str, NameIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def shared_name_index(root: str) -> NameIndex:
+    """The process-wide index of `root`, started on first use and shared by every search surface."""
+    root = os.path.abspath(root)
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = NameIndex(root)
+            index.start()
+            _indexes[root] = index
+    return index
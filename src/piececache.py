@@ -0,0 +1,112 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import contextlib
+import hashlib
+import os
+import shutil
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional
+
+from src.console import console
+
+# Bump when the on-disk layout of a cache entry changes.
+PIECE_CACHE_VERSION = 1
+# Entries kept under data/piece_layers; the oldest are pruned after each store.
+PIECE_CACHE_ENTRIES = 200
+
+PIECE_SIZE_MIN = 32 * 1024  # 32 KiB
+PIECE_SIZE_MAX = 134_217_728  # 128 MiB
+MIB = 1024 * 1024
+
+# Trackers whose upload() re-hashes BASE when its pieces exceed this many MiB.
+TRACKER_PIECE_CAPS_MIB = {'HDB': 16, 'MTV': 8, 'PTP': 16}
+
+
+def piece_layer_cache_enabled(meta: Mapping[str, Any]) -> bool:
+    return bool(meta.get('base_dir')) and str(meta.get('piece_layer_cache', 'trackers')).lower() not in ('off', 'false', '0', 'none')
+
+
+def piece_layer_sizes(meta: Mapping[str, Any], piece_size: int) -> list[int]:
+    """Extra piece sizes worth hashing alongside `piece_size` in the same read pass.
+
+    meta['piece_layer_cache'] is "trackers" (default: only the caps of the selected
+    HDB/MTV/PTP trackers that are smaller than piece_size), "all" (every power of two
+    from 32 KiB to 128 MiB) or "off".
+    """
+    if not piece_layer_cache_enabled(meta):
+        return []
+    mode = str(meta.get('piece_layer_cache', 'trackers')).lower()
+    if mode == 'all':
+        sizes: set[int] = set()
+        size = PIECE_SIZE_MIN
+        while size <= PIECE_SIZE_MAX:
+            sizes.add(size)
+            size *= 2
+    else:
+        raw_trackers = meta.get('trackers') or []
+        trackers = {str(t).strip().upper() for t in raw_trackers} if isinstance(raw_trackers, list) else {str(raw_trackers).strip().upper()}
+        sizes = {cap * MIB for tracker, cap in TRACKER_PIECE_CAPS_MIB.items() if tracker in trackers and cap * MIB < piece_size}
+    sizes.discard(piece_size)
+    return sorted(sizes)
+
+
+def piece_layer_dir(base_dir: str, files: Sequence[tuple[str, str, int]]) -> Optional[str]:
+    """Cache directory for one exact file layout: (path inside torrent, path on disk, size) in order.
+
+    Like the MediaInfo cache, each file is identified by (device, inode, size, mtime) so
+    any rewrite of the content misses, and the in-torrent paths and order are part of the key.
+    """
+    identity = [str(PIECE_CACHE_VERSION)]
+    for torrent_path, disk_path, size in files:
+        try:
+            st = os.stat(disk_path)
+        except OSError:
+            return None
+        if st.st_size != size:
+            return None
+        identity.append(f"{torrent_path}\0{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}")
+    digest = hashlib.sha256("\n".join(identity).encode("utf-8")).hexdigest()
+    return os.path.join(base_dir, "data", "piece_layers", digest)
+
+
+def load_piece_layer(layer_dir: str, piece_size: int, total_size: int) -> Optional[bytes]:
+    try:
+        with open(os.path.join(layer_dir, f"{piece_size}.bin"), "rb") as f:
+            pieces = f.read()
+    except OSError:
+        return None
+    if len(pieces) != -(-total_size // piece_size) * 20:
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(layer_dir)
+    return pieces
+
+
+def store_piece_layers(layer_dir: str, layers: Mapping[int, bytes], debug: bool = False) -> None:
+    try:
+        os.makedirs(layer_dir, exist_ok=True)
+        for piece_size, pieces in layers.items():
+            target = os.path.join(layer_dir, f"{piece_size}.bin")
+            tmp_path = f"{target}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(pieces)
+            os.replace(tmp_path, target)
+        if debug:
+            sizes = ", ".join(f"{size // 1024} KiB" for size in sorted(layers))
+            console.print(f"[green]Cached piece layers ({sizes}) to {layer_dir}[/green]")
+    except OSError as e:
+        if debug:
+            console.print(f"[yellow]Failed to write piece layer cache: {e}[/yellow]")
+        return
+    prune_piece_layers(os.path.dirname(layer_dir))
+
+
+def prune_piece_layers(cache_root: str, keep: int = PIECE_CACHE_ENTRIES) -> None:
+    try:
+        entries = [entry for entry in os.scandir(cache_root) if entry.is_dir()]
+    except OSError:
+        return
+    if len(entries) <= keep:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[keep:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
@@ -0,0 +1,167 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import hashlib
+import io
+import os
+import queue
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+# Bytes requested per read. Reads are whole multiples of the piece size so a piece never
+# straddles two buffers, and large enough to keep disks and network mounts streaming.
+READ_CHUNK_BYTES = 32 * 1024 * 1024
+# Upper bound for all read buffers together. Buffers shrink to fit it as the worker count grows,
+# down to one piece of the largest size (so 128 MiB pieces use a single buffer).
+BUFFER_MEMORY_BYTES = 128 * 1024 * 1024
+
+# (current file, pieces hashed, total pieces) -> anything but None cancels hashing
+ProgressCallback = Callable[[str, int, int], Optional[object]]
+
+
+class _ContentReader:
+    """Reads the concatenation of a torrent's files into caller-supplied buffers."""
+
+    def __init__(self, files: Sequence[tuple[str, int]]) -> None:
+        self._files = [(path, size) for path, size in files if size > 0]
+        self._index = -1
+        self._handle: Optional[io.FileIO] = None
+        self._remaining = 0
+        self.current_path = self._files[0][0] if self._files else ""
+
+    def _next_file(self) -> None:
+        self.close()
+        self._index += 1
+        if self._index >= len(self._files):
+            raise OSError("Torrent content ended early; a file was truncated or removed while hashing")
+        path, size = self._files[self._index]
+        self._handle = open(path, "rb", buffering=0)  # noqa: SIM115 - closed in _next_file()/close()
+        self._remaining = size
+        self.current_path = path
+
+    def readinto(self, view: memoryview) -> None:
+        filled = 0
+        while filled < len(view):
+            if self._handle is None or self._remaining == 0:
+                self._next_file()
+            want = min(len(view) - filled, self._remaining)
+            count = self._handle.readinto(view[filled:filled + want]) if self._handle is not None else 0
+            if not count:
+                raise OSError(f"Unexpected end of file while hashing {self.current_path}")
+            filled += count
+            self._remaining -= count
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def _hash_buffer(buffer: bytearray, length: int, piece_sizes: Sequence[int]) -> list[bytes]:
+    view = memoryview(buffer)[:length]
+    # hashlib drops the GIL for inputs over 2 KiB, so worker threads hash in parallel
+    return [
+        b"".join(hashlib.sha1(view[offset:offset + piece_size]).digest() for offset in range(0, length, piece_size))
+        for piece_size in piece_sizes
+    ]
+
+
+def hash_pieces(
+    files: Sequence[tuple[str, int]],
+    piece_size: int,
+    threads: Optional[int] = None,
+    callback: Optional[ProgressCallback] = None,
+    interval: float = 0,
+) -> Optional[bytes]:
+    """Return the concatenated SHA-1 piece hashes of files laid end to end, or None if cancelled.
+
+    `files` is (path, size) in torrent order. Content is read sequentially with readinto()
+    into a small pool of reused buffers while a thread pool hashes the filled ones.
+    """
+    layers = hash_piece_layers(files, [piece_size], threads=threads, callback=callback, interval=interval)
+    return None if layers is None else layers[piece_size]
+
+
+def hash_piece_layers(
+    files: Sequence[tuple[str, int]],
+    piece_sizes: Sequence[int],
+    threads: Optional[int] = None,
+    callback: Optional[ProgressCallback] = None,
+    interval: float = 0,
+) -> Optional[dict[int, bytes]]:
+    """Hash files once for several power-of-two piece sizes, keyed by piece size.
+
+    Progress is reported in pieces of the first size. Buffers are aligned to the largest
+    size, which every smaller power of two divides, so no piece of any size straddles reads.
+    """
+    sizes = list(dict.fromkeys(piece_sizes))
+    if not sizes or any(size <= 0 or size & (size - 1) for size in sizes):
+        raise ValueError(f"Invalid piece sizes: {piece_sizes}")
+    primary = sizes[0]
+    largest = max(sizes)
+    total_size = sum(size for _, size in files)
+    pieces_total = -(-total_size // primary)
+    if pieces_total == 0:
+        return dict.fromkeys(sizes, b"")
+
+    workers = max(1, threads or os.cpu_count() or 1)
+    # One buffer per worker plus two being read keeps every worker busy within the memory budget
+    chunk_bytes = min(READ_CHUNK_BYTES, BUFFER_MEMORY_BYTES // (workers + 2))
+    chunk_size = min(max(1, chunk_bytes // largest), -(-total_size // largest)) * largest
+    buffer_count = max(1, min(workers + 2, BUFFER_MEMORY_BYTES // chunk_size))
+    free_buffers: queue.SimpleQueue[bytearray] = queue.SimpleQueue()
+    allocated = 0
+
+    def hash_and_release(buffer: bytearray, length: int) -> list[bytes]:
+        try:
+            return _hash_buffer(buffer, length, sizes)
+        finally:
+            free_buffers.put(buffer)
+
+    reader = _ContentReader(files)
+    pending: deque[tuple[int, Future[list[bytes]]]] = deque()
+    digests: list[list[bytes]] = [[] for _ in sizes]
+    pieces_done = 0
+    last_report = 0.0
+
+    def collect(block: bool) -> Optional[object]:
+        nonlocal pieces_done, last_report
+        while pending and (block or pending[0][1].done()):
+            pieces, future = pending.popleft()
+            for layer, chunk_digests in zip(digests, future.result()):
+                layer.append(chunk_digests)
+            pieces_done += pieces
+            if callback is not None:
+                now = time.monotonic()
+                if pieces_done == pieces_total or now - last_report >= interval:
+                    last_report = now
+                    cancel = callback(reader.current_path, pieces_done, pieces_total)
+                    if cancel is not None:
+                        return cancel
+        return None
+
+    executor = ThreadPoolExecutor(max_workers=min(workers, buffer_count), thread_name_prefix="piecehash")
+    try:
+        offset = 0
+        while offset < total_size:
+            if allocated < buffer_count and free_buffers.empty():
+                buffer = bytearray(chunk_size)
+                allocated += 1
+            else:
+                buffer = free_buffers.get()
+            length = min(chunk_size, total_size - offset)
+            reader.readinto(memoryview(buffer)[:length])
+            pending.append((-(-length // primary), executor.submit(hash_and_release, buffer, length)))
+            offset += length
+            if collect(block=False) is not None:
+                return None
+        if collect(block=True) is not None:
+            return None
+    finally:
+        reader.close()
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+    return {size: b"".join(layer) for size, layer in zip(sizes, digests)}
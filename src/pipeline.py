@@ -0,0 +1,108 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator, Coroutine, Iterable
+from typing import Any, Optional, TypeVar, cast
+
+from src.cleanup import protected_tasks, running_chains
+from src.console import console
+
+T = TypeVar("T")
+Meta = dict[str, Any]
+
+
+def record_stage(meta: Meta, stage: str, elapsed: float, tracker: Optional[str] = None) -> None:
+    """Add `elapsed` seconds to meta['stage_timings'][stage] (or to the tracker's own entry)."""
+    timings = cast(dict[str, Any], meta.setdefault('stage_timings', {}))
+    if tracker is None:
+        bucket = timings
+    else:
+        per_tracker = cast(dict[str, dict[str, float]], timings.setdefault('trackers', {}))
+        bucket = per_tracker.setdefault(tracker, {})
+    bucket[stage] = round(float(bucket.get(stage, 0.0)) + elapsed, 3)
+
+
+@contextlib.asynccontextmanager
+async def timed_stage(meta: Meta, stage: str, tracker: Optional[str] = None) -> AsyncIterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(meta, stage, time.perf_counter() - started, tracker)
+
+
+def protect_task(task: "asyncio.Task[Any]") -> None:
+    """Keep `task` alive through the mid-run cleanup_manager.cleanup() calls."""
+    protected_tasks.add(task)
+    task.add_done_callback(protected_tasks.discard)
+
+
+def start_stage(meta: Meta, stage: str, coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    """Run a stage as its own task so the caller can carry on with the next one."""
+
+    async def run() -> T:
+        async with timed_stage(meta, stage):
+            return await coro
+
+    task = asyncio.create_task(run(), name=f"stage:{stage}")
+    protect_task(task)
+    return task
+
+
+async def await_stage(task: "asyncio.Task[T]") -> T:
+    """Await a background stage, keeping the awaiting task protected while it waits."""
+    async with protect_current_task():
+        return await task
+
+
+async def cancel_stage(task: "Optional[asyncio.Task[Any]]") -> None:
+    if task is None or task.done():
+        return
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task
+
+
+@contextlib.asynccontextmanager
+async def protect_current_task() -> AsyncIterator[None]:
+    """Protect the orchestrating task while its stages run.
+
+    Screenshot retakes inside a stage call cleanup(), which would otherwise
+    cancel the task awaiting that stage and, through gather(), its siblings.
+    """
+    current = asyncio.current_task()
+    added = current is not None and current not in protected_tasks
+    if added and current is not None:
+        protected_tasks.add(current)
+    try:
+        yield
+    finally:
+        if added and current is not None:
+            protected_tasks.discard(current)
+
+
+async def gather_stages(coros: Iterable[Coroutine[Any, Any, T]]) -> list[Any]:
+    """Run one chain per tracker concurrently; a failing chain does not stop the others."""
+    tasks: list[asyncio.Task[T]] = []
+    for coro in coros:
+        task = asyncio.create_task(coro)
+        protect_task(task)
+        running_chains.add(task)
+        task.add_done_callback(running_chains.discard)
+        tasks.append(task)
+    async with protect_current_task():
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def print_stage_timings(meta: Meta) -> None:
+    timings = cast(dict[str, Any], meta.get('stage_timings') or {})
+    if not timings:
+        return
+    shared = [f"{stage}={elapsed:.2f}s" for stage, elapsed in timings.items() if stage != 'trackers']
+    if shared:
+        console.print(f"[cyan]Stage timings: {', '.join(shared)}[/cyan]")
+    per_tracker = cast(dict[str, dict[str, float]], timings.get('trackers') or {})
+    for tracker, stages in per_tracker.items():
+        chain = ", ".join(f"{stage}={elapsed:.2f}s" for stage, elapsed in stages.items())
+        console.print(f"[cyan]  {tracker}: {chain} (chain {sum(stages.values()):.2f}s)[/cyan]")
@@ -0,0 +1,122 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import importlib.util
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from src.console import console
+
+# Largest screenshot each host accepts, matching the size checks in takescreens.screenshots.
+HOST_BYTE_BUDGETS = {'imgbb': 31_000_000, 'imgbox': 10_000_000, 'pixhost': 10_000_000}
+
+
+def host_byte_budget(img_host: Optional[str]) -> Optional[int]:
+    if not img_host:
+        return None
+    for host, budget in HOST_BYTE_BUDGETS.items():
+        if host in img_host:
+            return budget
+    return None
+
+
+def oxipng_available() -> bool:
+    return importlib.util.find_spec('oxipng') is not None
+
+
+def optimize_png(image_path: str, budget: Optional[int]) -> tuple[int, int]:
+    """Losslessly recompress a PNG in place and return its (original, optimized) size in bytes.
+
+    Runs in a worker thread: oxipng and Pillow's zlib encoder release the GIL while they work.
+    Images over `budget` get the slowest, strongest settings.
+    oxipng is used when installed. Without it, only images over `budget` are re-encoded, by
+    Pillow at zlib level 9: that takes a second or more per frame for a few percent saved.
+    """
+    original_size = os.path.getsize(image_path)
+    over_budget = budget is not None and original_size > budget
+    oxipng: Any
+    try:
+        import oxipng  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        oxipng = None
+
+    if oxipng is not None:
+        oxipng.optimize(image_path, level=6 if over_budget else 2)
+    elif over_budget:
+        from PIL import Image
+
+        tmp_path = f"{image_path}.{os.getpid()}.tmp"
+        try:
+            with Image.open(image_path) as image:
+                image.save(tmp_path, format='PNG', compress_level=9, optimize=True)
+            if os.path.getsize(tmp_path) < original_size:
+                os.replace(tmp_path, image_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return original_size, os.path.getsize(image_path)
+
+
+class ScreenshotOptimizer:
+    """Compress captured screenshots in a thread pool while the remaining frames are captured.
+
+    submit() queues an image as soon as ffmpeg has written it; optimize() waits for one image
+    and wait_all() for everything queued. The pool is started on first use and can be closed
+    and reopened. Threads rather than processes, so no worker re-imports upload.py under the
+    spawn start method (Windows, macOS) and kill_all_child_processes() has nothing to kill.
+    """
+
+    def __init__(self, workers: int, img_host: Optional[str], enabled: bool = True, debug: bool = False) -> None:
+        self.workers = max(1, workers)
+        self.budget = host_byte_budget(img_host)
+        # Without oxipng only images over the host's budget are worth the Pillow re-encode
+        self.enabled = enabled and (self.budget is not None or oxipng_available())
+        self.debug = debug
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: dict[str, asyncio.Future[tuple[int, int]]] = {}
+        self._sizes: dict[str, tuple[int, int]] = {}
+
+    def submit(self, image_path: str) -> None:
+        if not self.enabled or image_path in self._jobs:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pngoptimize")
+        self._jobs[image_path] = asyncio.get_running_loop().run_in_executor(self._executor, optimize_png, image_path, self.budget)
+
+    async def optimize(self, image_path: str) -> tuple[int, int]:
+        """(captured, current) size of image_path once its optimization has finished."""
+        self._sizes.pop(image_path, None)
+        self.submit(image_path)
+        job = self._jobs.pop(image_path, None)
+        if job is not None:
+            await self._collect([(image_path, job)])
+        if image_path in self._sizes:
+            return self._sizes[image_path]
+        size = await asyncio.to_thread(os.path.getsize, image_path)
+        return size, size
+
+    async def wait_all(self) -> None:
+        jobs = list(self._jobs.items())
+        self._jobs.clear()
+        await self._collect(jobs)
+
+    async def _collect(self, jobs: list[tuple[str, "asyncio.Future[tuple[int, int]]"]]) -> None:
+        results = await asyncio.gather(*[job for _, job in jobs], return_exceptions=True)
+        for (image_path, _), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                console.print(f"[yellow]Screenshot optimization failed for {image_path}: {result}[/yellow]")
+                continue
+            self._sizes[image_path] = result
+            if self.debug:
+                before, after = result
+                console.print(f"[cyan]Optimized {os.path.basename(image_path)}: {before} -> {after} bytes ({(before - after) / max(before, 1):.1%} saved)[/cyan]")
+
+    def captured_size(self, image_path: str) -> Optional[int]:
+        """Size ffmpeg wrote, before optimization; blank-frame checks rely on it."""
+        sizes = self._sizes.get(image_path)
+        return sizes[0] if sizes else None
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -134,6 +134,7 @@ class Prep:
         meta['keep_images'] = bool(self.config['DEFAULT'].get('keep_images', True) if not meta.get('keep_images') else True)
         mkbrr_threads = self.config['DEFAULT'].get('mkbrr_threads', "0")
         meta['mkbrr_threads'] = mkbrr_threads
+        meta['piece_layer_cache'] = self.config['DEFAULT'].get('piece_layer_cache', 'trackers')
 
         # make sure these are set in meta
         meta['we_checked_tvdb'] = False
@@ -8,6 +8,11 @@ import aiohttp
 import qbittorrentapi
 
 from src.console import console
+from src.torrent_clients.qbit_index import qbit_client_key
+from src.torrent_clients.qbit_sync import QbitSyncWatcher, get_sync_watcher
+
+COMPLETED_STATES = {'pausedUP', 'seeding', 'completed', 'stalledUP', 'uploading'}
+CHECKING_STATES = ('checkingUP', 'checkingDL', 'checkingResumeData')
 
 
 class Wait:
@@ -18,8 +23,15 @@ class Wait:
         self.qbt_proxy_url: Optional[str] = None
         self.qbt_session: Optional[aiohttp.ClientSession] = None
         self.qbt_client: Optional[qbittorrentapi.Client] = None
+        self.client_key = ''
+        self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.qbt_client = self._connect_qbittorrent()
 
+    def _watcher(self) -> QbitSyncWatcher:
+        if self.qbt_client is None:
+            raise RuntimeError("qbt_client is not initialized")
+        return get_sync_watcher(self.base_dir, self.client_key, self.qbt_client)
+
     def _connect_qbittorrent(self) -> Optional[qbittorrentapi.Client]:
         config_map = self.config
         default_section = cast(dict[str, Any], config_map.get('DEFAULT', {}))
@@ -67,6 +79,7 @@ class Wait:
             password_value = client.get('qbit_pass')
             username = str(username_value) if username_value is not None else None
             password = str(password_value) if password_value is not None else None
+            self.client_key = qbit_client_key(client)
 
             qbt_client = qbittorrentapi.Client(
                 host=host,
@@ -92,36 +105,38 @@ class Wait:
             self.qbt_session = aiohttp.ClientSession()
 
         try:
-            while True:
-                if self.proxy_url:
-                    if self.qbt_session is None:
-                        raise RuntimeError("qbt_session is not initialized")
-                    async with self.qbt_session.get(
-                        f"{self.qbt_proxy_url}/api/v2/torrents/info",
-                        params={'hashes': infohash}
-                    ) as response:
-                        if response.status == 200:
-                            torrents_data = cast(list[dict[str, Any]], await response.json())
-                            target_torrent = torrents_data[0] if torrents_data else None
-                        else:
-                            console.print(f"[ERROR] Failed to get torrent info via proxy: {response.status}", markup=False)
-                            break
+            if not self.proxy_url:
+                # Completion is pushed by the shared sync/maindata stream instead of polling torrents/info
+                torrent = await self._watcher().wait_for(
+                    infohash,
+                    lambda torrent: torrent is None or str(torrent.get('state')) in COMPLETED_STATES
+                )
+                if torrent is None:
+                    console.print(f"[ERROR] Torrent with hash {infohash} not found!", markup=False)
                 else:
-                    if self.qbt_client is None:
-                        raise RuntimeError("qbt_client is not initialized")
-                    torrents = self.qbt_client.torrents_info(hashes=infohash)
-                    target_torrent = next((t for t in torrents if t.hash == infohash), None)
+                    console.print(f"[INFO] Torrent {infohash} has completed!", markup=False)
+                return
 
-                if target_torrent:
-                    if self.proxy_url:
-                        target_dict = cast(dict[str, Any], target_torrent)
-                        state_value = target_dict.get('state')
+            while True:
+                if self.qbt_session is None:
+                    raise RuntimeError("qbt_session is not initialized")
+                async with self.qbt_session.get(
+                    f"{self.qbt_proxy_url}/api/v2/torrents/info",
+                    params={'hashes': infohash}
+                ) as response:
+                    if response.status == 200:
+                        torrents_data = cast(list[dict[str, Any]], await response.json())
+                        target_torrent = torrents_data[0] if torrents_data else None
                     else:
-                        state_value = getattr(target_torrent, 'state', None)
+                        console.print(f"[ERROR] Failed to get torrent info via proxy: {response.status}", markup=False)
+                        break
+
+                if target_torrent:
+                    state_value = target_torrent.get('state')
                     state_str = str(state_value) if state_value is not None else 'unknown'
                     console.print(f"[DEBUG] Torrent {infohash} state: {state_str}", markup=False)
 
-                    if state_str in {'pausedUP', 'seeding', 'completed', 'stalledUP', 'uploading'}:
+                    if state_str in COMPLETED_STATES:
                         console.print(f"[INFO] Torrent {infohash} has completed!", markup=False)
                         return
                 else:
@@ -133,10 +148,49 @@ class Wait:
             if self.qbt_session:
                 await self.qbt_session.close()
 
+    async def _wait_for_recheck_via_proxy(self, torrent_hash: str, check_interval: int) -> tuple[Optional[str], float]:
+        """Poll torrents/info through the qui proxy until the recheck finishes; (None, 0) on failure."""
+        if self.qbt_session is None:
+            console.print("[bold red]qbt_session is not initialized")
+            return None, 0.0
+        if self.qbt_proxy_url is None:
+            console.print("[bold red]Proxy URL is not configured correctly")
+            return None, 0.0
+        while True:
+            async with self.qbt_session.get(
+                f"{self.qbt_proxy_url}/api/v2/torrents/info",
+                params={'hashes': torrent_hash}
+            ) as response:
+                if response.status == 200:
+                    torrents_data = cast(list[dict[str, Any]], await response.json())
+                    if torrents_data:
+                        torrent = torrents_data[0]
+                        state = torrent.get('state')
+                        progress = torrent.get('progress', 0)
+                        state_str = str(state) if state is not None else 'unknown'
+                        try:
+                            progress_float = float(progress or 0)
+                        except (TypeError, ValueError):
+                            progress_float = 0.0
+                    else:
+                        raise Exception("No torrents found in response")
+                else:
+                    console.print(f"[bold red]Failed to get torrent info via proxy: {response.status}")
+                    return None, 0.0
+
+            console.print(f"\r[INFO] Torrent is at {progress_float * 100:.2f}% progress of {state_str}...", end='', markup=False)
+
+            if state_str not in CHECKING_STATES:
+                console.print("", markup=False)
+                return state_str, progress_float
+
+            await asyncio.sleep(check_interval)
+
     async def select_and_recheck_best_torrent(self, meta: dict[str, Any], path: str, check_interval: int = 5) -> bool:
         if not self.proxy_url and not self.qbt_client:
             console.print("[red]qBittorrent is not configured.[/red]")
             return False
+        self.base_dir = str(meta.get('base_dir') or self.base_dir)
 
         torrent_comments = meta.get('torrent_comments')
         if not isinstance(torrent_comments, list):
@@ -211,7 +265,7 @@ class Wait:
                 if self.qbt_client is None:
                     console.print("[bold red]qbt_client is not initialized")
                     return False
-                self.qbt_client.torrents_recheck(torrent_hashes=torrent_hash)
+                await asyncio.to_thread(self.qbt_client.torrents_recheck, torrent_hashes=torrent_hash)
 
             await asyncio.sleep(3)
         except Exception as e:
@@ -219,109 +273,29 @@ class Wait:
             return False
 
         try:
-            while True:
-                if self.proxy_url:
-                    if self.qbt_session is None:
-                        console.print("[bold red]qbt_session is not initialized")
-                        return False
-                    if self.qbt_proxy_url is None:
-                        console.print("[bold red]Proxy URL is not configured correctly")
-                        return False
-                    async with self.qbt_session.get(
-                        f"{self.qbt_proxy_url}/api/v2/torrents/info",
-                        params={'hashes': torrent_hash}
-                    ) as response:
-                        if response.status == 200:
-                            torrents_data = cast(list[dict[str, Any]], await response.json())
-                            if torrents_data:
-                                torrent = torrents_data[0]
-                                state = torrent.get('state')
-                                progress = torrent.get('progress', 0)
-                                state_str = str(state) if state is not None else 'unknown'
-                                try:
-                                    progress_float = float(progress or 0)
-                                except (TypeError, ValueError):
-                                    progress_float = 0.0
-                            else:
-                                raise Exception("No torrents found in response")
-                        else:
-                            console.print(f"[bold red]Failed to get torrent info via proxy: {response.status}")
-                            return False
-                else:
-                    if self.qbt_client is None:
-                        console.print("[bold red]qbt_client is not initialized")
-                        return False
-                    torrent_list_raw = cast(Any, self.qbt_client.torrents_info(hashes=torrent_hash))
-                    if torrent_list_raw is None:
-                        raise Exception("qBittorrent returned no torrent info")
-                    if isinstance(torrent_list_raw, list):
-                        torrent_candidates = cast(list[Any], torrent_list_raw)
-                    elif isinstance(torrent_list_raw, tuple):
-                        torrent_candidates = list(cast(tuple[Any, ...], torrent_list_raw))
-                    else:
-                        torrent_candidates = [torrent_list_raw]
-                    if not torrent_candidates:
-                        raise Exception("No torrents found in TorrentInfoList")
-                    torrent = torrent_candidates[0]
-                    state = getattr(torrent, 'state', None)
-                    progress = getattr(torrent, 'progress', 0)
-                    state_str = str(state) if state is not None else 'unknown'
-                    progress_float = float(progress or 0)
-
-                console.print(f"\r[INFO] Torrent is at {progress_float * 100:.2f}% progress of {state_str}...", end='', markup=False)
-
-                if state_str not in ('checkingUP', 'checkingDL', 'checkingResumeData'):
-                    console.print("", markup=False)
-                    break
-
-                await asyncio.sleep(check_interval)
-
-            # Get final torrent info
             if self.proxy_url:
-                if self.qbt_session is None:
-                    console.print("[bold red]qbt_session is not initialized")
-                    return False
-                if self.qbt_proxy_url is None:
-                    console.print("[bold red]Proxy URL is not configured correctly")
+                final_state, final_progress = await self._wait_for_recheck_via_proxy(torrent_hash, check_interval)
+                if final_state is None:
                     return False
-                async with self.qbt_session.get(
-                    f"{self.qbt_proxy_url}/api/v2/torrents/info",
-                    params={'hashes': torrent_hash}
-                ) as response:
-                    if response.status == 200:
-                        torrents_data = cast(list[dict[str, Any]], await response.json())
-                        if torrents_data:
-                            torrent = torrents_data[0]
-                            final_state = torrent.get('state')
-                            final_progress = torrent.get('progress', 0)
-                        else:
-                            raise Exception("No torrents found in response")
-                    else:
-                        console.print(f"[bold red]Failed to get final torrent info via proxy: {response.status}")
-                        return False
             else:
-                if self.qbt_client is None:
-                    console.print("[bold red]qbt_client is not initialized")
-                    return False
-                torrent_list_raw = cast(Any, self.qbt_client.torrents_info(hashes=torrent_hash))
-                if torrent_list_raw is None:
-                    raise Exception("qBittorrent returned no torrent info")
-                if isinstance(torrent_list_raw, list):
-                    torrent_candidates = cast(list[Any], torrent_list_raw)
-                elif isinstance(torrent_list_raw, tuple):
-                    torrent_candidates = list(cast(tuple[Any, ...], torrent_list_raw))
-                else:
-                    torrent_candidates = [torrent_list_raw]
-                if not torrent_candidates:
-                    raise Exception("No torrents found in TorrentInfoList")
-                torrent = torrent_candidates[0]
-                final_state = getattr(torrent, 'state', 'unknown')
-                final_progress = float(getattr(torrent, 'progress', 0) or 0)
+                def report_recheck(torrent: Optional[dict[str, Any]]) -> bool:
+                    if torrent is None:
+                        raise Exception("Torrent disappeared from qBittorrent during recheck")
+                    state_str = str(torrent.get('state', 'unknown'))
+                    progress_float = float(torrent.get('progress', 0) or 0)
+                    console.print(f"\r[INFO] Torrent is at {progress_float * 100:.2f}% progress of {state_str}...", end='', markup=False)
+                    return state_str not in CHECKING_STATES
+
+                # Progress and the final state arrive through the shared sync/maindata stream
+                torrent = await self._watcher().wait_for(torrent_hash, report_recheck)
+                console.print("", markup=False)
+                final_state = (torrent or {}).get('state', 'unknown')
+                final_progress = float((torrent or {}).get('progress', 0) or 0)
 
             console.print(f"[green]Recheck completed. State: {final_state}, Progress: {final_progress*100:.2f}%[/green]")
             meta['we_rechecked_torrent'] = True
 
-            if final_state not in {'pausedUP', 'seeding', 'completed', 'stalledUP', 'uploading'}:
+            if final_state not in COMPLETED_STATES:
                 console.print("[yellow]Torrent needs to download missing data. Waiting for completion...[/yellow]")
                 await self.wait_for_completion(torrent_hash, check_interval)
 
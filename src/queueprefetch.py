@@ -0,0 +1,212 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import contextlib
+import glob
+import json
+import os
+import time
+from collections.abc import Sequence
+from typing import Any, Optional, cast
+
+from src.console import console
+from src.exportmi import mediainfo_cache_path, parse_mediainfo_outputs, store_cached_mediainfo
+from src.piececache import load_piece_layer, piece_layer_cache_enabled, piece_layer_sizes, store_piece_layers
+from src.piecehasher import hash_piece_layers
+from src.pipeline import protect_task
+from src.torrentcreate import TorrentCreator
+
+VIDEO_EXTENSIONS = ('.mkv', '.mp4', '.ts')
+# Mirrors TorrentCreator.create_torrent's globs for non-disc content without --keep-folder/--keep-nfo
+TORRENT_INCLUDE = ["*.mkv", "*.mp4", "*.ts"]
+TORRENT_EXCLUDE = ["*.*", "*sample.mkv", "!sample*.*"]
+# Hash with a single worker so look-ahead never takes the cores the current item needs
+PREFETCH_HASH_THREADS = 1
+
+
+def queue_lookahead_depth(config: dict[str, Any], meta: dict[str, Any]) -> int:
+    """How many upcoming queue items to prepare in the background (0 disables look-ahead)."""
+    value = meta.get('queue_lookahead')
+    if value is None:
+        value = config['DEFAULT'].get('queue_lookahead', 1)
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def lookahead_torrent_meta(config: dict[str, Any], meta: dict[str, Any]) -> dict[str, Any]:
+    """The queue-wide settings that decide an item's BASE piece size and piece-layer cache entry."""
+    trackers: Any = meta.get('trackers') or config.get('TRACKERS', {}).get('default_trackers', '')
+    if isinstance(trackers, str):
+        trackers = trackers.split(',')
+    return {
+        'base_dir': meta.get('base_dir'),
+        'trackers': [str(t).strip().upper() for t in cast(list[Any], trackers) if str(t).strip()],
+        'piece_layer_cache': config['DEFAULT'].get('piece_layer_cache', 'trackers'),
+        'max_piece_size': meta.get('max_piece_size', 0),
+        'keep_folder': bool(meta.get('keep_folder')),
+        'randomized': meta.get('randomized', 0),
+    }
+
+
+def torrent_layout(path: str) -> Optional[tuple[str, list[str], list[str]]]:
+    """(path, include, exclude) that create_torrent will pass for a queue item's BASE torrent.
+
+    Discs are skipped like in first_video(). A folder holding one video becomes a single-file
+    torrent of that video; anything else keeps the folder with the video globs.
+    """
+    path = os.path.abspath(path)
+    if os.path.isfile(path):
+        return (path, TORRENT_INCLUDE, TORRENT_EXCLUDE) if path.lower().endswith(VIDEO_EXTENSIONS) else None
+    if not os.path.isdir(path):
+        return None
+    try:
+        entries = os.listdir(path)
+    except OSError:
+        return None
+    if any(entry.upper() in ('BDMV', 'VIDEO_TS') for entry in entries):
+        return None
+    videos = [
+        os.path.basename(f)
+        for extension in ('*.mkv', '*.mp4', '*.ts')
+        for f in glob.glob(os.path.join(glob.escape(path), extension))
+    ]
+    no_sample = [f for f in videos if not f.lower().endswith('sample.mkv') or "!sample" in f.lower()]
+    if not no_sample:
+        return None
+    if len(no_sample) == 1:
+        video = first_video(path)
+        if video is None:
+            return None
+        return video, TORRENT_INCLUDE, TORRENT_EXCLUDE
+    return path, TORRENT_INCLUDE, TORRENT_EXCLUDE
+
+
+def first_video(path: str) -> Optional[str]:
+    """Mirror VideoManager.get_video's pick for a queue item, minus its prompts.
+
+    Discs are skipped: their MediaInfo target depends on the playlist/IFO chosen during prep.
+    """
+    if os.path.isfile(path):
+        return path if path.lower().endswith(VIDEO_EXTENSIONS) else None
+    if not os.path.isdir(path):
+        return None
+    try:
+        entries = sorted(os.listdir(path))
+    except OSError:
+        return None
+    if any(entry.upper() in ('BDMV', 'VIDEO_TS') for entry in entries):
+        return None
+    for entry in entries:
+        lowered = entry.lower()
+        if not lowered.endswith(VIDEO_EXTENSIONS):
+            continue
+        if 'sample' in lowered and '!sample' not in lowered:
+            continue
+        candidate = os.path.abspath(os.path.join(path, entry))
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+class QueuePrefetcher:
+    """Warm the per-file caches of upcoming queue items while the current item uploads.
+
+    Only work that never prompts and never touches tmp/<uuid> or the processed-files log
+    runs ahead: MediaInfo, then the BASE piece layers (see src/piececache.py). Prep still
+    runs in queue order and picks the results up from the caches.
+    """
+
+    def __init__(self, base_dir: str, depth: int, debug: bool = False, torrent_meta: Optional[dict[str, Any]] = None) -> None:
+        self.base_dir = base_dir
+        self.depth = depth
+        self.debug = debug
+        self.torrent_meta = {**(torrent_meta or {}), 'base_dir': base_dir, 'debug': False}
+        # Read from the hashing thread, which stops at its next progress callback once set
+        self._closing = False
+        self._scheduled: set[str] = set()
+        self._tasks: list[asyncio.Task[None]] = []
+        # One item at a time: look-ahead should only soak up idle I/O, not compete with the current item.
+        self._slot = asyncio.Semaphore(1)
+
+    def schedule(self, upcoming: Sequence[Any]) -> None:
+        for item in upcoming[:self.depth]:
+            path = item if isinstance(item, str) else str(item)
+            if not path or path in self._scheduled:
+                continue
+            self._scheduled.add(path)
+            task = asyncio.create_task(self._prefetch(path), name=f"prefetch:{os.path.basename(path)}")
+            protect_task(task)
+            self._tasks.append(task)
+        self._tasks = [task for task in self._tasks if not task.done()]
+
+    async def _prefetch(self, path: str) -> None:
+        async with self._slot:
+            try:
+                await self._warm_mediainfo(path)
+                await self._warm_piece_layers(path)
+            except Exception as e:
+                if self.debug:
+                    console.print(f"[yellow]Look-ahead for {os.path.basename(path)} failed: {e}[/yellow]")
+
+    def _mediainfo_target(self, path: str) -> Optional[tuple[str, str]]:
+        video = first_video(path)
+        if video is None:
+            return None
+        cache_path = mediainfo_cache_path(self.base_dir, video)
+        if cache_path is None or os.path.exists(cache_path):
+            return None
+        return video, cache_path
+
+    async def _warm_mediainfo(self, path: str) -> None:
+        target = await asyncio.to_thread(self._mediainfo_target, path)
+        if target is None:
+            return
+        video, cache_path = target
+        text, json_text = await asyncio.to_thread(parse_mediainfo_outputs, video)
+        data = cast(dict[str, Any], json.loads(json_text))
+        await asyncio.to_thread(store_cached_mediainfo, cache_path, video, text, data, False)
+        if self.debug:
+            console.print(f"[cyan]Look-ahead: MediaInfo ready for {os.path.basename(video)}[/cyan]")
+
+    def _hash_progress(self, _filepath: str, _pieces_done: int, _pieces_total: int) -> Optional[object]:
+        # Pause while the current item creates a torrent so both don't fight over the disk
+        while TorrentCreator.creating() and not self._closing:
+            time.sleep(0.5)
+        return True if self._closing else None
+
+    def _hash_piece_layers(self, path: str) -> Optional[str]:
+        meta = self.torrent_meta
+        if meta.get('keep_folder') or int(meta.get('randomized') or 0) >= 1 or not piece_layer_cache_enabled(meta):
+            return None
+        layout = torrent_layout(path)
+        if layout is None:
+            return None
+        content, include, exclude = layout
+        torrent = TorrentCreator.build_custom_torrent(meta, content, include, exclude, meta.get('max_piece_size') or 0)
+        content_files = torrent.content_files()
+        total_size = sum(size for _, _, size in content_files)
+        layer_dir = torrent.piece_layer_dir()
+        if layer_dir is None or total_size < 1 or load_piece_layer(layer_dir, torrent.piece_size, total_size) is not None:
+            return None
+        files = [(disk_path, size) for _, disk_path, size in content_files]
+        sizes = [torrent.piece_size, *piece_layer_sizes(meta, torrent.piece_size)]
+        layers = hash_piece_layers(files, sizes, threads=PREFETCH_HASH_THREADS, callback=self._hash_progress)
+        if layers is None:
+            return None
+        store_piece_layers(layer_dir, layers, debug=self.debug)
+        return content
+
+    async def _warm_piece_layers(self, path: str) -> None:
+        content = await asyncio.to_thread(self._hash_piece_layers, path)
+        if content is not None and self.debug:
+            console.print(f"[cyan]Look-ahead: piece layers ready for {os.path.basename(content)}[/cyan]")
+
+    async def aclose(self) -> None:
+        self._closing = True
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        self._tasks.clear()
@@ -12,6 +12,7 @@ import aiofiles
 from aiofiles import os as aio_os
 
 from src.console import console
+from src.imageprobe import fetch_deferred_images
 from src.takescreens import TakeScreensManager
 from src.type_utils import to_int
 from src.uploadscreens import UploadScreensManager
@@ -319,6 +320,7 @@ async def _handle_image_upload(
 
     # First check if there are any saved screenshots matching those in the image_list
     if meta.get('image_list') and isinstance(meta['image_list'], list):
+        await fetch_deferred_images(meta)
         # Get all PNG files in the screenshots directory
         all_png_files: list[str] = [file for file in await aio_os.listdir(screenshots_dir) if file.endswith('.png')]
         if all_png_files and meta.get('debug'):
@@ -10,8 +10,7 @@ import re
 import sys
 import time
 import traceback
-from collections.abc import Awaitable, Mapping
-from pathlib import Path
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from typing import Any, Optional, Union, cast
 
 import ffmpeg
@@ -20,6 +19,9 @@ from pymediainfo import MediaInfo
 
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.exportmi import get_mediainfo_json
+from src.keyframeindex import cached_keyframe_index, keyframe_index
+from src.pngoptimize import ScreenshotOptimizer
 
 default_config: dict[str, Any] = {}
 task_limit = 1
@@ -31,12 +33,16 @@ tone_map = False
 ffmpeg_compression = "6"
 algorithm = "mobius"
 desat = 10.0
+single_pass_screens = True
+snap_keyframes = True
+optimize_screens = True
 
 
 def _apply_config(config: Mapping[str, Any]) -> None:
     global default_config, task_limit, cutoff
     global ffmpeg_limit, ffmpeg_is_good, use_libplacebo
-    global tone_map, ffmpeg_compression, algorithm, desat
+    global tone_map, ffmpeg_compression, algorithm, desat, single_pass_screens, snap_keyframes
+    global optimize_screens
 
     default_section = config.get('DEFAULT', {})
     default_config = cast(dict[str, Any], default_section) if isinstance(default_section, Mapping) else {}
@@ -61,9 +67,12 @@ def _apply_config(config: Mapping[str, Any]) -> None:
         desat = float(default_config.get('desat', 10.0))
     except (TypeError, ValueError):
         desat = 10.0
+    single_pass_screens = bool(default_config.get('single_pass_screenshots', True))
+    snap_keyframes = bool(default_config.get('snap_screenshots_to_keyframes', True))
+    optimize_screens = bool(default_config.get('optimize_screenshots', True))
 
 
-async def run_ffmpeg(command: Any) -> tuple[Optional[int], bytes, bytes]:
+def ffmpeg_binary() -> str:
     # On Linux prefer bundled amd/arm binary when present; otherwise fall back to system ffmpeg.
     if platform.system() == 'Linux':
         base_dir = os.path.dirname(os.path.dirname(__file__))
@@ -80,25 +89,24 @@ async def run_ffmpeg(command: Any) -> tuple[Optional[int], bytes, bytes]:
         if arch:
             candidate = os.path.join(ff_bin_dir, arch, 'ffmpeg')
             if os.path.exists(candidate):
-                cmd_list = list(command.compile())
-                cmd_list[0] = candidate
+                return candidate
+    return 'ffmpeg'
 
-                process = await asyncio.create_subprocess_exec(
-                    *cmd_list,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await process.communicate()
-                return (process.returncode if process.returncode is not None else -1), stdout, stderr
 
-    # Fallback: use system/default ffmpeg (command.compile())
+async def run_ffmpeg_args(args: list[str]) -> tuple[Optional[int], bytes, bytes]:
+    """Run ffmpeg with `args` (everything after the binary name)."""
     process = await asyncio.create_subprocess_exec(
-        *command.compile(),
+        ffmpeg_binary(),
+        *args,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE
     )
     stdout, stderr = await process.communicate()
-    return process.returncode, stdout, stderr
+    return (process.returncode if process.returncode is not None else -1), stdout, stderr
+
+
+async def run_ffmpeg(command: Any) -> tuple[Optional[int], bytes, bytes]:
+    return await run_ffmpeg_args(list(command.compile())[1:])
 
 
 async def sanitize_filename(filename: str) -> str:
@@ -382,7 +390,7 @@ async def disc_screenshots(
         one_disc = False
 
     if (not meta.get('tv_pack') and one_disc) or multi_screens == 0:
-        await cleanup_manager.cleanup()
+        await cleanup_manager.cleanup_between_stages()
 
 
 async def capture_disc_task(index: int, file: str, ss_time: str, image_path: str, keyframe: str, loglevel: str, hdr_tonemap: bool, meta: dict[str, Any]) -> Optional[tuple[int, str]]:
@@ -399,49 +407,7 @@ async def capture_disc_task(index: int, file: str, ss_time: str, image_path: str
             ])
 
         if meta.get('frame_overlay', False):
-            # Get frame info from pre-collected data if available
-            frame_info = meta.get('frame_info_map', {}).get(ss_time, {})
-
-            frame_rate = meta.get('frame_rate', 24.0)
-            frame_number = int(float(ss_time) * frame_rate)
-
-            # If we have PTS time from frame info, use it to calculate a more accurate frame number
-            if 'pts_time' in frame_info:
-                # Only use PTS time for frame number calculation if it makes sense
-                # (sometimes seeking can give us a frame from the beginning instead of where we want)
-                pts_time = frame_info.get('pts_time', 0)
-                if pts_time > 1.0 and abs(pts_time - ss_time) < 10:
-                    frame_number = int(pts_time * frame_rate)
-
-            frame_type = frame_info.get('frame_type', 'Unknown')
-
-            text_size = int(default_config.get('overlay_text_size', 18))
-            # Get the resolution and convert it to integer
-            resol = int(''.join(filter(str.isdigit, meta.get('resolution', '1080p'))))
-            font_size = round(text_size*resol/1080)
-            x_all = round(10*resol/1080)
-
-            # Scale vertical spacing based on font size
-            line_spacing = round(font_size * 1.1)
-            y_number = x_all
-            y_type = y_number + line_spacing
-            y_hdr = y_type + line_spacing
-
-            # Frame number
-            vf_filters.append(
-                f"drawtext=text='Frame Number\\: {frame_number}':fontcolor=white:fontsize={font_size}:x={x_all}:y={y_number}:box=1:boxcolor=black@0.5"
-            )
-
-            # Frame type
-            vf_filters.append(
-                f"drawtext=text='Frame Type\\: {frame_type}':fontcolor=white:fontsize={font_size}:x={x_all}:y={y_type}:box=1:boxcolor=black@0.5"
-            )
-
-            # HDR status
-            if hdr_tonemap:
-                vf_filters.append(
-                    f"drawtext=text='Tonemapped HDR':fontcolor=white:fontsize={font_size}:x={x_all}:y={y_hdr}:box=1:boxcolor=black@0.5"
-                )
+            vf_filters.extend(overlay_filters(ss_time, hdr_tonemap, meta))
 
         # Build command
         # Always ensure at least format filter is present for PNG compression to work
@@ -751,7 +717,7 @@ async def dvd_screenshots(
         one_disc = False
 
     if (not meta.get('tv_pack') and one_disc) or multi_screens == 0:
-        await cleanup_manager.cleanup()
+        await cleanup_manager.cleanup_between_stages()
 
 
 async def capture_dvd_screenshot(task: tuple[int, str, str, str, dict[str, Any], float, float, float, float]) -> tuple[int, Optional[str]]:
@@ -865,7 +831,13 @@ async def screenshots(
         num_screens: int = 0,
         force_screenshots: bool = False,
         manual_frames: Union[str, list[str]] = "",
+        on_screenshot: Optional[Callable[[int, str], None]] = None,
 ) -> Union[list[str], None]:
+    """Capture, optimize and size-check screenshots of `path` into tmp/<folder_id>.
+
+    on_screenshot(index, image_path) is called for each image as soon as it has passed the
+    size checks, so uploads can start while the remaining frames are still being captured.
+    """
     img_host = await get_image_host(meta)
     screens = meta['screens']
     start_time = time.time() if meta.get('debug') else 0.0
@@ -886,8 +858,7 @@ async def screenshots(
         return None
 
     try:
-        mi_text = await asyncio.to_thread(Path(f"{base_dir}/tmp/{folder_id}/MediaInfo.json").read_text, encoding='utf-8')
-        mi = json.loads(mi_text)
+        mi = await get_mediainfo_json(meta, base_dir, folder_id)
         video_track = mi['media']['track'][1]
 
         def safe_float(value: Any, default: float = 0.0, field_name: str = "") -> float:
@@ -983,6 +954,8 @@ async def screenshots(
 
     if not ss_times:
         ss_times = await valid_ss_time([], num_capture, length, frame_rate, meta, retake=force_screenshots)
+        if snap_keyframes:
+            ss_times = await snap_to_keyframes(path, ss_times, base_dir, meta)
 
     if meta.get('frame_overlay', False):
         if meta['debug']:
@@ -1048,23 +1021,55 @@ async def screenshots(
     # Create semaphore to limit concurrent tasks
     semaphore = asyncio.Semaphore(num_workers)
 
+    # Captured frames are compressed in worker processes while the remaining frames are captured
+    optimizer = ScreenshotOptimizer(num_workers, img_host, enabled=optimize_screens, debug=meta['debug'])
+    streamed: set[str] = set()
+    stream_checks: list[asyncio.Task[None]] = []
+
+    async def stream_screenshot(image_path: str) -> None:
+        captured_size, image_size = await optimizer.optimize(image_path)
+        if on_screenshot is not None and (manual_frames or screenshot_size_ok(img_host, captured_size, image_size)):
+            streamed.add(image_path)
+            on_screenshot(screenshot_index(image_path), image_path)
+
+    def on_captured(image_path: str) -> None:
+        optimizer.submit(image_path)
+        if on_screenshot is not None:
+            stream_checks.append(asyncio.create_task(stream_screenshot(image_path)))
+
     async def capture_with_semaphore(args: tuple[int, str, float, str, float, float, float, float, str, bool, dict[str, Any]]) -> Optional[tuple[int, Optional[str]]]:
         async with semaphore:
-            return await capture_screenshot(args)
+            result = await capture_screenshot(args)
+        if result and result[1]:
+            on_captured(result[1])
+        return result
 
-    capture_tasks: list[Awaitable[Optional[tuple[int, Optional[str]]]]] = []
+    pending_captures: list[tuple[int, float, str]] = []
     for i in range(num_capture):
         image_index = existing_images_count + i
         image_path = os.path.abspath(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{image_index}.png")
         if not os.path.exists(image_path) or meta.get('retake', False):
-            capture_tasks.append(
-                capture_with_semaphore(
-                    (i, path, float(ss_times[i]), image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
-                )
-            )
+            pending_captures.append((i, float(ss_times[i]), image_path))
 
     try:
-        results = cast(list[object], await asyncio.gather(*capture_tasks, return_exceptions=True))
+        results: list[object] = []
+        if single_pass_screens and len(pending_captures) > 1:
+            # One ffmpeg per worker grabs all of its frames; anything it misses is retried per frame below
+            single_pass_results = await capture_screenshots_batched(
+                path, pending_captures, num_workers, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta,
+                on_captured=on_captured
+            )
+            captured_indexes = {index for index, image_path in single_pass_results if image_path}
+            results.extend(result for result in single_pass_results if result[0] in captured_indexes)
+            pending_captures = [target for target in pending_captures if target[0] not in captured_indexes]
+            if meta['debug']:
+                console.print(f"[cyan]Single-pass capture produced {len(captured_indexes)} screenshot(s), {len(pending_captures)} left for per-frame capture")
+
+        capture_tasks: list[Awaitable[Optional[tuple[int, Optional[str]]]]] = [
+            capture_with_semaphore((i, path, ss_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta))
+            for i, ss_time, image_path in pending_captures
+        ]
+        results.extend(cast(list[object], await asyncio.gather(*capture_tasks, return_exceptions=True)))
         # Log any error strings that were returned (these indicate exceptions in capture_screenshot)
         for r in results:
             if isinstance(r, Exception):
@@ -1076,6 +1081,8 @@ async def screenshots(
         ]
         capture_result_tuples.sort(key=lambda x: x[0])
         capture_results: list[str] = [r[1] for r in capture_result_tuples if r[1] is not None]
+        await optimizer.wait_all()
+        await asyncio.gather(*stream_checks, return_exceptions=True)
 
     except KeyboardInterrupt:
         console.print("\n[red]CTRL+C detected. Cancelling capture tasks...[/red]")
@@ -1098,6 +1105,7 @@ async def screenshots(
         cleanup_manager.reset_terminal()
         sys.exit(1)
     finally:
+        optimizer.close()
         await asyncio.sleep(0.1)
         await kill_all_child_processes()
         if meta['debug']:
@@ -1114,7 +1122,8 @@ async def screenshots(
         if meta['debug']:
             console.print(f"[yellow]Checking image {image_path} (size: {image_size} bytes) for image host: {img_host}[/yellow]")
         if not manual_frames:
-            if image_size <= 75000:
+            # The blank-frame check looks at what ffmpeg wrote, not the optimized file
+            if (optimizer.captured_size(image_path) or image_size) <= 75000:
                 console.print(f"[yellow]Image {image_path} is incredibly small, retaking.")
                 retake = True
             else:
@@ -1167,18 +1176,18 @@ async def screenshots(
                             if not screenshot_path or not os.path.exists(screenshot_path):
                                 continue
 
-                            new_size = os.path.getsize(screenshot_path)
+                            captured_size, new_size = await optimizer.optimize(screenshot_path)
                             valid_image = False
 
                             if img_host and "imgbb" in img_host:
-                                if 75000 < new_size <= 31000000:
+                                if captured_size > 75000 and new_size <= 31000000:
                                     console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
                                     valid_image = True
                             elif img_host and img_host in ["imgbox", "pixhost"]:
-                                if 75000 < new_size <= 10000000:
+                                if captured_size > 75000 and new_size <= 10000000:
                                     console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
                                     valid_image = True
-                            elif img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"] and new_size > 75000:
+                            elif img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"] and captured_size > 75000:
                                 console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
                                 valid_image = True
 
@@ -1210,16 +1219,16 @@ async def screenshots(
                         if not screenshot_path or not os.path.exists(screenshot_path):
                             continue
 
-                        new_size = os.path.getsize(screenshot_path)
+                        captured_size, new_size = await optimizer.optimize(screenshot_path)
                         valid_image = False
 
                         if img_host and "imgbb" in img_host:
-                            if 75000 < new_size <= 31000000:
+                            if captured_size > 75000 and new_size <= 31000000:
                                 valid_image = True
                         elif img_host and img_host in ["imgbox", "pixhost"]:
-                            if 75000 < new_size <= 10000000:
+                            if captured_size > 75000 and new_size <= 10000000:
                                 valid_image = True
-                        elif img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"] and new_size > 75000:
+                        elif img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"] and captured_size > 75000:
                             valid_image = True
 
                         if valid_image:
@@ -1235,6 +1244,12 @@ async def screenshots(
         else:
             valid_results.append(image_path)
 
+    optimizer.close()
+    if on_screenshot is not None:
+        # Retaken images are only known to be good now
+        for image_path in valid_results:
+            if image_path not in streamed:
+                on_screenshot(screenshot_index(image_path), image_path)
     if remaining_retakes:
         console.print(f"[red]The following images could not be retaken successfully: {remaining_retakes}[/red]")
 
@@ -1254,11 +1269,76 @@ async def screenshots(
         one_disc = False
 
     if (not meta.get('tv_pack') and one_disc) or multi_screens == 0:
-        await cleanup_manager.cleanup()
+        await cleanup_manager.cleanup_between_stages()
 
     return valid_results if valid_results else None
 
 
+def screenshot_index(image_path: str) -> int:
+    return int(image_path.rsplit('-', 1)[-1].split('.')[0])
+
+
+def screenshot_size_ok(img_host: Optional[str], captured_size: int, image_size: int) -> bool:
+    """The size checks screenshots() applies before uploading, without the retake messages."""
+    if captured_size <= 75000:
+        return False
+    if img_host and "imgbb" in img_host:
+        return image_size <= 31000000
+    if img_host and img_host in ["imgbox", "pixhost"]:
+        return 75000 < image_size <= 10000000
+    return bool(img_host) and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"]
+
+
+def overlay_filters(ss_time: float, hdr_tonemap: bool, meta: dict[str, Any]) -> list[str]:
+    """drawtext filters stamping frame number, frame type and tonemap status onto a screenshot."""
+    vf_filters: list[str] = []
+    # Get frame info from pre-collected data if available
+    frame_info = meta.get('frame_info_map', {}).get(ss_time, {})
+
+    frame_rate = meta.get('frame_rate', 24.0)
+    frame_number = int(float(ss_time) * frame_rate)
+
+    # If we have PTS time from frame info, use it to calculate a more accurate frame number
+    if 'pts_time' in frame_info:
+        # Only use PTS time for frame number calculation if it makes sense
+        # (sometimes seeking can give us a frame from the beginning instead of where we want)
+        pts_time = frame_info.get('pts_time', 0)
+        if pts_time > 1.0 and abs(pts_time - ss_time) < 10:
+            frame_number = int(pts_time * frame_rate)
+
+    frame_type = frame_info.get('frame_type', 'Unknown')
+
+    text_size = int(default_config.get('overlay_text_size', 18))
+    # Get the resolution and convert it to integer
+    resol = int(''.join(filter(str.isdigit, meta.get('resolution', '1080p'))))
+    font_size = round(text_size*resol/1080)
+    x_all = round(10*resol/1080)
+
+    # Scale vertical spacing based on font size
+    line_spacing = round(font_size * 1.1)
+    y_number = x_all
+    y_type = y_number + line_spacing
+    y_hdr = y_type + line_spacing
+
+    # Frame number
+    vf_filters.append(
+        f"drawtext=text='Frame Number\\: {frame_number}':fontcolor=white:fontsize={font_size}:x={x_all}:y={y_number}:box=1:boxcolor=black@0.5"
+    )
+
+    # Frame type
+    vf_filters.append(
+        f"drawtext=text='Frame Type\\: {frame_type}':fontcolor=white:fontsize={font_size}:x={x_all}:y={y_type}:box=1:boxcolor=black@0.5"
+    )
+
+    # HDR status
+    if hdr_tonemap:
+        vf_filters.append(
+            f"drawtext=text='Tonemapped HDR':fontcolor=white:fontsize={font_size}:x={x_all}:y={y_hdr}:box=1:boxcolor=black@0.5"
+        )
+
+    return vf_filters
+
+
 async def capture_screenshot(args: tuple[int, str, float, str, float, float, float, float, str, bool, dict[str, Any]]) -> Optional[tuple[int, Optional[str]]]:
     index, path, ss_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta = args
 
@@ -1544,6 +1624,135 @@ async def capture_screenshot(args: tuple[int, str, float, str, float, float, flo
         return None
 
 
+def screenshot_filter_chain(ss_time: float, width: float, height: float, w_sar: float, h_sar: float, hdr_tonemap: bool, meta: dict[str, Any]) -> str:
+    """The per-frame filter chain capture_screenshot() applies, for use inside a -filter_complex graph."""
+    vf_filters: list[str] = []
+    if w_sar != 1 or h_sar != 1:
+        vf_filters.append(f"scale={round_to_even(width * w_sar)}:{round_to_even(height * h_sar)}")
+    if hdr_tonemap:
+        if meta.get('libplacebo', False) and not meta.get('frame_overlay', False):
+            vf_filters.append(
+                "libplacebo=tonemapping=hable:colorspace=bt709:"
+                "color_primaries=bt709:color_trc=bt709:range=tv"
+            )
+        else:
+            vf_filters.extend([
+                "zscale=transfer=linear",
+                f"tonemap=tonemap={algorithm}:desat={desat}",
+                "zscale=transfer=bt709",
+                "format=rgb24",
+            ])
+    if meta.get('frame_overlay', False):
+        vf_filters.extend(overlay_filters(ss_time, hdr_tonemap, meta))
+    vf_filters.append("format=rgb24")
+    return ",".join(vf_filters)
+
+
+def _screenshot_input_path(path: str, meta: dict[str, Any]) -> Optional[str]:
+    path = os.path.normpath(path)
+    if os.path.isdir(path) and meta.get('filelist'):
+        path = meta['filelist'][0]
+    return path if os.path.isfile(path) else None
+
+
+def _collect_single_pass_outputs(targets: Sequence[tuple[int, float, str]], succeeded: bool) -> list[tuple[int, Optional[str]]]:
+    results: list[tuple[int, Optional[str]]] = []
+    for index, _, image_path in targets:
+        captured = succeeded and os.path.exists(image_path) and os.path.getsize(image_path) > 0
+        if not captured and os.path.exists(image_path):
+            # A failed run may leave some outputs behind; the fallback retakes them individually
+            os.remove(image_path)
+        results.append((index, image_path if captured else None))
+    return results
+
+
+async def capture_screenshots_single_pass(
+    path: str,
+    targets: Sequence[tuple[int, float, str]],
+    width: float,
+    height: float,
+    w_sar: float,
+    h_sar: float,
+    loglevel: str,
+    hdr_tonemap: bool,
+    meta: dict[str, Any],
+) -> list[tuple[int, Optional[str]]]:
+    """Capture every (index, ss_time, image_path) target with a single ffmpeg process.
+
+    Each target is its own input with an input-side -ss, so the demuxer jumps to the
+    nearest keyframe instead of decoding up to the timestamp, while process start-up,
+    Vulkan device creation and the filter graph are set up once for all frames. ffmpeg
+    stops reading an input as soon as its single-frame output is written.
+    Targets that did not produce an image come back as (index, None).
+    """
+    if not targets:
+        return []
+    input_path = await asyncio.to_thread(_screenshot_input_path, path, meta)
+    if width <= 0 or height <= 0 or input_path is None:
+        return [(index, None) for index, _, _ in targets]
+    path = input_path
+
+    args = ['-y', '-loglevel', loglevel, '-hide_banner']
+    if hdr_tonemap and meta.get('libplacebo', False) and not meta.get('frame_overlay', False):
+        args += ['-init_hw_device', 'vulkan']
+    graph: list[str] = []
+    for input_index, (_, ss_time, _) in enumerate(targets):
+        if ffmpeg_limit:
+            args += ['-threads', '1']
+        args += ['-ss', str(ss_time), '-i', path]
+        chain = screenshot_filter_chain(ss_time, width, height, w_sar, h_sar, hdr_tonemap, meta)
+        graph.append(f"[{input_index}:v:0]{chain}[shot{input_index}]")
+    args += ['-filter_complex', ";".join(graph)]
+    for input_index, (_, _, image_path) in enumerate(targets):
+        args += ['-map', f'[shot{input_index}]', '-frames:v', '1', '-compression_level', ffmpeg_compression, '-pred', 'mixed', image_path]
+
+    if loglevel == 'verbose' or meta.get('debug', False):
+        console.print(f"[cyan]Single-pass FFmpeg command for {len(targets)} screenshots: ffmpeg {' '.join(args)}[/cyan]", emoji=False)
+
+    try:
+        # Same budget per frame as the per-frame path, which allows 140s for one capture
+        returncode, _stdout, stderr = await asyncio.wait_for(run_ffmpeg_args(args), timeout=140 + 30 * len(targets))
+    except asyncio.TimeoutError:
+        returncode, stderr = -1, b"Timeout"
+
+    results = await asyncio.to_thread(_collect_single_pass_outputs, targets, returncode == 0)
+    if returncode != 0 and (loglevel == 'verbose' or meta.get('debug', False)):
+        console.print(f"[yellow]Single-pass capture failed, falling back to one ffmpeg per frame: {(stderr or b'').decode(errors='replace').strip()[-500:]}[/yellow]")
+    return results
+
+
+async def capture_screenshots_batched(
+    path: str,
+    targets: Sequence[tuple[int, float, str]],
+    workers: int,
+    width: float,
+    height: float,
+    w_sar: float,
+    h_sar: float,
+    loglevel: str,
+    hdr_tonemap: bool,
+    meta: dict[str, Any],
+    on_captured: Optional[Callable[[str], None]] = None,
+) -> list[tuple[int, Optional[str]]]:
+    """Split targets over `workers` single-pass ffmpeg processes, keeping process_limit parallelism.
+
+    on_captured is called with each image path as soon as the process that wrote it exits.
+    """
+    workers = max(1, min(workers, len(targets)))
+    batches = [list(targets[i::workers]) for i in range(workers)]
+
+    async def run_batch(batch: list[tuple[int, float, str]]) -> list[tuple[int, Optional[str]]]:
+        results = await capture_screenshots_single_pass(path, batch, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+        if on_captured is not None:
+            for _, image_path in results:
+                if image_path:
+                    on_captured(image_path)
+        return results
+
+    batch_results = await asyncio.gather(*[run_batch(batch) for batch in batches if batch])
+    return [result for batch in batch_results for result in batch]
+
+
 async def valid_ss_time(ss_times: list[str], num_screens: int, length: float, frame_rate: float, meta: dict[str, Any], retake: bool = False) -> list[str]:
     total_screens = num_screens + 1 if meta['is_disc'] else num_screens
     total_frames = int(length * frame_rate)
@@ -1618,8 +1827,42 @@ async def kill_all_child_processes() -> None:
         console.print(f"[yellow]Warning: Error during child process cleanup: {e}[/yellow]")
 
 
+async def snap_to_keyframes(path: str, ss_times: list[str], base_dir: str, meta: dict[str, Any]) -> list[str]:
+    """Move each screenshot time onto the first keyframe after it so the seek decodes a single frame.
+
+    Times with no keyframe within KEYFRAME_WINDOW, or that would land on a keyframe already
+    taken by another screenshot, are kept as they are.
+    """
+    wanted = [float(ss_time) for ss_time in ss_times]
+    index = await keyframe_index(ffmpeg_binary(), base_dir, path, wanted, meta.get('debug', False))
+    if index is None:
+        return ss_times
+
+    snapped: list[str] = []
+    used: set[float] = set()
+    for ss_time, wanted_time in zip(ss_times, wanted):
+        keyframe_time = index.snap(wanted_time)
+        if keyframe_time is None or keyframe_time in used:
+            snapped.append(ss_time)
+            continue
+        used.add(keyframe_time)
+        snapped.append(str(keyframe_time))
+
+    if meta['debug']:
+        moved = sum(1 for before, after in zip(ss_times, snapped) if before != after)
+        console.print(f"[cyan]Snapped {moved}/{len(ss_times)} screenshot time(s) to keyframes: {snapped}[/cyan]")
+    return snapped
+
+
 async def get_frame_info(path: str, ss_time: Union[str, float], meta: dict[str, Any]) -> dict[str, Any]:
     """Get frame information (type, exact timestamp) for a specific frame"""
+    index = cached_keyframe_index(path)
+    if index is not None:
+        # Times snapped by snap_to_keyframes() are keyframes whose position is already known
+        indexed_info = index.frame_info(float(ss_time), meta.get('frame_rate', 24.0))
+        if indexed_info is not None:
+            return indexed_info
+
     try:
         ss_time_value = float(ss_time)
         ffmpeg_module = cast(Any, ffmpeg)
@@ -1883,8 +2126,9 @@ class TakeScreensManager:
             num_screens: int = 0,
             force_screenshots: bool = False,
             manual_frames: Union[str, list[str]] = "",
+            on_screenshot: Optional[Callable[[int, str], None]] = None,
     ) -> Optional[list[str]]:
-        return await screenshots(path, filename, folder_id, base_dir, meta, num_screens, force_screenshots, manual_frames)
+        return await screenshots(path, filename, folder_id, base_dir, meta, num_screens, force_screenshots, manual_frames, on_screenshot)
 
     async def capture_screenshot(
             self,
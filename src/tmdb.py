@@ -5,6 +5,7 @@ import json
 import os
 import re
 import sys
+from collections import OrderedDict
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
 from typing import Any, Callable, Optional, Union
@@ -20,6 +21,7 @@ from src.args import Args
 from src.cleanup import cleanup_manager
 from src.console import console
 from src.imdb import imdb_manager
+from src.metadatacache import metadata_client
 
 default_config: dict[str, Any] = {}
 tmdb_api_key: Optional[str] = None
@@ -54,6 +56,31 @@ def guessit_fn(value: str, options: Optional[dict[str, Any]] = None) -> dict[str
 # Module-level dict to store async locks for cache keys to prevent race conditions
 _cache_locks: dict[str, asyncio.Lock] = {}
 
+# Sub-resources tmdb_other_meta() fetched along with the main record through append_to_response,
+# keyed by (endpoint, tmdb_id); get_keywords(), get_directors(), get_tmdb_translations() and
+# get_logo() answer from here instead of making their own request.
+_appended_responses: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
+APPENDED_RESPONSES_KEPT = 16
+
+
+def _remember_appended(category: Optional[str], tmdb_id: int, media_data: dict[str, Any], image_languages: list[str]) -> None:
+    endpoint = "movie" if category == "MOVIE" else "tv"
+    appended = {key: media_data[key] for key in ('external_ids', 'videos', 'keywords', 'credits', 'translations', 'images') if key in media_data}
+    appended['image_languages'] = image_languages
+    _appended_responses[(endpoint, tmdb_id)] = appended
+    _appended_responses.move_to_end((endpoint, tmdb_id))
+    while len(_appended_responses) > APPENDED_RESPONSES_KEPT:
+        _appended_responses.popitem(last=False)
+
+
+def _appended(category: Optional[str], tmdb_id: int, key: str) -> Optional[Any]:
+    appended = _appended_responses.get(("movie" if category == "MOVIE" else "tv", tmdb_id))
+    return appended.get(key) if appended else None
+
+
+def _logo_languages() -> list[str]:
+    return list(dict.fromkeys([str(default_config.get('logo_language', 'en')), 'en']))
+
 
 class TmdbManager:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -312,7 +339,7 @@ async def get_tmdb_from_imdb(
         url = f"{TMDB_BASE_URL}/find/{external_id}"
         params = {"api_key": tmdb_api_key, "external_source": source}
 
-        async with httpx.AsyncClient() as client:
+        async with metadata_client("tmdb") as client:
             response: Optional[httpx.Response] = None
             try:
                 response = await client.get(url, params=params, timeout=10)
@@ -454,7 +481,7 @@ async def get_tmdb_id(
             final_attempt = False
         if attempted:
             await asyncio.sleep(1)  # Whoa baby, slow down
-        async with httpx.AsyncClient() as client:
+        async with metadata_client("tmdb") as client:
             try:
                 # Primary search attempt with year
                 if category == "MOVIE":
@@ -1066,12 +1093,21 @@ async def tmdb_other_meta(
     year = None
     original_imdb_id = imdb_id
 
-    async with httpx.AsyncClient() as client:
+    async with metadata_client("tmdb") as client:
         # Get main media details first (movie or TV show)
         main_url = f"{TMDB_BASE_URL}/{('movie' if category == 'MOVIE' else 'tv')}/{tmdb_id}"
 
-        # Make the main API call to get basic data
-        response = await client.get(main_url, params={"api_key": tmdb_api_key})
+        # One request for the main record and every sub-resource the config needs
+        append = ['external_ids', 'videos', 'keywords', 'credits', 'translations']
+        main_params = {"api_key": tmdb_api_key}
+        image_languages: list[str] = []
+        if default_config.get('add_logo', False):
+            append.append('images')
+            image_languages = _logo_languages()
+            # Appended images follow the request language unless listed here; "null" keeps untagged logos
+            main_params['include_image_language'] = ','.join([*image_languages, 'null'])
+        main_params['append_to_response'] = ','.join(append)
+        response = await client.get(main_url, params=main_params)
         try:
             response.raise_for_status()
             media_data = typing_cast(dict[str, Any], response.json())
@@ -1145,44 +1181,19 @@ async def tmdb_other_meta(
         if backdrop:
             backdrop = f"https://image.tmdb.org/t/p/original{backdrop}"
 
-        # Prepare all API endpoints for concurrent requests
-        endpoints = [
-            # External IDs
-            client.get(f"{main_url}/external_ids", params={"api_key": tmdb_api_key}),
-            # Videos
-            client.get(f"{main_url}/videos", params={"api_key": tmdb_api_key}),
-            # Keywords
-            client.get(f"{main_url}/keywords", params={"api_key": tmdb_api_key}),
-            # Credits
-            client.get(f"{main_url}/credits", params={"api_key": tmdb_api_key})
-        ]
-
-        # Add logo request if needed
-        if default_config.get('add_logo', False):
-            endpoints.append(
-                client.get(f"{TMDB_BASE_URL}/{('movie' if category == 'MOVIE' else 'tv')}/{tmdb_id}/images",
-                           params={"api_key": tmdb_api_key})
-            )
-
-        # Make all requests concurrently
-        results = await asyncio.gather(*endpoints, return_exceptions=True)
-
-        # Process results with the correct indexing
-        external_data, videos_data, keywords_data, credits_data, *rest = results
-        idx = 0
-        logo_data = None
-
-        # Get logo data if it was requested
-        if default_config.get('add_logo', False):
-            logo_data = rest[idx]
-            idx += 1
+        _remember_appended(category, tmdb_id, media_data, image_languages)
+        external_data = media_data.get('external_ids')
+        videos_data = media_data.get('videos')
+        keywords_data = media_data.get('keywords')
+        credits_data = media_data.get('credits')
+        logo_data = media_data.get('images')
 
         # Process external IDs
-        if isinstance(external_data, Exception):
+        if not isinstance(external_data, dict):
             console.print("[bold red]Failed to fetch external IDs[/bold red]")
         else:
             try:
-                external = typing_cast(dict[str, Any], external_data.json())  # type: ignore
+                external = typing_cast(dict[str, Any], external_data)
                 # Process IMDB ID
                 if quickie_search or imdb_id == 0:
                     external_imdb_id = external.get('imdb_id', None)
@@ -1218,11 +1229,11 @@ async def tmdb_other_meta(
                 console.print("[bold red]Failed to process external IDs[/bold red]")
 
         # Process videos
-        if isinstance(videos_data, Exception):
+        if not isinstance(videos_data, dict):
             console.print("[yellow]Unable to grab videos from TMDb.[/yellow]")
         else:
             try:
-                videos = typing_cast(dict[str, Any], videos_data.json())  # type: ignore
+                videos = typing_cast(dict[str, Any], videos_data)
                 for each in videos.get('results', []):
                     if each.get('site', "") == 'YouTube' and each.get('type', "") == "Trailer":
                         youtube = f"https://www.youtube.com/watch?v={each.get('key')}"
@@ -1231,16 +1242,12 @@ async def tmdb_other_meta(
                 console.print("[yellow]Unable to process videos from TMDb.[/yellow]")
 
         # Process keywords
-        if isinstance(keywords_data, Exception):
+        if not isinstance(keywords_data, dict):
             console.print("[bold red]Failed to fetch keywords[/bold red]")
             keywords = ""
         else:
             try:
-                kw_json = typing_cast(dict[str, Any], keywords_data.json())  # type: ignore
-                if category == "MOVIE":
-                    keywords = ', '.join([keyword['name'].replace(',', ' ') for keyword in kw_json.get('keywords', [])])
-                else:  # TV
-                    keywords = ', '.join([keyword['name'].replace(',', ' ') for keyword in kw_json.get('results', [])])
+                keywords = _keyword_names(typing_cast(dict[str, Any], keywords_data), category or "MOVIE")
             except Exception:
                 console.print("[bold red]Failed to process keywords[/bold red]")
                 keywords = ""
@@ -1256,13 +1263,13 @@ async def tmdb_other_meta(
         # Limit to the first 5 unique names
         creators = list(dict.fromkeys(creators))[:5]
 
-        if isinstance(credits_data, Exception):
+        if not isinstance(credits_data, dict):
             console.print("[bold red]Failed to fetch credits[/bold red]")
             directors = []
             cast = []
         else:
             try:
-                credits = typing_cast(dict[str, Any], credits_data.json())  # type: ignore
+                credits = typing_cast(dict[str, Any], credits_data)
                 directors = []
                 cast = []
                 for each in credits.get('cast', []) + credits.get('crew', []):
@@ -1284,9 +1291,9 @@ async def tmdb_other_meta(
         genre_ids = genres_data['genre_ids']
 
         # Process logo if needed
-        if default_config.get('add_logo', False) and logo_data and not isinstance(logo_data, Exception):
+        if default_config.get('add_logo', False) and isinstance(logo_data, dict):
             try:
-                logo_json = typing_cast(dict[str, Any], logo_data.json())  # type: ignore
+                logo_json = typing_cast(dict[str, Any], logo_data)
                 logo_path = await get_logo(tmdb_id, category or "MOVIE", debug, TMDB_API_KEY=tmdb_api_key, TMDB_BASE_URL=TMDB_BASE_URL, logo_json=logo_json)
                 tmdb_logo = logo_path.split('/')[-1]
             except Exception:
@@ -1359,10 +1366,14 @@ async def tmdb_other_meta(
 
 async def get_keywords(tmdb_id: int, category: str) -> str:
     """Get keywords for a movie or TV show using httpx"""
+    appended = _appended(category, tmdb_id, 'keywords')
+    if isinstance(appended, dict):
+        return _keyword_names(typing_cast(dict[str, Any], appended), category)
+
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/keywords"
 
-    async with httpx.AsyncClient() as client:
+    async with metadata_client("tmdb") as client:
         try:
             response = await client.get(url, params={"api_key": tmdb_api_key})
             try:
@@ -1372,17 +1383,18 @@ async def get_keywords(tmdb_id: int, category: str) -> str:
                 console.print(f"[bold red]Failed to fetch keywords: {response.status_code}[/bold red]")
                 return ""
 
-            if category == "MOVIE":
-                keywords = [keyword['name'].replace(',', ' ') for keyword in data.get('keywords', [])]
-            else:  # TV
-                keywords = [keyword['name'].replace(',', ' ') for keyword in data.get('results', [])]
-
-            return ', '.join(keywords)
+            return _keyword_names(data, category)
         except Exception as e:
             console.print(f'[yellow]Failed to get keywords: {str(e)}')
             return ''
 
 
+def _keyword_names(data: dict[str, Any], category: str) -> str:
+    # Movies list keywords under "keywords", TV shows under "results"
+    keywords = data.get('keywords', []) if category == "MOVIE" else data.get('results', [])
+    return ', '.join([keyword['name'].replace(',', ' ') for keyword in keywords])
+
+
 async def get_genres(response_data: Optional[dict[str, Any]]) -> dict[str, str]:
     """Extract genres from TMDB response data"""
     if response_data is not None:
@@ -1408,10 +1420,14 @@ async def get_genres(response_data: Optional[dict[str, Any]]) -> dict[str, str]:
 
 async def get_directors(tmdb_id: int, category: str) -> list[str]:
     """Get directors for a movie or TV show using httpx"""
+    appended = _appended(category, tmdb_id, 'credits')
+    if isinstance(appended, dict):
+        return _director_names(typing_cast(dict[str, Any], appended))
+
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/credits"
 
-    async with httpx.AsyncClient() as client:
+    async with metadata_client("tmdb") as client:
         try:
             response = await client.get(url, params={"api_key": tmdb_api_key})
             try:
@@ -1421,16 +1437,20 @@ async def get_directors(tmdb_id: int, category: str) -> list[str]:
                 console.print(f"[bold red]Failed to fetch credits: {response.status_code}[/bold red]")
                 return []
 
-            return [
-                each.get('original_name', each.get('name'))
-                for each in data.get('cast', []) + data.get('crew', [])
-                if each.get('known_for_department', '') == "Directing" or each.get('job', '') == "Director"
-            ]
+            return _director_names(data)
         except Exception as e:
             console.print(f'[yellow]Failed to get directors: {str(e)}')
             return []
 
 
+def _director_names(data: dict[str, Any]) -> list[str]:
+    return [
+        each.get('original_name', each.get('name'))
+        for each in data.get('cast', []) + data.get('crew', [])
+        if each.get('known_for_department', '') == "Directing" or each.get('job', '') == "Director"
+    ]
+
+
 async def get_anime(response: dict[str, Any], meta: dict[str, Any]) -> tuple[int, str, bool, str]:
     tmdb_name = meta['title']
     alt_name = "" if meta.get('aka', "") == "" else meta['aka']
@@ -1528,7 +1548,7 @@ async def get_romaji(tmdb_name: str, mal: Optional[int], meta: dict[str, Any]) -
         url = 'https://graphql.anilist.co'
         for attempt in range(3):
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with metadata_client("anilist", timeout=30.0) as client:
                     response = await client.post(url, json={'query': query, 'variables': variables})
                 json_data = typing_cast(dict[str, Any], response.json())
 
@@ -1696,7 +1716,7 @@ def extract_imdb_id(value: str) -> Optional[int]:
 async def daily_to_tmdb_season_episode(tmdbid: int, date: Union[str, datetime]) -> tuple[int, int]:
     date = datetime.fromisoformat(str(date))
 
-    async with httpx.AsyncClient() as client:
+    async with metadata_client("tmdb") as client:
         # Get TV show information to get seasons
         response = await client.get(
             f"{TMDB_BASE_URL}/tv/{tmdbid}",
@@ -1753,7 +1773,7 @@ async def get_episode_details(
 ) -> dict[str, Any]:
     if debug:
         console.print(f"[cyan]Fetching episode details for TMDb ID: {tmdb_id}, Season: {season_number}, Episode: {episode_number}[/cyan]")
-    async with httpx.AsyncClient() as client:
+    async with metadata_client("tmdb") as client:
         try:
             # Get episode details
             response = await client.get(
@@ -1832,7 +1852,7 @@ async def get_season_details(
 ) -> dict[str, Any]:
     if debug:
         console.print(f"[cyan]Fetching season details for TMDb ID: {tmdb_id}, Season: {season_number}[/cyan]")
-    async with httpx.AsyncClient() as client:
+    async with metadata_client("tmdb") as client:
         try:
             # Get season details
             response = await client.get(
@@ -1932,13 +1952,18 @@ async def get_logo(
     try:
         # Use provided logo_json if available, otherwise fetch it
         image_data = None
+        appended_images = _appended(category, tmdb_id, 'images')
+        appended_languages = typing_cast(list[str], _appended(category, tmdb_id, 'image_languages') or [])
         if logo_json:
             image_data = logo_json
             if debug:
                 console.print("[cyan]Using provided logo_json data instead of making an HTTP request[/cyan]")
+        elif isinstance(appended_images, dict) and all(language in appended_languages for language in logo_languages):
+            # tmdb_other_meta() already fetched the logos in every wanted language
+            image_data = typing_cast(dict[str, Any], appended_images)
         else:
             # Make HTTP request only if logo_json is not provided
-            async with httpx.AsyncClient() as client:
+            async with metadata_client("tmdb") as client:
                 endpoint = "tv" if category == "TV" else "movie"
                 image_response = await client.get(
                     f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/images",
@@ -1993,31 +2018,33 @@ async def get_tmdb_translations(
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/translations"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, params={"api_key": tmdb_api_key})
-            response.raise_for_status()
-            data = response.json()
+    try:
+        data = _appended(category, tmdb_id, 'translations')
+        if not isinstance(data, dict):
+            async with metadata_client("tmdb") as client:
+                response = await client.get(url, params={"api_key": tmdb_api_key})
+                response.raise_for_status()
+                data = response.json()
 
-            # Look for target language translation
-            for translation in data.get('translations', []):
-                if translation.get('iso_639_1') == target_language:
-                    translated_data = translation.get('data', {})
-                    translated_title = translated_data.get('title') or translated_data.get('name')
+        # Look for target language translation
+        for translation in typing_cast(dict[str, Any], data).get('translations', []):
+            if translation.get('iso_639_1') == target_language:
+                translated_data = translation.get('data', {})
+                translated_title = translated_data.get('title') or translated_data.get('name')
 
-                    if translated_title and debug:
-                        console.print(f"[cyan]Found TMDb translation: '{translated_title}'[/cyan]")
+                if translated_title and debug:
+                    console.print(f"[cyan]Found TMDb translation: '{translated_title}'[/cyan]")
 
-                    return translated_title or ""
+                return translated_title or ""
 
-            if debug:
-                console.print(f"[yellow]No {target_language} translation found in TMDb[/yellow]")
-            return ""
+        if debug:
+            console.print(f"[yellow]No {target_language} translation found in TMDb[/yellow]")
+        return ""
 
-        except Exception as e:
-            if debug:
-                console.print(f"[yellow]TMDb translation fetch failed: {e}[/yellow]")
-            return ""
+    except Exception as e:
+        if debug:
+            console.print(f"[yellow]TMDb translation fetch failed: {e}[/yellow]")
+        return ""
 
 
 async def set_tmdb_metadata(meta: dict[str, Any], filename: Optional[str] = None) -> None:
@@ -2150,7 +2177,7 @@ async def get_tmdb_localized_data(meta: dict[str, Any], data_type: str, language
 
         # Fetch from API if not in cache
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with metadata_client("tmdb", timeout=10.0) as client:
                 response = await client.get(url, params=params)
                 if response.status_code == 200:
                     tmdb_data = response.json()
@@ -0,0 +1,175 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import contextlib
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Mapping
+from typing import Any, cast
+
+# Bump when the table layout changes; older databases are rebuilt from the next full sync.
+CLIENT_INDEX_VERSION = 1
+# Largest number of bound parameters per IN (...) query, well under SQLite's default limit.
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS torrents (
+    client TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    name_lower TEXT NOT NULL DEFAULT '',
+    content_path TEXT NOT NULL DEFAULT '',
+    size INTEGER,
+    tracker TEXT NOT NULL DEFAULT '',
+    piece_size INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (client, hash)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS torrents_name ON torrents (client, name_lower);
+CREATE INDEX IF NOT EXISTS torrents_content_path ON torrents (client, content_path);
+"""
+
+_UPSERT = """
+INSERT INTO torrents (client, hash, name_lower, content_path, size, tracker, data)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (client, hash) DO UPDATE SET
+    name_lower = excluded.name_lower,
+    content_path = excluded.content_path,
+    size = excluded.size,
+    tracker = excluded.tracker,
+    data = excluded.data
+"""
+
+def qbit_client_key(client: Mapping[str, Any]) -> str:
+    return f"{client.get('qbit_url')}:{client.get('qbit_port')}:{client.get('qbit_user')}"
+
+
+def _normalize_path(path: Any) -> str:
+    return os.path.normcase(os.path.normpath(str(path))) if path else ''
+
+
+class QbitClientIndex:
+    """SQLite mirror of qBittorrent's torrent list under data/client_index.db.
+
+    Rows are written from /api/v2/sync/maindata responses by QbitSyncWatcher.
+    Piece sizes are not part of maindata; they are remembered once a .torrent has been read.
+    """
+
+    def __init__(self, base_dir: str) -> None:
+        self.db_path = os.path.join(base_dir, "data", "client_index.db")
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if not self._ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = cast(int, conn.execute("PRAGMA user_version").fetchone()[0])
+            if version != CLIENT_INDEX_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS torrents;")
+                conn.execute(f"PRAGMA user_version = {CLIENT_INDEX_VERSION}")
+            conn.executescript(_SCHEMA)
+            self._ready = True
+        return conn
+
+    def apply_maindata(self, client_key: str, data: Mapping[str, Any], force_full: bool = False) -> int:
+        """Write one sync/maindata response into the index and return its rid."""
+        full_update = force_full or bool(data.get('full_update'))
+        torrents = cast(Mapping[str, Mapping[str, Any]], data.get('torrents') or {})
+        removed = cast(list[str], data.get('torrents_removed') or [])
+        with contextlib.closing(self._connect()) as conn, conn:
+            if full_update:
+                existing = {row[0] for row in conn.execute("SELECT hash FROM torrents WHERE client = ?", (client_key,))}
+                removed = [torrent_hash for torrent_hash in existing if torrent_hash not in torrents]
+                merged = {torrent_hash: dict(fields) for torrent_hash, fields in torrents.items()}
+            else:
+                merged = self._merge_partial(conn, client_key, torrents)
+            conn.executemany(
+                "DELETE FROM torrents WHERE client = ? AND hash = ?",
+                [(client_key, torrent_hash) for torrent_hash in removed],
+            )
+            conn.executemany(_UPSERT, [self._row(client_key, torrent_hash, fields) for torrent_hash, fields in merged.items()])
+        return int(data.get('rid') or 0)
+
+    def _merge_partial(self, conn: sqlite3.Connection, client_key: str, torrents: Mapping[str, Mapping[str, Any]]) -> dict[str, dict[str, Any]]:
+        # Partial updates only carry the fields that changed, so overlay them on the stored row.
+        hashes = list(torrents)
+        stored: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(hashes), _QUERY_CHUNK):
+            chunk = hashes[start:start + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for torrent_hash, data in conn.execute(
+                f"SELECT hash, data FROM torrents WHERE client = ? AND hash IN ({placeholders})",  # noqa: S608 - placeholders only
+                (client_key, *chunk),
+            ):
+                stored[torrent_hash] = json.loads(data)
+        for torrent_hash, fields in torrents.items():
+            stored.setdefault(torrent_hash, {}).update(fields)
+        return stored
+
+    @staticmethod
+    def _row(client_key: str, torrent_hash: str, fields: dict[str, Any]) -> tuple[Any, ...]:
+        fields['hash'] = torrent_hash
+        content_path = fields.get('content_path')
+        if not content_path and fields.get('save_path') and fields.get('name'):
+            content_path = os.path.join(str(fields['save_path']), str(fields['name']))
+        size = fields.get('total_size', fields.get('size'))
+        return (
+            client_key,
+            torrent_hash,
+            str(fields.get('name') or '').lower(),
+            _normalize_path(content_path),
+            size if isinstance(size, int) else None,
+            str(fields.get('tracker') or ''),
+            json.dumps(fields, separators=(",", ":")),
+        )
+
+    def count(self, client_key: str) -> int:
+        with contextlib.closing(self._connect()) as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM torrents WHERE client = ?", (client_key,)).fetchone()[0])
+
+    def find_by_names(self, client_key: str, names: Iterable[str]) -> list[dict[str, Any]]:
+        """Torrents whose name matches any of `names`, case-insensitively, with 'piece_size' when known."""
+        wanted = list(dict.fromkeys(name.lower() for name in names if name))
+        return self._select(client_key, "name_lower", wanted)
+
+    def find_by_hashes(self, client_key: str, hashes: Iterable[str]) -> dict[str, dict[str, Any]]:
+        return {torrent['hash']: torrent for torrent in self._select(client_key, "hash", list(dict.fromkeys(hashes)))}
+
+    def find_by_content_path(self, client_key: str, paths: Iterable[str]) -> list[dict[str, Any]]:
+        wanted = list(dict.fromkeys(_normalize_path(path) for path in paths if path))
+        return self._select(client_key, "content_path", wanted)
+
+    def _select(self, client_key: str, column: str, values: list[str]) -> list[dict[str, Any]]:
+        if not values:
+            return []
+        results: list[dict[str, Any]] = []
+        with contextlib.closing(self._connect()) as conn:
+            for start in range(0, len(values), _QUERY_CHUNK):
+                chunk = values[start:start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                for data, piece_size in conn.execute(
+                    f"SELECT data, piece_size FROM torrents WHERE client = ? AND {column} IN ({placeholders})",  # noqa: S608 - column is one of name_lower/content_path/hash
+                    (client_key, *chunk),
+                ):
+                    torrent = cast(dict[str, Any], json.loads(data))
+                    if piece_size:
+                        torrent['piece_size'] = piece_size
+                    results.append(torrent)
+        return results
+
+    def record_piece_size(self, client_key: str, torrent_hash: str, piece_size: int) -> None:
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE torrents SET piece_size = ? WHERE client = ? AND hash = ?",
+                (piece_size, client_key, torrent_hash),
+            )
+
+
+_indexes: dict[str, QbitClientIndex] = {}
+
+
+def get_client_index(base_dir: str) -> QbitClientIndex:
+    index = _indexes.get(base_dir)
+    if index is None:
+        index = _indexes[base_dir] = QbitClientIndex(base_dir)
+    return index
@@ -0,0 +1,145 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import collections
+import contextlib
+import weakref
+from collections.abc import Iterable, Mapping
+from typing import Any, Callable, Optional, cast
+
+import qbittorrentapi
+
+from src.pipeline import protect_task
+from src.torrent_clients.qbit_index import QbitClientIndex, get_client_index
+
+# Seconds between sync/maindata round trips while anything is waiting on a torrent.
+SYNC_POLL_INTERVAL = 1.0
+# Seconds one sync/maindata request may take before it counts as failed.
+SYNC_REQUEST_TIMEOUT = 14.0
+# Consecutive failed syncs after which every waiter is failed instead of polling on.
+SYNC_MAX_FAILURES = 5
+
+TorrentCondition = Callable[[Optional[dict[str, Any]]], bool]
+
+
+class QbitSyncWatcher:
+    """One sync/maindata stream per qBittorrent login, shared by every lookup and waiter in a run.
+
+    qBittorrent ties the response id (rid) to the WebUI session: the first request is a full
+    snapshot and each later one only carries the torrents that changed. Every response is
+    written to the client index, and waiters subscribed to a changed infohash are re-evaluated
+    against the merged row, so N trackers waiting on N torrents cost one request per interval.
+    """
+
+    def __init__(self, client_key: str, qbt_client: qbittorrentapi.Client, index: QbitClientIndex) -> None:
+        self.client_key = client_key
+        self.qbt_client = qbt_client
+        self.index = index
+        self._rid = 0
+        self._lock = asyncio.Lock()
+        self._waiters: collections.defaultdict[str, list[tuple[TorrentCondition, asyncio.Future[Optional[dict[str, Any]]]]]] = collections.defaultdict(list)
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def refresh(self) -> None:
+        """Fetch and apply the changes since the previous request of this session."""
+        async with self._lock:
+            rid = self._rid
+            try:
+                data = cast(Mapping[str, Any], await asyncio.wait_for(
+                    asyncio.to_thread(self.qbt_client.sync_maindata, rid=rid),
+                    timeout=SYNC_REQUEST_TIMEOUT
+                ))
+            except BaseException:
+                # A request that never answered may still have advanced the server-side rid
+                self._rid = 0
+                raise
+            full_update = rid == 0 or bool(data.get('full_update'))
+            self._rid = await asyncio.to_thread(self.index.apply_maindata, self.client_key, data, full_update)
+            if full_update:
+                changed: Iterable[str] = list(self._waiters)
+            else:
+                changed = [*cast(Mapping[str, Any], data.get('torrents') or {}), *cast(list[str], data.get('torrents_removed') or [])]
+            await self._notify(changed)
+
+    async def _notify(self, hashes: Iterable[str]) -> None:
+        watched = [torrent_hash for torrent_hash in dict.fromkeys(hashes) if self._waiters.get(torrent_hash)]
+        if not watched:
+            return
+        torrents = await asyncio.to_thread(self.index.find_by_hashes, self.client_key, watched)
+        for torrent_hash in watched:
+            torrent = torrents.get(torrent_hash)
+            for condition, future in list(self._waiters.get(torrent_hash, [])):
+                if future.done():
+                    continue
+                try:
+                    if condition(torrent):
+                        future.set_result(torrent)
+                except Exception as e:
+                    future.set_exception(e)
+
+    async def wait_for(self, infohash: str, condition: TorrentCondition, timeout: Optional[float] = None) -> Optional[dict[str, Any]]:
+        """Return the torrent's fields (None if it is not in the client) once `condition` holds for them.
+
+        Raises asyncio.TimeoutError after `timeout` seconds, or the sync error if the client stops answering.
+        """
+        torrent_hash = infohash.lower()
+        future: asyncio.Future[Optional[dict[str, Any]]] = asyncio.get_running_loop().create_future()
+        waiter = (condition, future)
+        self._waiters[torrent_hash].append(waiter)
+        try:
+            await self.refresh()
+            await self._notify([torrent_hash])
+            if self._task is None or self._task.done():
+                # Protected so the mid-run cleanup_manager.cleanup() calls don't stop it under the waiters
+                self._task = asyncio.create_task(self._poll(), name=f"qbit-sync:{self.client_key}")
+                protect_task(self._task)
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        finally:
+            waiters = self._waiters.get(torrent_hash, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(torrent_hash, None)
+            if not future.done():
+                future.cancel()
+
+    async def _poll(self) -> None:
+        failures = 0
+        while self._waiters:
+            await asyncio.sleep(SYNC_POLL_INTERVAL)
+            if not self._waiters:
+                break
+            try:
+                await self.refresh()
+                failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                if failures >= SYNC_MAX_FAILURES:
+                    self._fail_waiters(e)
+
+    def _fail_waiters(self, error: BaseException) -> None:
+        for waiters in self._waiters.values():
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(error)
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._task
+            self._task = None
+
+
+# Watchers hold an asyncio lock and poll task, so each event loop gets its own.
+_watchers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, QbitSyncWatcher]] = weakref.WeakKeyDictionary()
+
+
+def get_sync_watcher(base_dir: str, client_key: str, qbt_client: qbittorrentapi.Client) -> QbitSyncWatcher:
+    """The running loop's watcher for this client login; the first caller's logged-in client is reused by everyone."""
+    watchers = _watchers.setdefault(asyncio.get_running_loop(), {})
+    watcher = watchers.get(client_key)
+    if watcher is None:
+        watcher = watchers[client_key] = QbitSyncWatcher(client_key, qbt_client, get_client_index(base_dir))
+    return watcher
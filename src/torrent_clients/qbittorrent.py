@@ -18,6 +18,8 @@ from torf import Torrent
 
 from cogs.redaction import Redaction
 from src.console import console
+from src.torrent_clients.qbit_index import get_client_index, qbit_client_key
+from src.torrent_clients.qbit_sync import get_sync_watcher
 from src.torrentcreate import TorrentCreator
 
 # These have to be global variables to be shared across all instances since a new instance is made every time
@@ -293,6 +295,34 @@ class QbittorrentClientMixin:
                 qbittorrent_cached_clients[client_key] = qbt_client
                 return qbt_client
 
+    async def indexed_qbit_torrents(self, meta: dict[str, Any], client: dict[str, Any], qbt_client: qbittorrentapi.Client, names: list[str]) -> Optional[tuple[list[Any], int]]:
+        """Look up torrents by name in the local client index after syncing it with sync/maindata.
+
+        Returns (matching torrents, torrents indexed), or None when the index is unusable and the
+        caller should fall back to listing every torrent.
+        """
+        client_key = qbit_client_key(client)
+        watcher = get_sync_watcher(str(meta.get('base_dir', '')), client_key, qbt_client)
+
+        try:
+            await self.retry_qbt_operation(watcher.refresh, "Sync torrents list", initial_timeout=14.0)
+            total = await asyncio.to_thread(watcher.index.count, client_key)
+            torrents_data = await asyncio.to_thread(watcher.index.find_by_names, client_key, names)
+        except asyncio.TimeoutError:
+            raise
+        except Exception as e:
+            if meta.get('debug'):
+                console.print(f"[yellow]Torrent client index unavailable, listing all torrents instead: {e}")
+            return None
+        return self._build_mock_torrents(torrents_data), total
+
+    def remember_piece_size(self, meta: dict[str, Any], client: dict[str, Any], torrent_hash: str, piece_size: int) -> None:
+        try:
+            get_client_index(str(meta.get('base_dir', ''))).record_piece_size(qbit_client_key(client), torrent_hash, piece_size)
+        except Exception as e:
+            if meta.get('debug'):
+                console.print(f"[yellow]Failed to record piece size for {torrent_hash}: {e}")
+
     async def search_qbit_for_torrent(self, meta: dict[str, Any], client: dict[str, Any], qbt_client: Optional[qbittorrentapi.Client] = None, qbt_session: Optional[aiohttp.ClientSession] = None, proxy_url: Optional[str] = None) -> Optional[str]:
         trackers_config = cast(dict[str, Any], self.config.get('TRACKERS', {}))
         mtv_config_value = trackers_config.get('MTV', {})
@@ -344,6 +374,7 @@ class QbittorrentClientMixin:
             # **Step 1: Find correct torrents using content_path**
             best_match: Optional[dict[str, Any]] = None
             matching_torrents: list[dict[str, Any]] = []
+            indexed_count: Optional[int] = None
 
             try:
                 if proxy_url:
@@ -400,11 +431,15 @@ class QbittorrentClientMixin:
                     if qbt_client is None:
                         console.print("[bold red]qBittorrent client not initialized")
                         return None
-                    torrents = await self.retry_qbt_operation(
-                        lambda: asyncio.to_thread(qbt_client.torrents_info),
-                        "Get torrents list",
-                        initial_timeout=14.0
-                    )
+                    indexed = await self.indexed_qbit_torrents(meta, client, qbt_client, [str(meta['uuid'])])
+                    if indexed is not None:
+                        torrents, indexed_count = indexed
+                    else:
+                        torrents = await self.retry_qbt_operation(
+                            lambda: asyncio.to_thread(qbt_client.torrents_info),
+                            "Get torrents list",
+                            initial_timeout=14.0
+                        )
             except asyncio.TimeoutError:
                 console.print("[bold red]Getting torrents list timed out after retries")
                 return None
@@ -429,13 +464,20 @@ class QbittorrentClientMixin:
                     console.print(f"Save Path: {torrent.save_path}")
                     console.print(f"Content Path: {torrent_path}")
 
-                matching_torrents.append({'hash': torrent.hash, 'name': torrent.name})
+                matching_torrents.append({'hash': torrent.hash, 'name': torrent.name, 'piece_size': getattr(torrent, 'piece_size', None)})
 
-            console.print(f"[cyan]DEBUG: Checked {torrent_count} total torrents in qBittorrent[/cyan]")
+            if indexed_count is not None:
+                console.print(f"[cyan]DEBUG: Looked up {torrent_count} matches among {indexed_count} indexed torrents in qBittorrent[/cyan]")
+            else:
+                console.print(f"[cyan]DEBUG: Checked {torrent_count} total torrents in qBittorrent[/cyan]")
             if not matching_torrents:
                 console.print("[yellow]No matching torrents found in qBittorrent.")
                 return None
 
+            if prefer_small_pieces:
+                # Piece sizes remembered by the client index let the smallest known torrent be exported first
+                matching_torrents.sort(key=lambda match: match['piece_size'] if isinstance(match.get('piece_size'), int) else float('inf'))
+
             console.print(f"[green]Total Matching Torrents: {len(matching_torrents)}")
 
             # **Step 2: Extract and Save .torrent Files**
@@ -518,6 +560,7 @@ class QbittorrentClientMixin:
                         try:
                             torrent_data = Torrent.read(torrent_file_path)
                             piece_size = torrent_data.piece_size
+                            self.remember_piece_size(meta, client, torrent_hash, piece_size)
                             best_piece_size_raw_value: Any = best_match.get('piece_size') if best_match else None
                             best_piece_size: Optional[int] = best_piece_size_raw_value if isinstance(best_piece_size_raw_value, int) else None
                             if best_match is None or (best_piece_size is not None and piece_size < best_piece_size):
@@ -870,9 +913,10 @@ class QbittorrentClientMixin:
 
         # Wait for torrent to be added
         timeout = 30
-        for _ in range(timeout):
-            try:
-                if proxy_url:
+        torrent_added = False
+        if proxy_url:
+            for _ in range(timeout):
+                try:
                     if qbt_session is None:
                         raise RuntimeError("qbt_session cannot be None")
                     async with qbt_session.get(f"{qbt_proxy_url}/api/v2/torrents/info",
@@ -882,26 +926,30 @@ class QbittorrentClientMixin:
                             if len(torrents_info) > 0:
                                 if meta.get('debug'):
                                     console.print(f"[green]Found {tracker} torrent in qBittorrent.")
+                                torrent_added = True
                                 break
                         else:
                             pass  # Continue waiting
-                else:
-                    if qbt_client is None:
-                        raise RuntimeError("qbt_client cannot be None")
-                    torrents_info = await self.retry_qbt_operation(
-                        lambda: asyncio.to_thread(qbt_client.torrents_info, torrent_hashes=torrent.infohash),
-                        "Check torrent addition",
-                        max_retries=1,
-                        initial_timeout=10.0
-                    )
-                    if len(torrents_info) > 0:
-                        break
-            except asyncio.TimeoutError:
-                pass  # Continue waiting
-            except Exception:
-                pass  # Continue waiting
-            await asyncio.sleep(1)
+                except asyncio.TimeoutError:
+                    pass  # Continue waiting
+                except Exception:
+                    pass  # Continue waiting
+                await asyncio.sleep(1)
         else:
+            if qbt_client is None:
+                raise RuntimeError("qbt_client cannot be None")
+            # Shares one sync/maindata stream with every other tracker waiting on this client
+            watcher = get_sync_watcher(meta['base_dir'], qbit_client_key(client), qbt_client)
+            try:
+                await watcher.wait_for(torrent.infohash, lambda added: added is not None, timeout=timeout)
+                torrent_added = True
+            except asyncio.TimeoutError:
+                pass
+            except Exception as e:
+                if meta['debug']:
+                    console.print(f"[yellow]Error waiting for {tracker} torrent in qBittorrent: {e}")
+
+        if not torrent_added:
             console.print("[red]Torrent addition timed out.")
             if qbt_session:
                 await qbt_session.close()
@@ -1159,12 +1207,14 @@ class QbittorrentClientMixin:
 
         return [MockTorrent(torrent) for torrent in torrents_data]
 
-    def _torrent_name_matches(self, torrent_name: str, meta: dict[str, Any]) -> bool:
+    def _torrent_name_candidates(self, meta: dict[str, Any]) -> list[str]:
         is_disc = meta.get('is_disc', "")
         if is_disc in ("", None) and len(meta.get('filelist', [])) == 1:
-            file_name = os.path.basename(meta['filelist'][0])
-            return torrent_name.lower() == file_name.lower() or torrent_name.lower() == meta['uuid'].lower()
-        return torrent_name.lower() == meta['uuid'].lower()
+            return [meta['uuid'], os.path.basename(meta['filelist'][0])]
+        return [meta['uuid']]
+
+    def _torrent_name_matches(self, torrent_name: str, meta: dict[str, Any]) -> bool:
+        return torrent_name.lower() in {name.lower() for name in self._torrent_name_candidates(meta)}
 
     def _extract_tracker_matches(self, torrent: Any, tracker_patterns: dict[str, dict[str, str]], tracker_priority: list[str], has_working_tracker: bool, meta: dict[str, Any]) -> tuple[list[dict[str, Any]], bool]:
         tracker_found = False
@@ -1336,11 +1386,17 @@ class QbittorrentClientMixin:
                 else:
                     if qbt_client is None:
                         return []
-                    torrents = await self.retry_qbt_operation(
-                        lambda: asyncio.to_thread(qbt_client.torrents_info),
-                        "Get torrents list",
-                        initial_timeout=14.0
-                    )
+                    indexed = await self.indexed_qbit_torrents(meta, client_config, qbt_client, self._torrent_name_candidates(meta))
+                    if indexed is not None:
+                        torrents, indexed_count = indexed
+                        if meta['debug']:
+                            console.print(f"[cyan]Client index returned {len(torrents)} candidates from {indexed_count} torrents in {client_name}")
+                    else:
+                        torrents = await self.retry_qbt_operation(
+                            lambda: asyncio.to_thread(qbt_client.torrents_info),
+                            "Get torrents list",
+                            initial_timeout=14.0
+                        )
             except asyncio.TimeoutError:
                 console.print("[bold red]Getting torrents list timed out after retries")
                 if qbt_session:
@@ -1579,6 +1635,7 @@ class QbittorrentClientMixin:
                                     try:
                                         torrent_data = Torrent.read(torrent_file_path)
                                         piece_size = torrent_data.piece_size
+                                        self.remember_piece_size(meta, client_config, torrent_hash, piece_size)
                                         # For prefer_small_pieces: prefer smallest pieces
                                         # For piece_limit: prefer torrents with piece size <= 16 MiB (16777216 bytes)
                                         is_better_match = False
@@ -1693,6 +1750,7 @@ class QbittorrentClientMixin:
                                             try:
                                                 torrent_data = Torrent.read(alt_torrent_file_path)
                                                 piece_size = torrent_data.piece_size
+                                                self.remember_piece_size(meta, client_config, alt_torrent_hash, piece_size)
                                                 # For prefer_small_pieces: prefer smallest pieces
                                                 # For piece_limit: prefer torrents with piece size <= 16 MiB (16777216 bytes)
                                                 is_better_match = False
@@ -21,7 +21,10 @@ import torf
 from torf import Torrent
 from typing_extensions import TypeAlias
 
+from src.cleanup import protected_pids
 from src.console import console
+from src.piececache import load_piece_layer, piece_layer_cache_enabled, piece_layer_dir, piece_layer_sizes, store_piece_layers
+from src.piecehasher import hash_piece_layers
 
 PIECE_SIZE_MIN = 32 * 1024  # 32 KiB
 PIECE_SIZE_MAX = 134_217_728  # 128 MiB
@@ -45,6 +48,16 @@ def calculate_piece_size(
     )
 
 
+def content_size(path: Union[str, os.PathLike[str]]) -> int:
+    size = 0
+    if os.path.isfile(path):
+        size = os.path.getsize(path)
+    elif os.path.isdir(path):
+        for root, _dirs, files in os.walk(path):
+            size += sum(os.path.getsize(os.path.join(root, f)) for f in files if os.path.isfile(os.path.join(root, f)))
+    return size
+
+
 class CustomTorrent(torf.Torrent):
     def __init__(self, meta: Mapping[str, Any], *args: Any, **kwargs: Any) -> None:
         self._meta = meta
@@ -96,6 +109,62 @@ class CustomTorrent(torf.Torrent):
             self.metainfo['info']['piece length'] = self._precalculated_piece_size
             return
 
+    def generate(self, threads: Optional[int] = None, callback: Any = None, interval: float = 0) -> bool:
+        """Hash pieces with src.piecehasher instead of torf's one-read-per-piece pipeline.
+
+        Sets metainfo['info']['pieces'] exactly as torf.Torrent.generate() does and keeps its
+        callback contract: callback(torrent, filepath, pieces_done, pieces_total).
+        """
+        if self.path is None:
+            raise RuntimeError('generate() called with no path specified')
+        files = [(disk_path, size) for _, disk_path, size in self.content_files()]
+        total_size = sum(size for _, size in files)
+        if total_size < 1:
+            raise torf.PathError(str(self.path), msg='Empty or all files excluded')
+
+        def progress(filepath: str, pieces_done: int, pieces_total: int) -> Optional[object]:
+            return callback(self, filepath, pieces_done, pieces_total) if callback is not None else None
+
+        layer_dir = self.piece_layer_dir()
+        if layer_dir is not None:
+            cached = load_piece_layer(layer_dir, self.piece_size, total_size)
+            if cached is not None:
+                if self._meta.get('debug', False):
+                    console.print(f"[green]Reusing cached {self.piece_size // 1024} KiB piece layer, no re-hash needed")
+                self.metainfo['info']['pieces'] = cached
+                progress(files[-1][0], self.pieces, self.pieces)
+                return True
+
+        # Hash the piece sizes trackers will ask for later in this same read pass
+        extra_sizes = piece_layer_sizes(self._meta, self.piece_size) if layer_dir is not None else []
+        layers = hash_piece_layers(files, [self.piece_size, *extra_sizes], threads=threads, callback=progress, interval=interval)
+        if layers is None:
+            return False
+        self.metainfo['info']['pieces'] = layers[self.piece_size]
+        if layer_dir is not None:
+            store_piece_layers(layer_dir, layers, debug=bool(self._meta.get('debug', False)))
+        return True
+
+    def content_files(self) -> list[tuple[str, str, int]]:
+        """(path inside the torrent, path on disk, size) for every file, in torrent order."""
+        info = self.metainfo['info']
+        if self.mode == 'singlefile':
+            return [(str(info['name']), str(self.path), int(info['length']))]
+        return [
+            ("/".join([str(info['name']), *entry['path']]), os.path.join(str(self.path), *entry['path']), int(entry['length']))
+            for entry in info['files']
+        ]
+
+    def piece_layer_dir(self) -> Optional[str]:
+        if not piece_layer_cache_enabled(self._meta):
+            return None
+        return piece_layer_dir(str(self._meta['base_dir']), self.content_files())
+
+    def has_cached_layer(self) -> bool:
+        layer_dir = self.piece_layer_dir()
+        total_size = sum(size for _, _, size in self.content_files())
+        return layer_dir is not None and total_size > 0 and load_piece_layer(layer_dir, self.piece_size, total_size) is not None
+
 
 class TorrentCreator:
     # Limit concurrent torrent creation to avoid heavy parallel hashing
@@ -103,6 +172,11 @@ class TorrentCreator:
     _create_torrent_inflight = 0
     _torf_start_time = time.time()
 
+    @classmethod
+    def creating(cls) -> bool:
+        """True while a torrent is being created (or waiting to be)."""
+        return cls._create_torrent_semaphore.locked()
+
     @staticmethod
     def calculate_piece_size(
         total_size: int,
@@ -244,7 +318,6 @@ class TorrentCreator:
                         exclude = []
                     elif not meta.get('tv_pack', False):
                         path_dir = os.fspath(path)
-                        os.chdir(path_dir)
                         globs = [os.path.basename(f) for f in glob.glob(os.path.join(path_dir, "*.mkv"))] + [
                             os.path.basename(f) for f in glob.glob(os.path.join(path_dir, "*.mp4"))
                         ] + [os.path.basename(f) for f in glob.glob(os.path.join(path_dir, "*.ts"))]
@@ -267,8 +340,20 @@ class TorrentCreator:
                     exclude = ["*.*", "*sample.mkv", "!sample*.*"] if not meta['is_disc'] else []
                     include = ["*.mkv", "*.mp4", "*.ts"] if not meta['is_disc'] else []
 
+                # Prefer the built-in hasher over mkbrr when the piece-layer cache already holds this
+                # piece size, or when BASE can hash the tracker-capped piece sizes in the same read pass
+                custom_torrent: Optional[CustomTorrent] = None
+                use_mkbrr = bool(meta.get('mkbrr'))
+                if use_mkbrr and int(meta.get('randomized', 0)) < 1 and piece_layer_cache_enabled(meta):
+                    custom_torrent = await asyncio.to_thread(cls.build_custom_torrent, meta, path, include, exclude, piece_size)
+                    cached_layer = await asyncio.to_thread(custom_torrent.has_cached_layer)
+                    one_pass_base = "BASE" in output_filename and bool(piece_layer_sizes(meta, custom_torrent.piece_size))
+                    use_mkbrr = not (cached_layer or one_pass_base)
+                    if not use_mkbrr and meta['debug']:
+                        console.print("[cyan]Using the piece-layer cache instead of mkbrr for this torrent")
+
                 # If using mkbrr, run the external application
-                if meta.get('mkbrr'):
+                if use_mkbrr:
                     try:
                         # Validate input path to prevent potential command injection
                         if not os.path.exists(path):
@@ -322,7 +407,13 @@ class TorrentCreator:
                         # Run mkbrr subprocess in thread to avoid blocking
                         def run_mkbrr() -> int:
                             process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+                            protected_pids.add(process.pid)
+                            try:
+                                return read_mkbrr_output(process)
+                            finally:
+                                protected_pids.discard(process.pid)
 
+                        def read_mkbrr_output(process: subprocess.Popen[str]) -> int:
                             if process.stdout is None:
                                 return process.wait()
 
@@ -386,34 +477,10 @@ class TorrentCreator:
                         meta['mkbrr'] = False
                 overall_start_time = time.time()
 
-                # Calculate initial size
-                def calculate_size() -> int:
-                    size = 0
-                    if os.path.isfile(path):
-                        size = os.path.getsize(path)
-                    elif os.path.isdir(path):
-                        for root, _dirs, files in os.walk(path):
-                            size += sum(os.path.getsize(os.path.join(root, f)) for f in files if os.path.isfile(os.path.join(root, f)))
-                    return size
-
-                initial_size = await asyncio.to_thread(calculate_size)
-
-                piece_size = cls.calculate_piece_size(initial_size, 32768, 134217728, meta, piece_size=piece_size)
-
                 # Fallback to CustomTorrent if mkbrr is not used
-                torrent = CustomTorrent(
-                    meta=meta,
-                    path=path,
-                    trackers=["https://fake.tracker"],
-                    source="UA",
-                    private=True,
-                    exclude_globs=exclude or [],
-                    include_globs=include or [],
-                    creation_date=datetime.now(timezone.utc),
-                    comment="Created by Upload Assistant",
-                    created_by="Upload Assistant",
-                    piece_size=piece_size
-                )
+                if custom_torrent is None:
+                    custom_torrent = await asyncio.to_thread(cls.build_custom_torrent, meta, path, include, exclude, piece_size)
+                torrent = custom_torrent
 
                 # Run torrent generation in thread to avoid blocking the event loop
                 def generate_torrent() -> None:
@@ -438,6 +505,30 @@ class TorrentCreator:
                 if meta.get('debug', False):
                     console.print(f"[cyan]create_torrent end | in-flight={cls._create_torrent_inflight}[/cyan]")
 
+    @classmethod
+    def build_custom_torrent(
+        cls,
+        meta: Meta,
+        path: Union[str, os.PathLike[str]],
+        include: Sequence[str],
+        exclude: Sequence[str],
+        piece_size: int = 0,
+    ) -> CustomTorrent:
+        initial_size = content_size(path)
+        return CustomTorrent(
+            meta=meta,
+            path=path,
+            trackers=["https://fake.tracker"],
+            source="UA",
+            private=True,
+            exclude_globs=list(exclude),
+            include_globs=list(include),
+            creation_date=datetime.now(timezone.utc),
+            comment="Created by Upload Assistant",
+            created_by="Upload Assistant",
+            piece_size=cls.calculate_piece_size(initial_size, 32768, 134217728, meta, piece_size=piece_size)
+        )
+
     @staticmethod
     def torf_cb(torrent: Torrent, _filepath: str, pieces_done: int, pieces_total: int) -> None:
         if pieces_done == 0:
@@ -13,8 +13,7 @@ from cogs.redaction import Redaction
 from src.cleanup import cleanup_manager
 from src.get_desc import DescriptionBuilder
 from src.manualpackage import ManualPackageManager
-from src.trackers.PTP import PTP
-from src.trackers.THR import THR
+from src.pipeline import gather_stages, record_stage, timed_stage
 from src.trackersetup import TRACKER_SETUP
 
 Meta: TypeAlias = dict[str, Any]
@@ -68,6 +67,32 @@ async def process_trackers(
     tracker_setup_any = cast(Any, tracker_setup)
     enabled_trackers = list(cast(Sequence[str], tracker_setup_any.trackers_enabled(meta)))
     manual_packager = ManualPackageManager(config)
+    # Trackers whose approved-host check was deferred from process_meta until their upload.
+    image_host_checks = {str(t) for t in cast(list[Any], meta.get('image_host_checks') or [])}
+    # Rehosting shares reuploaded_images.json and may retake screenshots, so only one chain rehosts at a time.
+    rehost_lock = asyncio.Lock()
+
+    async def check_image_hosts(tracker: str, tracker_instance: Any) -> None:
+        if tracker not in image_host_checks:
+            return
+        async with rehost_lock, timed_stage(meta, 'rehost', tracker):
+            if tracker not in image_host_checks:
+                return
+            key = f"{tracker}_images_key"
+            if meta.get('debug'):
+                console.print(
+                    f"[cyan]Image host debug: before {tracker}.check_image_hosts() image_list={len(meta.get('image_list', []) or [])} {key}={len(meta.get(key, []) or [])}[/cyan]"  # noqa: E501
+                )
+            await tracker_instance.check_image_hosts(meta)
+            image_host_checks.discard(tracker)
+            if meta.get('debug'):
+                console.print(
+                    f"[cyan]Image host debug: after  {tracker}.check_image_hosts() image_list={len(meta.get('image_list', []) or [])} {key}={len(meta.get(key, []) or [])}[/cyan]"  # noqa: E501
+                )
+
+    async def add_to_client(tracker: str) -> None:
+        async with timed_stage(meta, 'client', tracker):
+            await client.add_to_client(meta, tracker)
 
     def print_tracker_result(
         tracker: str,
@@ -125,6 +150,10 @@ async def process_trackers(
         disctype_value = str(disctype) if disctype is not None else ""
         tracker = tracker.replace(" ", "").upper().strip()
 
+        tracker_status = cast(StatusDict, meta.get('tracker_status') or {})
+        if tracker in image_host_checks and cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False):
+            await check_image_hosts(tracker, tracker_class or tracker_class_map[tracker](config=config))
+
         if tracker in api_trackers:
             tracker_status = cast(StatusDict, meta.get('tracker_status') or {})
             upload_status = cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False)
@@ -141,6 +170,7 @@ async def process_trackers(
                         is_uploaded = await tracker_class.upload(meta, disctype_value)
                         upload_duration = time.time() - upload_start_time
                         meta[f'{tracker}_upload_duration'] = upload_duration
+                        record_stage(meta, 'upload', upload_duration, tracker)
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
@@ -155,7 +185,7 @@ async def process_trackers(
 
                 status = cast(StatusDict, meta.get('tracker_status') or {}).get(tracker_class.tracker, {})
                 if is_uploaded and 'status_message' in status and "data error" not in str(status['status_message']):
-                    await client.add_to_client(meta, tracker_class.tracker)
+                    await add_to_client(tracker_class.tracker)
                     print_tracker_result(tracker, tracker_class, status, True)
                 else:
                     print_tracker_result(tracker, tracker_class, status, False)
@@ -172,6 +202,7 @@ async def process_trackers(
                         is_uploaded = await tracker_class.upload(meta, disctype_value)
                         upload_duration = time.time() - upload_start_time
                         meta[f'{tracker}_upload_duration'] = upload_duration
+                        record_stage(meta, 'upload', upload_duration, tracker)
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
@@ -189,7 +220,7 @@ async def process_trackers(
 
                 status = cast(StatusDict, meta.get('tracker_status') or {}).get(tracker_class.tracker, {})
                 if is_uploaded and 'status_message' in status and "data error" not in str(status['status_message']):
-                    await client.add_to_client(meta, tracker_class.tracker)
+                    await add_to_client(tracker_class.tracker)
                     print_tracker_result(tracker, tracker_class, status, True)
                 else:
                     print_tracker_result(tracker, tracker_class, status, False)
@@ -206,6 +237,7 @@ async def process_trackers(
                         is_uploaded = await tracker_class.upload(meta, disctype_value)
                         upload_duration = time.time() - upload_start_time
                         meta[f'{tracker}_upload_duration'] = upload_duration
+                        record_stage(meta, 'upload', upload_duration, tracker)
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
                         console.print(traceback.format_exc())
@@ -222,7 +254,7 @@ async def process_trackers(
 
                 status = cast(StatusDict, meta.get('tracker_status') or {}).get(tracker_class.tracker, {})
                 if is_uploaded and 'status_message' in status and "data error" not in str(status['status_message']):
-                    await client.add_to_client(meta, tracker_class.tracker)
+                    await add_to_client(tracker_class.tracker)
                     print_tracker_result(tracker, tracker_class, status, True)
                 else:
                     print_tracker_result(tracker, tracker_class, status, False)
@@ -244,6 +276,7 @@ async def process_trackers(
                     if manual_tracker != 'MANUAL':
                         manual_tracker = manual_tracker.replace(" ", "").upper().strip()
                         tracker_class = tracker_class_map[manual_tracker](config=config)
+                        await check_image_hosts(manual_tracker, tracker_class)
                         if manual_tracker in api_trackers:
                             await DescriptionBuilder(manual_tracker, config).unit3d_edit_desc(meta, manual_tracker)
                         else:
@@ -259,7 +292,7 @@ async def process_trackers(
             tracker_status = cast(StatusDict, meta.get('tracker_status') or {})
             upload_status = cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False)
             if upload_status:
-                thr = THR(config=config)
+                thr = tracker_class_map['THR'](config=config)
                 thr_any = cast(Any, thr)
                 is_uploaded = False
                 try:
@@ -267,12 +300,13 @@ async def process_trackers(
                     is_uploaded = await thr_any.upload(meta, disctype_value)
                     upload_duration = time.time() - upload_start_time
                     meta[f'{tracker}_upload_duration'] = upload_duration
+                    record_stage(meta, 'upload', upload_duration, tracker)
                 except Exception as e:
                     console.print(f"[red]Upload failed: {e}")
                     console.print(traceback.format_exc())
                     return
                 if is_uploaded:
-                    await client.add_to_client(meta, "THR")
+                    await add_to_client("THR")
                     status = cast(StatusDict, meta.get('tracker_status') or {}).get('THR', {})
                     print_tracker_result(tracker, thr, status, True)
                 else:
@@ -285,7 +319,7 @@ async def process_trackers(
             upload_status = cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False)
             if upload_status:
                 try:
-                    ptp = PTP(config=config)
+                    ptp = tracker_class_map['PTP'](config=config)
                     groupID = meta.get('ptp_groupID', None)
                     ptpUrl, ptpData = await ptp.fill_upload_form(groupID, meta)
                     is_uploaded = False
@@ -294,6 +328,7 @@ async def process_trackers(
                         is_uploaded = await ptp.upload(meta, ptpUrl, ptpData, disctype_value)
                         upload_duration = time.time() - upload_start_time
                         meta[f'{tracker}_upload_duration'] = upload_duration
+                        record_stage(meta, 'upload', upload_duration, tracker)
                         await asyncio.sleep(5)
                     except Exception as e:
                         console.print(f"[red]Upload failed: {e}")
@@ -301,7 +336,7 @@ async def process_trackers(
                         return
                     status = cast(StatusDict, meta.get('tracker_status') or {}).get(ptp.tracker, {})
                     if is_uploaded and 'status_message' in status and "data error" not in str(status['status_message']):
-                        await client.add_to_client(meta, "PTP")
+                        await add_to_client("PTP")
                         print_tracker_result(tracker, ptp, status, True)
                     else:
                         print_tracker_result(tracker, ptp, status, False)
@@ -319,21 +354,19 @@ async def process_trackers(
         one_disc = False
 
     if (not meta.get('tv_pack') and one_disc) or multi_screens == 0:
-        # Run all tracker tasks concurrently with individual error handling
-        tasks: list[tuple[str, asyncio.Task[None]]] = []
-        for tracker in enabled_trackers:
-            task = asyncio.create_task(process_single_tracker(tracker))
-            tasks.append((tracker, task))
-
-        # Wait for all tasks to complete, but don't let one tracker's failure stop others
-        results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+        # Each tracker runs its own rehost -> upload -> client chain, so one slow tracker never
+        # holds up another's upload. MANUAL prompts and may rehost for every tracker, so it runs afterwards.
+        chained_trackers = [tracker for tracker in enabled_trackers if tracker != "MANUAL"]
+        results = await gather_stages(process_single_tracker(tracker) for tracker in chained_trackers)
 
         # Log any exceptions that occurred
-        for (tracker, _), result in zip(tasks, results):
+        for tracker, result in zip(chained_trackers, results):
             if isinstance(result, Exception):
                 console.print(f"[red]{tracker} encountered an error: {result}[/red]")
                 if meta.get('debug'):
                     console.print(traceback.format_exception(type(result), result, result.__traceback__))
+        if "MANUAL" in enabled_trackers:
+            await process_single_tracker("MANUAL")
     else:
         # Process each tracker sequentially
         for tracker in enabled_trackers:
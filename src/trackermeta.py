@@ -17,6 +17,7 @@ from typing_extensions import TypeAlias
 from src.bbcode import BBCODE
 from src.btnid import BtnIdManager
 from src.console import console
+from src.imageprobe import probe_image, probe_session
 from src.trackers.COMMON import COMMON
 from src.type_utils import to_int
 
@@ -139,8 +140,52 @@ async def check_images_concurrently(imagelist: Sequence[ImageDict], meta: Meta)
     save_directory = os.path.join(str(meta.get('base_dir', '')), 'tmp', str(meta.get('uuid', '')))
 
     timeout = aiohttp.ClientTimeout(total=15, connect=5, sock_connect=5, sock_read=5)
+    header_only = bool(default_config.get('header_only_image_checks', True))
+    # id(image_dict) -> (url, local path) of images validated without downloading them
+    deferred: dict[int, tuple[str, str]] = {}
+    lower_bound = expected_vertical_resolution * 0.70
+    upper_bound = expected_vertical_resolution * (1.30 if meta.get('is_disc') == "DVD" else 1.00)
 
-    async def check_and_collect(image_dict: ImageDict) -> Optional[ImageDict]:
+    async def check_header(session: aiohttp.ClientSession, image_dict: ImageDict, img_url: str) -> Optional[ImageDict]:
+        try:
+            probe = await probe_image(session, img_url)
+        except asyncio.TimeoutError:
+            console.print(f"[red]Timeout checking image link: {img_url}[/red]")
+            return None
+        except aiohttp.ClientError as e:
+            console.print(f"[red]Client error checking image: {img_url} - {e}")
+            return None
+        except Exception as e:
+            console.print(f"[red]Error checking image: {img_url} - {e}")
+            return None
+        if probe is None:
+            return None
+        width, height, size, content = probe
+
+        if not (lower_bound <= height <= upper_bound):
+            console.print(
+                f"[red]Image {img_url} resolution ({height}p) "
+                f"is outside the allowed range ({int(lower_bound)}-{int(upper_bound)}p). Skipping.[/red]"
+            )
+            return None
+
+        image_filename = os.path.join(save_directory, os.path.basename(img_url))
+        if content is not None:
+            os.makedirs(save_directory, exist_ok=True)
+            await asyncio.to_thread(Path(image_filename).write_bytes, content)
+            console.print(f"Saved {img_url} as {image_filename}")
+        else:
+            # Downloaded by fetch_deferred_images() when something uploads or rehosts the local copy
+            deferred[id(image_dict)] = (img_url, image_filename)
+        if size is not None:
+            meta['image_sizes'][img_url] = size
+
+        if meta['debug']:
+            size_text = f"{size / 1024:.2f} KiB" if size is not None else "unknown size"
+            console.print(f"Valid image {img_url} with resolution {width}x{height} and {size_text}")
+        return image_dict
+
+    async def check_and_collect(image_dict: ImageDict, session: Optional[aiohttp.ClientSession] = None) -> Optional[ImageDict]:
         img_url = cast(Optional[str], image_dict.get('raw_url'))
         if not img_url:
             return None
@@ -157,6 +202,9 @@ async def check_images_concurrently(imagelist: Sequence[ImageDict], meta: Meta)
         if "tmdb.org" in img_url:
             return None
 
+        if session is not None:
+            return await check_header(session, image_dict, img_url)
+
         # Verify the image link
         try:
             if await check_image_link(img_url, timeout):
@@ -170,8 +218,6 @@ async def check_images_concurrently(imagelist: Sequence[ImageDict], meta: Meta)
                                     try:
                                         image = Image.open(BytesIO(image_content))
                                         vertical_resolution = image.height
-                                        lower_bound = expected_vertical_resolution * 0.70
-                                        upper_bound = expected_vertical_resolution * (1.30 if meta.get('is_disc') == "DVD" else 1.00)
 
                                         if not (lower_bound <= vertical_resolution <= upper_bound):
                                             console.print(
@@ -223,10 +269,13 @@ async def check_images_concurrently(imagelist: Sequence[ImageDict], meta: Meta)
         async with semaphore:
             return await check_and_collect(image_dict)
 
-    tasks = [bounded_check(image_dict) for image_dict in unique_images]
-
     try:
-        results = await asyncio.gather(*tasks, return_exceptions=False)
+        if header_only:
+            # Header requests share one session; its connector bounds the connections per host
+            async with probe_session(timeout) as session:
+                results = await asyncio.gather(*[check_and_collect(image_dict, session) for image_dict in unique_images])
+        else:
+            results = await asyncio.gather(*[bounded_check(image_dict) for image_dict in unique_images])
     except Exception as e:
         console.print(f"[red]Error during image processing: {e}")
         results = []
@@ -235,6 +284,11 @@ async def check_images_concurrently(imagelist: Sequence[ImageDict], meta: Meta)
     valid_images = [image for image in results if image is not None]
     if expected_images < len(valid_images):
         valid_images = valid_images[:expected_images]
+    deferred_images = cast(dict[str, str], meta.setdefault('deferred_images', {}))
+    for image in valid_images:
+        if id(image) in deferred:
+            img_url, image_filename = deferred[id(image)]
+            deferred_images[img_url] = image_filename
 
     return valid_images
 
@@ -10,6 +10,7 @@ import httpx
 
 from src.bbcode import BBCODE
 from src.console import console
+from src.http_pool import pooled_client
 from src.trackers.COMMON import COMMON
 
 
@@ -248,7 +249,7 @@ class ACM:
         }
 
         if meta['debug'] is False:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 response = await client.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
                 try:
                     response_data = response.json()
@@ -293,7 +294,7 @@ class ACM:
         }
         # Adding Name to search seems to override tmdb
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with pooled_client(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
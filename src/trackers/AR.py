@@ -1,6 +1,5 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
-import json
 import os
 import platform
 import re
@@ -8,7 +7,6 @@ import urllib.parse
 from typing import Any, Optional, cast
 
 import aiofiles
-import httpx
 from bs4 import BeautifulSoup
 from pymediainfo import MediaInfo
 from rich.prompt import Prompt
@@ -16,6 +14,8 @@ from rich.prompt import Prompt
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.exceptions import *  # noqa F403
+from src.exportmi import get_mediainfo_json
+from src.http_pool import pooled_client
 from src.trackers.COMMON import COMMON
 
 
@@ -217,9 +217,7 @@ class AR:
         audio_lang = ""
         if meta['is_disc'] != "BDMV":
             try:
-                async with aiofiles.open(f"{meta.get('base_dir')}/tmp/{meta.get('uuid')}/MediaInfo.json", encoding='utf-8') as f:
-                    mi_content = await f.read()
-                    mi = json.loads(mi_content)
+                mi = await get_mediainfo_json(meta)
                 for track in mi['media']['track']:
                     if track['@type'] == "Audio":
                         if track.get('Language', 'None').startswith('en'):
@@ -269,7 +267,7 @@ class AR:
         }
 
         try:
-            async with httpx.AsyncClient(headers=headers, timeout=30.0, cookies=cookie_jar) as client:
+            async with pooled_client(headers=headers, timeout=30.0, cookies=cookie_jar) as client:
                 response = await client.get(search_url)
 
                 if response.status_code != 200:
@@ -322,7 +320,7 @@ class AR:
         }
 
         try:
-            async with httpx.AsyncClient(headers=headers, timeout=30.0, cookies=cookie_jar) as client:
+            async with pooled_client(headers=headers, timeout=30.0, cookies=cookie_jar) as client:
                 response = await client.get(self.test_url)
                 soup = BeautifulSoup(response.text, 'html.parser')
                 logout_link = soup.find('a', href=True, text='Logout')
@@ -19,7 +19,10 @@ import bbcode
 from cogs.redaction import Redaction
 from src.console import console
 from src.cookie_auth import CookieValidator
+from src.exportmi import get_mediainfo_json
 from src.get_desc import DescriptionBuilder
+from src.http_pool import pooled_client
+from src.imageprobe import fetch_deferred_images
 from src.languages import languages_manager
 from src.trackers.COMMON import COMMON
 
@@ -41,7 +44,7 @@ class AZTrackerBase:
         self.source_flag: str = tracker_config.get('source_flag') or ''
         self.torrent_url: str = f'{self.base_url}/torrent/' if self.base_url else ''
 
-        self.session = httpx.AsyncClient(headers={
+        self.session = pooled_client(headers={
             'User-Agent': f"Upload Assistant/2.3 ({platform.system()} {platform.release()})"
         }, timeout=60.0)
         self.media_code = ''
@@ -148,6 +151,9 @@ class AZTrackerBase:
 
             if attempt == 0 and not self.media_code:
                 console.print(f"\n{self.tracker}: The media [[yellow]IMDB:{imdb_id}[/yellow]] [[blue]TMDB:{tmdb_id}[/blue]] appears to be missing from the site's database.")
+                if meta['unattended'] and not meta.get('unattended_confirm', False):
+                    console.print(f'{self.tracker}: Running unattended, not adding media. Aborting.')
+                    break
                 if cli_ui.ask_yes_no(f"{self.tracker}: Do you want to add it to the site database?\n"):
                     added_successfully = await self.add_media_to_db(meta, title, category, imdb_id, tmdb_id)
                     if not added_successfully:
@@ -214,9 +220,8 @@ class AZTrackerBase:
             )
         return False
 
-    async def search_existing(self, meta: Meta, _) -> list[dict[str, str]]:
-        duplicates: list[dict[str, str]] = []
-
+    async def pre_search_checks(self, meta: Meta) -> bool:
+        """Interactive rule checks, run in tracker order before any dupe search. False skips the tracker."""
         if self.config['TRACKERS'][self.tracker].get('check_for_rules', True):
             warnings = self.rules(meta)
             if warnings:
@@ -224,26 +229,41 @@ class AZTrackerBase:
                 if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
                     if not cli_ui.ask_yes_no('Do you want to continue anyway?', default=False):
                         meta['skipping'] = f'{self.tracker}'
-                        return duplicates
+                        return False
                 else:
                     meta['skipping'] = f'{self.tracker}'
-                    return duplicates
+                    return False
 
         if meta['type'] not in ['WEBDL'] and self.tracker == "PHD" and meta.get('tag', "") in ['FGT', 'EVO']:
             if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
                 console.print(f'[bold red]Group {meta["tag"]} is only allowed for web-dl[/bold red]')
                 if not cli_ui.ask_yes_no('Do you want to upload anyway?', default=False):
                     meta['skipping'] = f'{self.tracker}'
-                    return duplicates
+                    return False
             else:
                 meta['skipping'] = f'{self.tracker}'
-                return duplicates
+                return False
 
+        # Looking up the media may offer to add it to the site database
         cookie_jar = await self.cookie_validator.load_session_cookies(meta, self.tracker)
         if cookie_jar:
             self.session.cookies = cookie_jar
-
         if not await self.get_media_code(meta):
+            console.print(f"{self.tracker}: This media is not registered, please add it to the database by following this link: {self.base_url}/add/{meta['category'].lower()}")
+            meta['skipping'] = f'{self.tracker}'
+            return False
+
+        return True
+
+    async def search_existing(self, meta: Meta, _) -> list[dict[str, str]]:
+        duplicates: list[dict[str, str]] = []
+
+        cookie_jar = await self.cookie_validator.load_session_cookies(meta, self.tracker)
+        if cookie_jar:
+            self.session.cookies = cookie_jar
+
+        # Normally found by pre_search_checks(), ahead of the concurrent searches
+        if not self.media_code and not await self.get_media_code(meta):
             console.print(f"{self.tracker}: This media is not registered, please add it to the database by following this link: {self.base_url}/add/{meta['category'].lower()}")
             meta['skipping'] = f'{self.tracker}'
             return duplicates
@@ -403,9 +423,7 @@ class AZTrackerBase:
                     audio_ids.add(target_id)
         else:
             try:
-                media_info_path = f"{meta.get('base_dir')}/tmp/{meta.get('uuid')}/MediaInfo.json"
-                async with aiofiles.open(media_info_path, encoding='utf-8') as f:
-                    data = json.loads(await f.read())
+                data = await get_mediainfo_json(meta)
 
                 tracks = data.get('media', {}).get('track', [])
 
@@ -500,6 +518,7 @@ class AZTrackerBase:
 
     async def get_screenshots(self, meta: Meta) -> Optional[list[str]]:
         screenshot_dir = Path(meta['base_dir']) / 'tmp' / meta['uuid']
+        await fetch_deferred_images(meta)
         local_files = sorted(screenshot_dir.glob('*.png'))
         results: list[str] = []
 
@@ -10,6 +10,7 @@ import cli_ui
 import httpx
 
 from src.console import console
+from src.http_pool import pooled_client
 from src.rehostimages import RehostImagesManager
 from src.trackers.COMMON import COMMON
 
@@ -135,7 +136,7 @@ class BHD:
         details_link: Union[str, None] = None
         if meta['debug'] is False:
             try:
-                async with httpx.AsyncClient(timeout=60) as client:
+                async with pooled_client(timeout=60) as client:
                     response = await client.post(url=url, files=files, data=data, headers=headers)
                     response_json = cast(dict[str, Any], response.json())
                     if int(response_json['status_code']) == 0:
@@ -322,7 +323,8 @@ class BHD:
             await desc.close()
             return None
 
-    async def search_existing(self, meta: dict[str, Any], _disctype: str) -> list[dict[str, Any]]:
+    async def pre_search_checks(self, meta: dict[str, Any]) -> bool:
+        """Interactive rule checks, run in tracker order before any dupe search. False skips the tracker."""
         bhd_name = await self.edit_name(meta)
         if any(phrase in bhd_name.lower() for phrase in (
             "-framestor", "-bhdstudio", "-bmf", "-decibel", "-d-zone", "-hifi",
@@ -335,20 +337,20 @@ class BHD:
                     pass
                 else:
                     meta['skipping'] = "BHD"
-                    return []
+                    return False
             else:
                 meta['skipping'] = "BHD"
-                return []
+                return False
 
         if not meta['valid_mi_settings']:
             console.print(f"[bold red]No encoding settings in mediainfo, skipping {self.tracker} upload.[/bold red]")
             meta['skipping'] = "BHD"
-            return []
+            return False
 
         if meta.get('type') in ['REMUX', 'ENCODE', 'WEBDL', 'WEBRIP'] and meta.get('container') not in ['mkv', 'mp4']:
             console.print(f"[bold red]Container '{meta.get('container')}' is not allowed for {meta['type']}. Only MKV and MP4 are permitted. Skipping upload.[/bold red]")
             meta['skipping'] = "BHD"
-            return []
+            return False
 
         if meta['type'] not in ['WEBDL'] and meta.get('tag', "") and any(x in meta['tag'] for x in ['EVO']):
             if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
@@ -357,10 +359,10 @@ class BHD:
                     pass
                 else:
                     meta['skipping'] = "BHD"
-                    return []
+                    return False
             else:
                 meta['skipping'] = "BHD"
-                return []
+                return False
 
         genres = f"{meta.get('keywords', '')} {meta.get('combined_genres', '')}"
         adult_keywords = ['xxx', 'erotic', 'porn', 'adult', 'orgy']
@@ -371,11 +373,14 @@ class BHD:
                     pass
                 else:
                     meta['skipping'] = "BHD"
-                    return []
+                    return False
             else:
                 meta['skipping'] = "BHD"
-                return []
+                return False
 
+        return True
+
+    async def search_existing(self, meta: dict[str, Any], _disctype: str) -> list[dict[str, Any]]:
         dupes: list[dict[str, Any]] = []
         category = meta['category']
         tmdbID = "movie" if category == 'MOVIE' else "tv"
@@ -404,7 +409,7 @@ class BHD:
 
         url = f"https://beyond-hd.me/api/torrents/{str(self.tracker_config.get('api_key', '')).strip()}"
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with pooled_client(timeout=5.0) as client:
                 response = await client.post(url, params=data)
                 if response.status_code == 200:
                     response_data = cast(dict[str, Any], response.json())
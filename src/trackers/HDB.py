@@ -14,6 +14,8 @@ from unidecode import unidecode
 from src.bbcode import BBCODE
 from src.console import console
 from src.exceptions import *  # noqa F403
+from src.http_pool import pooled_client
+from src.imageprobe import fetch_deferred_images
 from src.torrentcreate import TorrentCreator
 from src.trackers.COMMON import COMMON
 
@@ -321,7 +323,7 @@ class HDB:
         else:
             cookiefile = f"{meta['base_dir']}/data/cookies/HDB.txt"
             cookies = await common.parseCookieFile(cookiefile)
-            async with httpx.AsyncClient(cookies=cookies, timeout=30.0, follow_redirects=True) as client:
+            async with pooled_client(cookies=cookies, timeout=30.0, follow_redirects=True) as client:
                 up = await client.post(url=url, data=data, files=files)
 
             # Match url to verify successful upload
@@ -375,7 +377,7 @@ class HDB:
         # We have ids
         if not search_terms:
             try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
+                async with pooled_client(timeout=5.0) as client:
                     response = await client.post(url, json=data)
                     if response.status_code == 200:
                         response_data = response.json()
@@ -409,7 +411,7 @@ class HDB:
             data['search'] = search_term
 
             try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
+                async with pooled_client(timeout=5.0) as client:
                     response = await client.post(url, json=data)
                     if response.status_code == 200:
                         response_data = response.json()
@@ -451,7 +453,7 @@ class HDB:
         cookiefile = f"{meta['base_dir']}/data/cookies/HDB.txt"
         if os.path.exists(cookiefile):
             cookies = await common.parseCookieFile(cookiefile)
-            async with httpx.AsyncClient(cookies=cookies, timeout=30.0) as client:
+            async with pooled_client(cookies=cookies, timeout=30.0) as client:
                 resp = await client.get(url=url)
             return resp.text.find('''<a href="/logout.php">Logout</a>''') != -1
         else:
@@ -466,7 +468,7 @@ class HDB:
             'passkey': self.passkey,
             'id': id
         }
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             r = await client.post(url=api_url, json=data)
         r.raise_for_status()
         try:
@@ -493,7 +495,7 @@ class HDB:
             'id': id
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             r = await client.get(url=download_url, params=params)
         r.raise_for_status()
 
@@ -707,6 +709,7 @@ class HDB:
         else:
             thumb_size = 'w300'
             screenshot_dir = f"{meta['base_dir']}/tmp/{meta['uuid']}"
+            await fetch_deferred_images(meta)
             # similar to uploadscreens.py L546
             image_patterns = ["*.png", ".[!.]*.png"]
             image_glob: list[str] = []
@@ -813,7 +816,7 @@ class HDB:
                         chunk_size_mb = sum(os.path.getsize(all_image_files[int(key.split('[')[1].split(']')[0])]) for key, _ in chunk) / (1024 * 1024)
                         console.print(f"[cyan]Uploading chunk {chunk_idx + 1}/{len(chunks)} ({len(fileList)} images, {chunk_size_mb:.2f} MiB)")
 
-                    async with httpx.AsyncClient(timeout=30.0) as client:
+                    async with pooled_client(timeout=30.0) as client:
                         response = await client.post(url, data=data, files=fileList)
                     if response.status_code == 200:
                         console.print(f"[green]Chunk {chunk_idx + 1}/{len(chunks)} upload successful!")
@@ -823,7 +826,7 @@ class HDB:
                         uploadSuccess = False
                         break
             else:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with pooled_client(timeout=30.0) as client:
                     response = await client.post(url, data=data, files=upload_files)
                 if response.status_code == 200:
                     console.print("[green]Upload successful!")
@@ -870,7 +873,7 @@ class HDB:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.post(url, json=data)
             if response.is_success:
                 response_json = response.json()
@@ -944,7 +947,7 @@ class HDB:
             # console.print(f"[yellow]Using this data: {data}")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.post(url, json=data)
             if response.is_success:
                 try:
@@ -14,6 +14,7 @@ import pyotp
 from defusedxml import ElementTree as ET
 
 from src.console import console
+from src.http_pool import pooled_client
 from src.rehostimages import RehostImagesManager
 from src.torrentcreate import TorrentCreator
 from src.trackers.COMMON import COMMON
@@ -159,7 +160,7 @@ class MTV:
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
                 }
 
-                async with httpx.AsyncClient(
+                async with pooled_client(
                     cookies=cookies,
                     timeout=10.0,
                     follow_redirects=True,
@@ -529,7 +530,7 @@ class MTV:
                     data = await cf.read()
                     cookies_dict = await self.async_json_loads(data)
 
-                async with httpx.AsyncClient(cookies=cookies_dict, timeout=10) as client:
+                async with pooled_client(cookies=cookies_dict, timeout=10) as client:
                     try:
                         resp = await client.get(url=url)
                         if meta['debug']:
@@ -567,7 +568,7 @@ class MTV:
                     data = await cf.read()
                     cookies = await self.async_json_loads(data)
 
-                async with httpx.AsyncClient(cookies=cookies, timeout=10) as client:
+                async with pooled_client(cookies=cookies, timeout=10) as client:
                     try:
                         resp = await client.get(url=url)
                         if "authkey=" in resp.text:
@@ -588,7 +589,7 @@ class MTV:
 
     async def login(self, cookiefile: str) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=25, follow_redirects=True) as client:
+            async with pooled_client(timeout=25, follow_redirects=True) as client:
                 url = 'https://www.morethantv.me/login'
                 payload = {
                     'username': self.config['TRACKERS'][self.tracker].get('username'),
@@ -660,7 +661,8 @@ class MTV:
             console.print(f"[dim red]{traceback.format_exc()}[/dim red]")
         return False
 
-    async def search_existing(self, meta: Meta, _disctype: str) -> list[dict[str, Any]]:
+    async def pre_search_checks(self, meta: Meta) -> bool:
+        """Interactive rule checks, run in tracker order before any dupe search. False skips the tracker."""
         if meta['type'] not in ['WEBDL'] and meta.get('tag', "") and any(x in meta['tag'] for x in ['EVO']):
             if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
                 console.print(f'[bold red]Group {meta["tag"]} is only allowed for raw type content at {self.tracker}[/bold red]')
@@ -668,10 +670,10 @@ class MTV:
                     pass
                 else:
                     meta['skipping'] = "MTV"
-                    return []
+                    return False
             else:
                 meta['skipping'] = "MTV"
-                return []
+                return False
 
         allowed_anime = ['Thighs', 'sam', 'Vanilla', 'OZR', 'Netaro', 'Datte13', 'UDF', 'Baws', 'ARC', 'Dae', 'MTBB',
                          'Okay-Subs', 'hchcsen', 'Noyr', 'TTGA', 'GJM', 'Kaleido-Subs', 'GJM-Kaleido', 'LostYears',
@@ -685,7 +687,7 @@ class MTV:
                         pass
                     else:
                         meta['skipping'] = "MTV"
-                        return []
+                        return False
             else:
                 console.print(f'[bold red]Only 4K HEVC releases are allowed at {self.tracker}[/bold red]')
                 if (not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False))):
@@ -693,10 +695,10 @@ class MTV:
                         pass
                     else:
                         meta['skipping'] = "MTV"
-                        return []
+                        return False
                 else:
                     meta['skipping'] = "MTV"
-                    return []
+                    return False
 
         disallowed_keywords = {'xxx', 'erotic', 'porn'}
         disallowed_genres = {'adult', 'erotica'}
@@ -721,11 +723,14 @@ class MTV:
                     pass
                 else:
                     meta['skipping'] = "MTV"
-                    return []
+                    return False
             else:
                 meta['skipping'] = "MTV"
-                return []
+                return False
 
+        return True
+
+    async def search_existing(self, meta: Meta, _disctype: str) -> list[dict[str, Any]]:
         dupes: list[dict[str, Any]] = []
 
         # Build request parameters
@@ -746,7 +751,7 @@ class MTV:
             params['q'] = meta['title'].replace(': ', ' ').replace('’', '').replace("'", '')
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with pooled_client(timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
 
                 if response.status_code == 200 and response.text:
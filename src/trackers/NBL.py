@@ -9,6 +9,7 @@ import cli_ui
 import httpx
 
 from src.console import console
+from src.http_pool import pooled_client
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -76,7 +77,7 @@ class NBL:
 
         try:
             if not meta['debug']:
-                async with httpx.AsyncClient(timeout=30) as client:
+                async with pooled_client(timeout=30) as client:
                     response = await client.post(url=self.upload_url, files=files, data=data)
                     if response.status_code in [200, 201]:
                         try:
@@ -107,7 +108,8 @@ class NBL:
             meta['tracker_status'][self.tracker]['status_message'] = f"data error: Upload failed: {e}"
             return False
 
-    async def search_existing(self, meta: Meta, _disctype: str) -> Union[list[dict[str, Any]], bool]:
+    async def pre_search_checks(self, meta: Meta) -> bool:
+        """Interactive rule checks, run in tracker order before any dupe search. False skips the tracker."""
         if meta['category'] != 'TV':
             if meta['tvmaze_id'] != 0:
                 if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
@@ -116,15 +118,15 @@ class NBL:
                         pass
                     else:
                         meta['skipping'] = "NBL"
-                        return []
+                        return False
                 else:
                     meta['skipping'] = "NBL"
-                    return []
+                    return False
             else:
                 if not meta['unattended']:
                     console.print("[red]Only TV Is allowed at NBL")
                 meta['skipping'] = "NBL"
-                return []
+                return False
 
         if meta['is_disc'] != "BDMV" and not await self.common.check_language_requirements(
             meta, self.tracker, languages_to_check=["english"], check_audio=True, check_subtitle=True, original_language=True
@@ -139,8 +141,11 @@ class NBL:
             if not meta['unattended']:
                 console.print('[bold red]NBL does not allow raw discs')
             meta['skipping'] = "NBL"
-            return []
+            return False
 
+        return True
+
+    async def search_existing(self, meta: Meta, _disctype: str) -> Union[list[dict[str, Any]], bool]:
         dupes: list[dict[str, Any]] = []
 
         season = meta.get("season_int", 0)
@@ -174,7 +179,7 @@ class NBL:
         response: Optional[httpx.Response] = None
         try:
             max_pages = int(self.config['TRACKERS'][self.tracker].get('search_max_pages', 10))
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 for page in range(max_pages):
                     page_params = dict(params)
                     page_params["page"] = page
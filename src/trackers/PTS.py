@@ -5,12 +5,12 @@ import re
 from typing import Any, Optional, cast
 
 import aiofiles
-import httpx
 from bs4 import BeautifulSoup
 from pymediainfo import MediaInfo
 
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
+from src.http_pool import pooled_client
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -30,7 +30,7 @@ class PTS:
         self.torrent_url = "https://www.ptskit.org/details.php?id="
         self.announce = str(self.config['TRACKERS'][self.tracker]['announce_url'])
         self.auth_token: Optional[str] = None
-        self.session = httpx.AsyncClient(headers={
+        self.session = pooled_client(headers={
             'User-Agent': f"Upload Assistant/2.3 ({platform.system()} {platform.release()})"
         }, timeout=60.0)
 
@@ -144,7 +144,8 @@ class PTS:
 
         return desc
 
-    async def search_existing(self, meta: Meta, _disctype: str) -> Optional[list[str]]:
+    async def pre_search_checks(self, meta: Meta) -> bool:
+        """Interactive rule checks, run in tracker order before any dupe search. False skips the tracker."""
         mandarin = await self.common.check_language_requirements(
             meta, self.tracker, languages_to_check=['mandarin', 'chinese'], check_audio=True, check_subtitle=True
         )
@@ -154,8 +155,11 @@ class PTS:
             if user_input.lower() not in ['y', 'yes']:
                 console.print("Upload cancelled by user.", markup=False)
                 meta['skipping'] = f"{self.tracker}"
-                return
+                return False
+
+        return True
 
+    async def search_existing(self, meta: Meta, _disctype: str) -> Optional[list[str]]:
         search_url = f"{self.base_url}/torrents.php"
         params: dict[str, Any] = {
             'incldead': 1,
@@ -7,6 +7,7 @@ import httpx
 
 from cogs.redaction import Redaction
 from src.console import console
+from src.http_pool import pooled_client
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -119,7 +120,7 @@ class SN:
 
         if not bool(meta.get('debug')):
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with pooled_client(timeout=30.0) as client:
                     response = await client.post(self.upload_url, data=data, files=files)
             except httpx.RequestError as e:
                 console.print(f"[red]Request failed with error: {e}")
@@ -215,7 +216,7 @@ class SN:
                 params['filter'] = str(meta.get('resolution', ''))
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 response = await client.get(self.search_url, params=params)
                 if response.status_code == 200:
                     data = cast(dict[str, Any], response.json())
@@ -11,6 +11,7 @@ from cogs.redaction import Redaction
 from src.bbcode import BBCODE
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import pooled_client
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -28,7 +29,7 @@ class TL:
         self.api_upload_url = f'{self.base_url}/torrents/upload/apiupload'
         self.torrent_url = f'{self.base_url}/torrent/'
         self.banned_groups = []
-        self.session = httpx.AsyncClient(timeout=60.0)
+        self.session = pooled_client(timeout=60.0)
         self.tracker_config: dict[str, Any] = self.config['TRACKERS'][self.tracker]
         self.api_upload: bool = bool(self.tracker_config.get('api_upload', False))
         self.passkey: str = str(self.tracker_config.get('passkey', ''))
@@ -16,6 +16,8 @@ import tmdbsimple as tmdb
 
 from src.bbcode import BBCODE
 from src.console import console
+from src.exportmi import get_mediainfo_json
+from src.http_pool import pooled_client
 from src.rehostimages import RehostImagesManager
 from src.trackers.COMMON import COMMON
 
@@ -500,8 +502,7 @@ class TVC:
 
         # load MediaInfo.json
         try:
-            content = await self.read_file(f"{meta['base_dir']}/tmp/{meta['uuid']}/MediaInfo.json")
-            mi = cast(dict[str, Any], json.loads(content))
+            mi = await get_mediainfo_json(meta)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             console.print(f"[yellow]Warning: Could not load MediaInfo.json: {e}")
             mi = {}
@@ -638,7 +639,7 @@ class TVC:
         if meta['debug'] is False:
             response = None
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with pooled_client(timeout=30.0) as client:
                     async with aiofiles.open(torrent_path, "rb") as open_torrent:
                         torrent_bytes = await open_torrent.read()
                     files = {'torrent': (os.path.basename(torrent_path), torrent_bytes)}
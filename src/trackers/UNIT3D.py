@@ -13,6 +13,8 @@ from typing_extensions import TypeAlias
 
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import pooled_client
+from src.multipart import FileValue, StreamedFile, multipart_request
 from src.trackers.COMMON import COMMON
 
 QueryValue: TypeAlias = Union[str, int, float, bool, None]
@@ -113,7 +115,7 @@ class UNIT3D:
             urls_to_check.append(self.pending_url)
 
         try:
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
+            async with pooled_client(timeout=10.0, follow_redirects=True) as client:
                 for url in urls_to_check:
                     check_pending = False
                     if "api/torrents/pending" in url:
@@ -436,8 +438,8 @@ class UNIT3D:
 
         return merged
 
-    async def get_additional_files(self, meta: dict[str, Any]) -> dict[str, tuple[str, bytes, str]]:
-        files: dict[str, tuple[str, bytes, str]] = {}
+    async def get_additional_files(self, meta: dict[str, Any]) -> dict[str, FileValue]:
+        files: dict[str, FileValue] = {}
         base_dir = meta["base_dir"]
         uuid = meta["uuid"]
         specified_dir_path = os.path.join(base_dir, "tmp", uuid, "*.nfo")
@@ -447,18 +449,14 @@ class UNIT3D:
             nfo_files = glob.glob(os.path.join(search_dir, "*.nfo"))
 
         if nfo_files:
-            async with aiofiles.open(nfo_files[0], "rb") as f:
-                nfo_bytes = await f.read()
-            files["nfo"] = ("nfo_file.nfo", nfo_bytes, "text/plain")
+            files["nfo"] = StreamedFile(nfo_files[0], "nfo_file.nfo", "text/plain")
 
         return files
 
     async def upload(self, meta: dict[str, Any], _: Any) -> bool:
         data = await self.get_data(meta)
         torrent_file_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent"
-        async with aiofiles.open(torrent_file_path, "rb") as f:
-            torrent_bytes = await f.read()
-        files = {"torrent": ("torrent.torrent", torrent_bytes, "application/x-bittorrent")}
+        files: dict[str, FileValue] = {"torrent": StreamedFile(torrent_file_path, "torrent.torrent", "application/x-bittorrent")}
         files.update(await self.get_additional_files(meta))
         headers = {
             "User-Agent": f'{meta["ua_name"]} {meta.get("current_version", "")} ({platform.system()} {platform.release()})',
@@ -474,9 +472,9 @@ class UNIT3D:
 
             for attempt in range(max_retries):
                 try:  # noqa: PERF203
-                    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+                    async with pooled_client(timeout=timeout, follow_redirects=True) as client:
                         response = await client.post(
-                            url=self.upload_url, files=files, data=data, headers=headers
+                            url=self.upload_url, **multipart_request(data, files, headers)
                         )
                         response.raise_for_status()
 
@@ -3,7 +3,7 @@ import asyncio
 import copy
 import os
 import sys
-from collections.abc import Mapping, MutableMapping
+from collections.abc import ItemsView, Iterator, Mapping, MutableMapping, ValuesView
 from typing import Any, Optional, cast
 
 import cli_ui
@@ -15,13 +15,88 @@ from src.clients import Clients
 from src.console import console
 from src.dupe_checking import DupeChecker
 from src.imdb import imdb_manager
+from src.pipeline import timed_stage
 from src.torrentcreate import TorrentCreator
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, tracker_class_map
 from src.uphelper import UploadHelper
 
 Meta: TypeAlias = MutableMapping[str, Any]
 
+# Large payloads the dupe searches only read; tracker views share them instead of copying.
+SHARED_META_KEYS = frozenset({'mediainfo', 'bdinfo', 'discs'})
+_MUTABLE_TYPES = (dict, list, set)
+
+
+class TrackerMetaView(dict[str, Any]):
+    """Per-tracker meta for the dupe search, without deep-copying the whole of meta up front.
+
+    Starts as a shallow copy, so top-level writes never reach the shared meta. A mutable value is
+    deep-copied the first time it is read through the view (by key, get(), iteration, items(),
+    values(), copy(), pop(), dict(view) or **view), so nested edits stay private as well.
+    Keys in SHARED_META_KEYS are handed out as-is and must be treated as read-only.
+    """
+
+    def __init__(self, base: Mapping[str, Any], shared_keys: frozenset[str] = SHARED_META_KEYS) -> None:
+        super().__init__(base)
+        self._owned: set[str] = set()
+        self._shared_keys = shared_keys
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if key not in self._owned:
+            self._owned.add(key)
+            if key not in self._shared_keys and isinstance(value, _MUTABLE_TYPES):
+                value = copy.deepcopy(value)
+                super().__setitem__(key, value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._owned.add(key)
+        super().__setitem__(key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def _own_all(self) -> None:
+        for key in list(super().keys()):
+            self.__getitem__(key)
+
+    def __iter__(self) -> Iterator[str]:
+        # A dict subclass that overrides __iter__ is merged through keys() and __getitem__,
+        # so dict(view) and {**view} get private copies instead of the raw shared values
+        return super().__iter__()
+
+    def items(self) -> ItemsView[str, Any]:
+        self._own_all()
+        return super().items()
+
+    def values(self) -> ValuesView[Any]:
+        self._own_all()
+        return super().values()
+
+    def copy(self) -> dict[str, Any]:
+        self._own_all()
+        return dict(super().items())
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            self.__getitem__(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        if self:
+            self.__getitem__(next(reversed(list(super().keys()))))
+        return super().popitem()
+
 
 class TrackerStatusManager:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -29,6 +104,12 @@ class TrackerStatusManager:
         self.trackers_config = cast(Mapping[str, Mapping[str, Any]], config.get('TRACKERS', {}))
 
     async def process_all_trackers(self, meta: Meta) -> int:
+        """Check every selected tracker for dupes, then decide which ones to upload to.
+
+        Interactive checks that gate the search (missing IMDb id, banned groups, each tracker's
+        pre_search_checks) run first, in tracker order. The searches then run concurrently, each on its own TrackerMetaView, and report as they
+        finish. Dupe confirmation and upload prompts follow, again in tracker order.
+        """
         tracker_status: dict[str, dict[str, bool]] = {}
         successful_trackers = 0
         client: Any = Clients(config=self.config)
@@ -42,207 +123,285 @@ class TrackerStatusManager:
             if tracker not in meta['tracker_status']:
                 meta['tracker_status'][tracker] = {}
 
-        async def process_single_tracker(tracker_name: str, shared_meta: Meta) -> tuple[str, dict[str, bool]]:
-            nonlocal successful_trackers
-            local_meta = copy.deepcopy(shared_meta)  # Ensure each task gets its own copy of meta
-            local_tracker_status = {'banned': False, 'skipped': False, 'dupe': False, 'upload': False, 'other': False}
+        tracker_names: list[str] = list(meta['trackers'])
+        tracker_classes: dict[str, Any] = {}
+        local_metas: dict[str, Meta] = {}
+        local_statuses: dict[str, dict[str, bool]] = {}
+
+        # Search results are printed as they arrive, but held back while a prompt is waiting for input
+        prompting = False
+        held_reports: list[str] = []
+
+        def report(line: str) -> None:
+            if prompting:
+                held_reports.append(line)
+            else:
+                console.print(line)
+
+        def flush_reports() -> None:
+            for line in held_reports:
+                console.print(line)
+            held_reports.clear()
+
+        async def prepare_tracker(tracker_name: str, local_meta: Meta, local_tracker_status: dict[str, bool]) -> None:
+            tracker_class = tracker_classes[tracker_name]
+            if tracker_name in {"THR", "PTP"} and local_meta.get('imdb_id', 0) == 0:
+                while True:
+                    if local_meta.get('unattended', False):
+                        local_meta['imdb_id'] = 0
+                        local_tracker_status['skipped'] = True
+                        break
+                    try:
+                        imdb_id = cli_ui.ask_string(
+                            f"Unable to find IMDB id, please enter e.g.(tt1234567) or press Enter to skip uploading to {tracker_name}:"
+                        )
+                    except EOFError:
+                        console.print("\n[red]Exiting on user request (Ctrl+C)[/red]")
+                        await cleanup_manager.cleanup()
+                        cleanup_manager.reset_terminal()
+                        sys.exit(1)
+
+                    if imdb_id is None or imdb_id.strip() == "":
+                        local_meta['imdb_id'] = 0
+                        break
+
+                    imdb_id = imdb_id.strip().lower()
+                    if imdb_id.startswith("tt") and imdb_id[2:].isdigit():
+                        local_meta['imdb_id'] = int(imdb_id[2:])
+                        local_meta['imdb'] = str(imdb_id[2:].zfill(7))
+                        local_meta['imdb_info'] = await imdb_manager.get_imdb_info_api(
+                            local_meta['imdb_id'],
+                            manual_language=local_meta.get('manual_language'),
+                            debug=bool(local_meta.get('debug', False)),
+                        )
+                        break
+                    else:
+                        cli_ui.error("Invalid IMDB ID format. Expected format: tt1234567")
+
+            result = await tracker_setup.check_banned_group(tracker_class.tracker, tracker_class.banned_groups, local_meta)
+            local_tracker_status['banned'] = bool(result)
+
+            if local_meta['tracker_status'][tracker_name].get('skip_upload'):
+                local_tracker_status['skipped'] = True
+            elif 'skipped' not in local_meta:
+                local_tracker_status['skipped'] = False
+
+            # Rule checks that may ask the user run here, in tracker order, rather than inside the
+            # concurrent search where their prompts would race each other and block the other searches
+            pre_search_checks = getattr(tracker_class, 'pre_search_checks', None)
+            if pre_search_checks is not None and not local_tracker_status['banned'] and not local_tracker_status['skipped']:
+                local_tracker_status['skipped'] = not await pre_search_checks(local_meta)
+
+        async def search_tracker(tracker_name: str) -> list[Any]:
+            local_meta = local_metas[tracker_name]
+            local_tracker_status = local_statuses[tracker_name]
+            tracker_class = tracker_classes[tracker_name]
             disctype = local_meta.get('disctype', None)
-            we_already_asked = False
 
-            if local_meta['name'].endswith('DUPE?'):
-                local_meta['name'] = local_meta['name'].replace(' DUPE?', '')
+            claimed = await tracker_setup.get_torrent_claims(local_meta, tracker_name)
+            local_tracker_status['skipped'] = bool(claimed)
+
+            if tracker_name not in {"PTP"} and not local_tracker_status['skipped']:
+                dupes: list[Any] = cast(list[Any], await tracker_class.search_existing(local_meta, disctype))
+                # set trackers here so that they are not double checked later with cross seeding
+                async with meta_lock:
+                    meta.setdefault('dupe_checked_trackers', []).append(tracker_name)
+                if local_meta['tracker_status'][tracker_name].get('other', False):
+                    local_tracker_status['other'] = True
+            elif tracker_name == "PTP":
+                # Resolved by PTP.pre_search_checks() in prepare_tracker()
+                groupID = local_meta.get('ptp_groupID')
+                async with meta_lock:
+                    meta['ptp_groupID'] = groupID
+                dupes = cast(list[Any], await tracker_class.search_existing(groupID or "", cast(dict[str, Any], local_meta), disctype))
+            else:
+                dupes = []
+
+            if ('skipping' not in local_meta or local_meta['skipping'] is None) and not local_tracker_status['skipped']:
+                dupes = cast(list[Any], await dupe_checker.filter_dupes(dupes, local_meta, tracker_name))
+                if dupes:
+                    report(f"[yellow]{tracker_name}: {len(dupes)} potential dupe(s) found")
+                else:
+                    report(f"[green]{tracker_name}: no dupes found")
+            elif local_tracker_status['skipped']:
+                report(f"[yellow]{tracker_name}: skipped")
+            return dupes
+
+        async def timed_search(tracker_name: str) -> list[Any]:
+            async with timed_stage(cast(dict[str, Any], meta), 'dupe', tracker_name):
+                return await search_tracker(tracker_name)
+
+        async def confirm_tracker(tracker_name: str, dupes: list[Any]) -> None:
+            local_meta = local_metas[tracker_name]
+            local_tracker_status = local_statuses[tracker_name]
+
+            if tracker_name == "ASC" and meta.get('anon', 'false'):
+                console.print("PT: [yellow]Aviso: Você solicitou um upload anônimo, mas o ASC não suporta essa opção.[/yellow][red] O envio não será anônimo.[/red]")
+                console.print("EN: [yellow]Warning: You requested an anonymous upload, but ASC does not support this option.[/yellow][red] The upload will not be anonymous.[/red]")
+
+            if ('skipping' not in local_meta or local_meta['skipping'] is None) and not local_tracker_status['skipped']:
+                # Run dupe check first so it can modify local_meta (e.g., set cross-seed values)
+                is_dupe, local_meta = await helper.dupe_check(dupes, local_meta, tracker_name)
+                local_metas[tracker_name] = local_meta
+                if is_dupe:
+                    local_tracker_status['dupe'] = True
+
+                matched_episode_ids = local_meta.get(f'{tracker_name}_matched_episode_ids', [])
+                trumpable_id = local_meta.get('trumpable_id')
+                cross_seed_key = f'{tracker_name}_cross_seed'
+                cross_seed_value = local_meta.get(cross_seed_key) if cross_seed_key in local_meta else None
+
+                # Only shared-state writes go under the lock
+                async with meta_lock:
+                    if matched_episode_ids:
+                        meta[f'{tracker_name}_matched_episode_ids'] = matched_episode_ids
+                    if trumpable_id:
+                        meta['trumpable_id'] = trumpable_id
+                    if cross_seed_key in local_meta and cross_seed_value:
+                        meta[cross_seed_key] = cross_seed_value
+
+                if tracker_name in ["AITHER", "LST"]:
+                    were_trumping = local_meta.get('were_trumping', False)
+                    trump_reason = local_meta.get('trump_reason')
+                    trumpable_id_after_dupe_check = local_meta.get(f'{tracker_name}_trumpable_id')
+                    async with meta_lock:
+                        if were_trumping:
+                            meta['were_trumping'] = were_trumping
+                        if trump_reason:
+                            meta['trump_reason'] = trump_reason
+                        if trumpable_id_after_dupe_check:
+                            meta[f'{tracker_name}_trumpable_id'] = trumpable_id_after_dupe_check
+
+            elif 'skipping' in local_meta:
+                local_tracker_status['skipped'] = True
+
+            if tracker_name == "MTV" and not local_tracker_status['banned'] and not local_tracker_status['skipped'] and not local_tracker_status['dupe']:
+                tracker_config = self.trackers_config.get(tracker_name, {})
+                if str(tracker_config.get('skip_if_rehash', 'false')).lower() == "true":
+                    torrent_path = os.path.abspath(f"{local_meta['base_dir']}/tmp/{local_meta['uuid']}/BASE.torrent")
+                    if not os.path.exists(torrent_path):
+                        check_torrent = await client.find_existing_torrent(cast(dict[str, Any], local_meta))
+                        if check_torrent:
+                            console.print(f"[yellow]Existing torrent found on {check_torrent}[yellow]")
+                            await TorrentCreator.create_base_from_existing_torrent(check_torrent, local_meta['base_dir'], local_meta['uuid'])
+                            torrent = Torrent.read(torrent_path)
+                            if torrent.piece_size > 8388608:
+                                console.print("[yellow]No existing torrent found with piece size lesser than 8MB[yellow]")
+                                local_tracker_status['skipped'] = True
+                    elif os.path.exists(torrent_path):
+                        torrent = Torrent.read(torrent_path)
+                        if torrent.piece_size > 8388608:
+                            console.print("[yellow]Existing torrent found with piece size greater than 8MB[yellow]")
+                            local_tracker_status['skipped'] = True
 
-            if tracker_name == "MANUAL":
-                local_tracker_status['upload'] = True
-                successful_trackers += 1
+        async def decide_upload(tracker_name: str, we_already_asked: bool) -> None:
+            nonlocal successful_trackers
+            local_meta = local_metas[tracker_name]
+            local_tracker_status = local_statuses[tracker_name]
+            tracker_class = tracker_classes[tracker_name]
+
+            if not local_meta['debug']:
+                if not local_tracker_status['banned'] and not local_tracker_status['skipped'] and not local_tracker_status['dupe']:
+                    if not local_meta.get('unattended', False):
+                        console.print(f"[bold yellow]Tracker '{tracker_name}' passed all checks.")
+                    if (
+                        not local_meta['unattended']
+                        or (local_meta['unattended'] and local_meta.get('unattended_confirm', False))
+                    ) and not we_already_asked:
+                        try:
+                            tracker_rename = await tracker_class.get_name(meta)
+                        except Exception:
+                            try:
+                                tracker_rename = await tracker_class.edit_name(meta)
+                            except Exception:
+                                tracker_rename = None
 
-            if tracker_name in tracker_class_map:
-                tracker_class: Any = tracker_class_map[tracker_name](config=self.config)
-                if tracker_name in {"THR", "PTP"} and local_meta.get('imdb_id', 0) == 0:
-                    while True:
-                        if local_meta.get('unattended', False):
-                            local_meta['imdb_id'] = 0
-                            local_tracker_status['skipped'] = True
-                            break
+                        display_name: Optional[str] = None
+                        if tracker_rename is not None:
+                            if isinstance(tracker_rename, dict) and 'name' in tracker_rename:
+                                display_name = cast(str, tracker_rename['name'])
+                            elif isinstance(tracker_rename, str):
+                                display_name = tracker_rename
+
+                        if display_name is not None and display_name != "" and display_name != meta['name']:
+                            console.print(f"[bold yellow]{tracker_name} applies a naming change for this release: [green]{display_name}[/green][/bold yellow]")
                         try:
-                            imdb_id = cli_ui.ask_string(
-                                f"Unable to find IMDB id, please enter e.g.(tt1234567) or press Enter to skip uploading to {tracker_name}:"
+                            edit_choice = cli_ui.ask_string(
+                                "Enter 'y' to upload, or press enter to skip uploading:"
                             )
+                            if (edit_choice or "").lower() == 'y':
+                                local_tracker_status['upload'] = True
+                                successful_trackers += 1
+                            else:
+                                local_tracker_status['upload'] = False
                         except EOFError:
                             console.print("\n[red]Exiting on user request (Ctrl+C)[/red]")
                             await cleanup_manager.cleanup()
                             cleanup_manager.reset_terminal()
                             sys.exit(1)
-
-                        if imdb_id is None or imdb_id.strip() == "":
-                            local_meta['imdb_id'] = 0
-                            break
-
-                        imdb_id = imdb_id.strip().lower()
-                        if imdb_id.startswith("tt") and imdb_id[2:].isdigit():
-                            local_meta['imdb_id'] = int(imdb_id[2:])
-                            local_meta['imdb'] = str(imdb_id[2:].zfill(7))
-                            local_meta['imdb_info'] = await imdb_manager.get_imdb_info_api(
-                                local_meta['imdb_id'],
-                                manual_language=local_meta.get('manual_language'),
-                                debug=bool(local_meta.get('debug', False)),
-                            )
-                            break
-                        else:
-                            cli_ui.error("Invalid IMDB ID format. Expected format: tt1234567")
-
-                result = await tracker_setup.check_banned_group(tracker_class.tracker, tracker_class.banned_groups, local_meta)
-                local_tracker_status['banned'] = bool(result)
-
-                if local_meta['tracker_status'][tracker_name].get('skip_upload'):
-                    local_tracker_status['skipped'] = True
-                elif 'skipped' not in local_meta:
-                    local_tracker_status['skipped'] = False
-
-                if not local_tracker_status['banned'] and not local_tracker_status['skipped']:
-                    claimed = await tracker_setup.get_torrent_claims(local_meta, tracker_name)
-                    local_tracker_status['skipped'] = bool(claimed)
-
-                    if tracker_name not in {"PTP"} and not local_tracker_status['skipped']:
-                        dupes: list[Any] = cast(list[Any], await tracker_class.search_existing(local_meta, disctype))
-                        # set trackers here so that they are not double checked later with cross seeding
-                        async with meta_lock:
-                            meta.setdefault('dupe_checked_trackers', []).append(tracker_name)
-                        if local_meta['tracker_status'][tracker_name].get('other', False):
-                            local_tracker_status['other'] = True
-                    elif tracker_name == "PTP":
-                        ptp: Any = PTP(config=self.config)
-                        groupID = await ptp.get_group_by_imdb(local_meta['imdb'])
-                        async with meta_lock:
-                            meta['ptp_groupID'] = groupID
-                        dupes = cast(list[Any], await ptp.search_existing(groupID or "", cast(dict[str, Any], local_meta), disctype))
                     else:
-                        dupes = []
-
-                    if tracker_name == "ASC" and meta.get('anon', 'false'):
-                        console.print("PT: [yellow]Aviso: Você solicitou um upload anônimo, mas o ASC não suporta essa opção.[/yellow][red] O envio não será anônimo.[/red]")
-                        console.print("EN: [yellow]Warning: You requested an anonymous upload, but ASC does not support this option.[/yellow][red] The upload will not be anonymous.[/red]")
-
-                    if ('skipping' not in local_meta or local_meta['skipping'] is None) and not local_tracker_status['skipped']:
-                        dupes = cast(list[Any], await dupe_checker.filter_dupes(dupes, local_meta, tracker_name))
-
-                        # Run dupe check first so it can modify local_meta (e.g., set cross-seed values)
-                        is_dupe, local_meta = await helper.dupe_check(dupes, local_meta, tracker_name)
-                        if is_dupe:
-                            local_tracker_status['dupe'] = True
-
-                        matched_episode_ids = local_meta.get(f'{tracker_name}_matched_episode_ids', [])
-                        trumpable_id = local_meta.get('trumpable_id')
-                        cross_seed_key = f'{tracker_name}_cross_seed'
-                        cross_seed_value = local_meta.get(cross_seed_key) if cross_seed_key in local_meta else None
-
-                        # Only shared-state writes go under the lock
-                        async with meta_lock:
-                            if matched_episode_ids:
-                                meta[f'{tracker_name}_matched_episode_ids'] = matched_episode_ids
-                            if trumpable_id:
-                                meta['trumpable_id'] = trumpable_id
-                            if cross_seed_key in local_meta and cross_seed_value:
-                                meta[cross_seed_key] = cross_seed_value
-
-                        if tracker_name in ["AITHER", "LST"]:
-                            were_trumping = local_meta.get('were_trumping', False)
-                            trump_reason = local_meta.get('trump_reason')
-                            trumpable_id_after_dupe_check = local_meta.get(f'{tracker_name}_trumpable_id')
-                            async with meta_lock:
-                                if were_trumping:
-                                    meta['were_trumping'] = were_trumping
-                                if trump_reason:
-                                    meta['trump_reason'] = trump_reason
-                                if trumpable_id_after_dupe_check:
-                                    meta[f'{tracker_name}_trumpable_id'] = trumpable_id_after_dupe_check
-
-                    elif 'skipping' in local_meta:
-                        local_tracker_status['skipped'] = True
+                        local_tracker_status['upload'] = True
+                        successful_trackers += 1
+            else:
+                local_tracker_status['upload'] = True
+                successful_trackers += 1
 
-                    if tracker_name == "MTV" and not local_tracker_status['banned'] and not local_tracker_status['skipped'] and not local_tracker_status['dupe']:
-                        tracker_config = self.trackers_config.get(tracker_name, {})
-                        if str(tracker_config.get('skip_if_rehash', 'false')).lower() == "true":
-                            torrent_path = os.path.abspath(f"{local_meta['base_dir']}/tmp/{local_meta['uuid']}/BASE.torrent")
-                            if not os.path.exists(torrent_path):
-                                check_torrent = await client.find_existing_torrent(cast(dict[str, Any], local_meta))
-                                if check_torrent:
-                                    console.print(f"[yellow]Existing torrent found on {check_torrent}[yellow]")
-                                    await TorrentCreator.create_base_from_existing_torrent(check_torrent, local_meta['base_dir'], local_meta['uuid'])
-                                    torrent = Torrent.read(torrent_path)
-                                    if torrent.piece_size > 8388608:
-                                        console.print("[yellow]No existing torrent found with piece size lesser than 8MB[yellow]")
-                                        local_tracker_status['skipped'] = True
-                            elif os.path.exists(torrent_path):
-                                torrent = Torrent.read(torrent_path)
-                                if torrent.piece_size > 8388608:
-                                    console.print("[yellow]Existing torrent found with piece size greater than 8MB[yellow]")
-                                    local_tracker_status['skipped'] = True
-
-                    we_already_asked = bool(local_meta.get('we_asked', False))
-
-                if not local_meta['debug']:
-                    if not local_tracker_status['banned'] and not local_tracker_status['skipped'] and not local_tracker_status['dupe']:
-                        if not local_meta.get('unattended', False):
-                            console.print(f"[bold yellow]Tracker '{tracker_name}' passed all checks.")
-                        if (
-                            not local_meta['unattended']
-                            or (local_meta['unattended'] and local_meta.get('unattended_confirm', False))
-                        ) and not we_already_asked:
-                            try:
-                                tracker_rename = await tracker_class.get_name(meta)
-                            except Exception:
-                                try:
-                                    tracker_rename = await tracker_class.edit_name(meta)
-                                except Exception:
-                                    tracker_rename = None
-
-                            display_name: Optional[str] = None
-                            if tracker_rename is not None:
-                                if isinstance(tracker_rename, dict) and 'name' in tracker_rename:
-                                    display_name = cast(str, tracker_rename['name'])
-                                elif isinstance(tracker_rename, str):
-                                    display_name = tracker_rename
-
-                            if display_name is not None and display_name != "" and display_name != meta['name']:
-                                console.print(f"[bold yellow]{tracker_name} applies a naming change for this release: [green]{display_name}[/green][/bold yellow]")
-                            try:
-                                edit_choice = cli_ui.ask_string(
-                                    "Enter 'y' to upload, or press enter to skip uploading:"
-                                )
-                                if (edit_choice or "").lower() == 'y':
-                                    local_tracker_status['upload'] = True
-                                    successful_trackers += 1
-                                else:
-                                    local_tracker_status['upload'] = False
-                            except EOFError:
-                                console.print("\n[red]Exiting on user request (Ctrl+C)[/red]")
-                                await cleanup_manager.cleanup()
-                                cleanup_manager.reset_terminal()
-                                sys.exit(1)
-                        else:
-                            local_tracker_status['upload'] = True
-                            successful_trackers += 1
-                else:
+        for tracker_name in tracker_names:
+            local_meta = TrackerMetaView(meta)
+            if local_meta['name'].endswith('DUPE?'):
+                local_meta['name'] = local_meta['name'].replace(' DUPE?', '')
+            local_metas[tracker_name] = local_meta
+            local_statuses[tracker_name] = {'banned': False, 'skipped': False, 'dupe': False, 'upload': False, 'other': False}
+            if tracker_name in tracker_class_map:
+                tracker_classes[tracker_name] = tracker_class_map[tracker_name](config=self.config)
+                await prepare_tracker(tracker_name, local_meta, local_statuses[tracker_name])
+
+        searching_trackers = [
+            name for name in tracker_names
+            if name in tracker_classes and not local_statuses[name]['banned'] and not local_statuses[name]['skipped']
+        ]
+        if searching_trackers:
+            console.print(f"[yellow]Searching for existing torrents on: {', '.join(searching_trackers)}...")
+        search_tasks = {name: asyncio.create_task(timed_search(name)) for name in searching_trackers}
+
+        try:
+            for tracker_name in tracker_names:
+                local_tracker_status = local_statuses[tracker_name]
+                if tracker_name == "MANUAL":
                     local_tracker_status['upload'] = True
                     successful_trackers += 1
 
-            return tracker_name, local_tracker_status
+                if tracker_name in tracker_classes:
+                    we_already_asked = False
+                    search_task = search_tasks.get(tracker_name)
+                    if search_task is not None:
+                        dupes = await search_task
+                        prompting = True
+                        try:
+                            await confirm_tracker(tracker_name, dupes)
+                        finally:
+                            prompting = False
+                            flush_reports()
+                        we_already_asked = bool(local_metas[tracker_name].get('we_asked', False))
+                    prompting = True
+                    try:
+                        await decide_upload(tracker_name, we_already_asked)
+                    finally:
+                        prompting = False
+                        flush_reports()
+
+                tracker_status[tracker_name] = local_tracker_status
+        finally:
+            for task in search_tasks.values():
+                task.cancel()
 
         if meta.get('unattended', False):
-            searching_trackers: list[str] = [name for name in meta['trackers'] if name in tracker_class_map]
-            if searching_trackers:
-                console.print(f"[yellow]Searching for existing torrents on: {', '.join(searching_trackers)}...")
-            tasks = [process_single_tracker(tracker_name, meta) for tracker_name in meta['trackers']]
-            results = await asyncio.gather(*tasks)
-
             # Collect passed trackers and skip reasons
             passed_trackers: list[str] = []
             dupe_trackers: list[str] = []
             skipped_trackers: list[str] = []
 
-            for tracker_name, status in results:
-                tracker_status[tracker_name] = status
+            for tracker_name, status in tracker_status.items():
                 if not status['banned'] and not status['skipped'] and not status['dupe']:
                     passed_trackers.append(tracker_name)
                 elif status['dupe']:
@@ -256,15 +415,6 @@ class TrackerStatusManager:
                 console.print(f"[red]Found potential dupes on: [bold yellow]{', '.join(dupe_trackers)}[/bold yellow].")
             if passed_trackers:
                 console.print(f"[bold green]Trackers passed all checks: [bold yellow]{', '.join(passed_trackers)}")
-        else:
-            passed_trackers: list[str] = []
-            for tracker_name in meta['trackers']:
-                if tracker_name in tracker_class_map:
-                    console.print(f"[yellow]Searching for existing torrents on {tracker_name}...")
-                tracker_name, status = await process_single_tracker(tracker_name, meta)
-                tracker_status[tracker_name] = status
-                if not status['banned'] and not status['skipped'] and not status['dupe']:
-                    passed_trackers.append(tracker_name)
 
         if meta['debug']:
             console.print("\n[bold]Tracker Processing Summary:[/bold]")
@@ -1,6 +1,5 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
-import base64
 import contextlib
 import gc
 import glob
@@ -11,16 +10,23 @@ import time
 from collections.abc import Sequence
 from typing import Any, Optional, Union, cast
 
-import aiofiles
 import httpx
 import pyimgbox
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.hostlimits import end_observation, host_controller, observe_upload, retry_delay, save_host_limits, upload_client
+from src.imagehostcache import find_hosted_image, host_key, image_digest, image_host_cache
+from src.imageprobe import fetch_deferred_images
+from src.multipart import FileValue, StreamedFile, multipart_request
+from src.pipeline import protect_task
 
 Meta: TypeAlias = dict[str, Any]
 ImageDict: TypeAlias = dict[str, Any]
 
+# Seconds one upload may take once its host has a free slot.
+UPLOAD_TIMEOUT = 60.0
+
 
 class UploadScreensManager:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -55,7 +61,52 @@ class UploadScreensManager:
 
 
 async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
+    """Upload one image, reusing an earlier upload of the same bytes to the same host when there is one."""
     image, img_host, config, meta = args
+    key = host_key(img_host, config)
+    cache = image_host_cache(meta, config)
+    digest: Optional[str] = None
+    if cache is not None:
+        with contextlib.suppress(OSError):
+            digest = await asyncio.to_thread(image_digest, image)
+    if cache is not None and digest is not None:
+        hosted = await find_hosted_image(cache, digest, key, bool(meta.get('debug')))
+        if hosted is not None:
+            if meta.get('debug'):
+                console.print(f"[green]{os.path.basename(image)} is already on {img_host}: {hosted[1]}[/green]")
+            img_url, raw_url, web_url = hosted
+            return {'status': 'success', 'img_url': img_url, 'raw_url': raw_url, 'web_url': web_url, 'local_file_path': image}
+
+    result = await _limited_upload(image, img_host, key, config, meta)
+    if cache is not None and digest is not None and result.get('status') == 'success':
+        await asyncio.to_thread(cache.put, digest, key, (str(result['img_url']), str(result['raw_url']), str(result['web_url'])))
+    return result
+
+
+async def _limited_upload(image: str, img_host: str, key: str, config: dict[str, Any], meta: Meta) -> dict[str, Any]:
+    """Upload inside the host's adaptive concurrency limit; the timeout only starts once a slot is free."""
+    controller = host_controller(key, meta.get('base_dir'))
+    await controller.acquire()
+    observation, token = observe_upload()
+    released = False
+    try:
+        try:
+            result = await asyncio.wait_for(_upload_image(image, img_host, config, meta), timeout=UPLOAD_TIMEOUT)
+        except asyncio.TimeoutError:
+            console.print(f"[red]Upload of {os.path.basename(image)} to {img_host} timed out after {UPLOAD_TIMEOUT:.0f} seconds[/red]")
+            result = {'status': 'failed', 'reason': 'Request timed out'}
+        success = result.get('status') == 'success'
+        throttled = observation.throttled or 'timed out' in str(result.get('reason', '')).lower()
+        controller.release(success, throttled, observation.retry_after)
+        released = True
+        return result
+    finally:
+        end_observation(token)
+        if not released:
+            controller.release(False, False)
+
+
+async def _upload_image(image: str, img_host: str, config: dict[str, Any], meta: Meta) -> dict[str, Any]:
     try:
         timeout = 60  # Default timeout
         img_url, raw_url, web_url = None, None, None
@@ -90,17 +141,14 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 return {'status': 'failed', 'reason': 'Missing ptpimg API key in config'}
 
             try:
-                async with httpx.AsyncClient() as client:
-                    async with aiofiles.open(image, 'rb') as file:
-                        files = {'file-upload[0]': (os.path.basename(image), await file.read())}
-                        headers = {'referer': 'https://ptpimg.me/index.php'}
+                async with upload_client() as client:
+                    files: dict[str, FileValue] = {'file-upload[0]': StreamedFile(image)}
+                    headers = {'referer': 'https://ptpimg.me/index.php'}
 
                     try:
                         response = await client.post(
                             "https://ptpimg.me/upload.php",
-                            headers=headers,
-                            data=payload,
-                            files=files,
+                            **multipart_request(payload, files, headers),
                             timeout=timeout
                         )
 
@@ -132,16 +180,11 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "imgbb":
             url = "https://api.imgbb.com/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(await img_file.read()).decode('utf8')
-
-                data = {
-                    'key': config['DEFAULT']['imgbb_api'],
-                    'image': encoded_image,
-                }
+                data = {'key': config['DEFAULT']['imgbb_api']}
+                files = {'image': StreamedFile(image, base64=True)}
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, timeout=timeout)
+                async with upload_client() as client:
+                    response = await client.post(url, **multipart_request(data, files), timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get('success'):
                         console.print("[yellow]imgbb failed, trying next image host")
@@ -171,15 +214,10 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "dalexni":
             url = "https://dalexni.com/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(await img_file.read()).decode('utf8')
-
-                data = {
-                    'key': config['DEFAULT']['dalexni_api'],
-                    'image': encoded_image,
-                }
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, timeout=timeout)
+                data = {'key': config['DEFAULT']['dalexni_api']}
+                files = {'image': StreamedFile(image, base64=True)}
+                async with upload_client() as client:
+                    response = await client.post(url, **multipart_request(data, files), timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get('success'):
                         console.print("[yellow]DALEXNI failed, trying next image host")
@@ -213,12 +251,10 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['ptscreens_api']
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as file:
-                    files = {
-                        'source': ('file-upload[0]', await file.read())
-                    }
+                async with upload_client() as client:
+                    files = {'source': StreamedFile(image, 'file-upload[0]')}
 
-                    response = await client.post(url, headers=headers, files=files, timeout=timeout)
+                    response = await client.post(url, **multipart_request(files=files, headers=headers), timeout=timeout)
                     response_data = response.json()
 
                     if response.status_code != 200:
@@ -245,18 +281,13 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "utppm":
             url = "https://utp.pm/api/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(await img_file.read()).decode('utf8')
-
-                data = {
-                    'source': encoded_image
-                }
+                files = {'source': StreamedFile(image, base64=True)}
                 headers = {
                     'X-API-Key': config['DEFAULT']['utppm_api'],
                 }
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, headers=headers, timeout=timeout)
+                async with upload_client() as client:
+                    response = await client.post(url, **multipart_request(files=files, headers=headers), timeout=timeout)
                     response_data = response.json()
 
                     if response.status_code != 200:
@@ -283,18 +314,13 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "onlyimage":
             url = "https://onlyimage.org/api/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(await img_file.read()).decode('utf8')
-
-                data = {
-                    'image': encoded_image
-                }
+                files = {'image': StreamedFile(image, base64=True)}
                 headers = {
                     'X-API-Key': config['DEFAULT']['onlyimage_api'],
                 }
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, headers=headers, timeout=timeout)
+                async with upload_client() as client:
+                    response = await client.post(url, **multipart_request(files=files, headers=headers), timeout=timeout)
                     response_data = response.json()
 
                     if response.status_code != 200 or not response_data.get('success'):
@@ -326,12 +352,10 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'max_th_size': 350
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as file:
-                    files = {
-                        'img': ('file-upload[0]', await file.read())
-                    }
+                async with upload_client() as client:
+                    files = {'img': StreamedFile(image, 'file-upload[0]')}
 
-                    response = await client.post(url, data=data, files=files, timeout=timeout)
+                    response = await client.post(url, **multipart_request(data, files), timeout=timeout)
 
                     if response.status_code != 200:
                         console.print(f"[yellow]pixhost failed with status code {response.status_code}, trying next image host")
@@ -365,15 +389,12 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "lensdump":
             url = "https://lensdump.com/api/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    data = {
-                        'image': base64.b64encode(await img_file.read()).decode('utf8')
-                    }
+                files = {'image': StreamedFile(image, base64=True)}
                 headers = {
                     'X-API-Key': config['DEFAULT']['lensdump_api']
                 }
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, headers=headers, timeout=timeout)
+                async with upload_client() as client:
+                    response = await client.post(url, **multipart_request(files=files, headers=headers), timeout=timeout)
                     response_data = response.json()
                     if response_data.get('status_code') == 200:
                         img_url = response_data['data']['image']['url']
@@ -398,15 +419,12 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 return {'status': 'failed', 'reason': 'Missing Zipline URL or API key'}
 
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    filename = os.path.basename(image)
-                    file_bytes = await img_file.read()
                 headers = {
                     'Authorization': f'{api_key}',
                 }
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(url, files={'file': (filename, file_bytes)}, headers=headers, timeout=timeout)
+                async with upload_client() as client:
+                    response = await client.post(url, **multipart_request(files={'file': StreamedFile(image)}, headers=headers), timeout=timeout)
                     if response.status_code == 200:
                         response_data = response.json()
                         if 'files' in response_data:
@@ -448,9 +466,9 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': pass_api_key
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
-                    files = {'source': (os.path.basename(image), await img_file.read())}
-                    response = await client.post(url, headers=headers, files=files, timeout=timeout)
+                async with upload_client() as client:
+                    files = {'source': StreamedFile(image)}
+                    response = await client.post(url, **multipart_request(files=files, headers=headers), timeout=timeout)
 
                     if 'application/json' in response.headers.get('Content-Type', ''):
                         response_data = response.json()
@@ -499,10 +517,10 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
             try:
                 headers = {'Authorization': f'Bearer {api_key}'}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
-                    files = {'files[]': (os.path.basename(image), await img_file.read())}
+                async with upload_client() as client:
+                    files = {'files[]': StreamedFile(image)}
 
-                    response = await client.post(url, headers=headers, files=files, timeout=timeout)
+                    response = await client.post(url, **multipart_request(files=files, headers=headers), timeout=timeout)
 
                     if response.status_code not in (200, 201):
                         console.print(f"[yellow]Seedpool CDN failed with status code {response.status_code}, trying next image host")
@@ -559,9 +577,9 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 headers = {'Authorization': f'{api_key}'}
                 data = {'title': 'Upload-Assistant screenshot'}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
-                    files = {'file': (os.path.basename(image), await img_file.read())}
-                    response = await client.post(url, headers=headers, data=data, files=files, timeout=timeout)
+                async with upload_client() as client:
+                    files = {'file': StreamedFile(image)}
+                    response = await client.post(url, **multipart_request(data, files, headers), timeout=timeout)
 
                     content_type = response.headers.get('Content-Type', '')
                     if 'application/json' in content_type:
@@ -690,6 +708,12 @@ async def _upload_screens(
         existing_images: list[ImageDict] = []
         existing_count = 0
     else:
+        existing_images = [img for img in image_list if img.get('img_url') and img.get('web_url')]
+        existing_count = len(existing_images)
+        if existing_count < total_screens or retry_mode or img_host != initial_img_host:
+            # Description images validated from their headers alone are only saved once they are uploaded
+            await fetch_deferred_images(meta)
+
         image_patterns = ["*.png", ".[!.]*.png"]
         image_glob: list[str] = []
         for pattern in image_patterns:
@@ -719,9 +743,6 @@ async def _upload_screens(
         if meta['debug']:
             console.print("image globs (sorted):", image_glob)
 
-        existing_images = [img for img in image_list if img.get('img_url') and img.get('web_url')]
-        existing_count = len(existing_images)
-
     # Determine images needed
     images_needed = total_screens - existing_count if not retry_mode else total_screens
     if meta['debug']:
@@ -736,13 +757,6 @@ async def _upload_screens(
         for index, image in enumerate(image_glob[:images_needed])
     ]
 
-    # Concurrency Control
-    default_pool_size = len(upload_tasks)
-    host_limits = {"onlyimage": 6, "ptscreens": 6, "lensdump": 1, "passtheimage": 6}
-    pool_size = host_limits.get(img_host, default_pool_size)
-    max_workers = min(len(upload_tasks), pool_size)
-    semaphore = asyncio.Semaphore(max_workers)
-
     # Track running tasks for cancellation
     running_tasks: set[asyncio.Task[dict[str, Any]]] = set()
 
@@ -754,67 +768,54 @@ async def _upload_screens(
         index, *task_args = task
         retry_count = 0
 
-        async with semaphore:
-            while retry_count <= max_retries:
-                future: Optional[asyncio.Task[dict[str, Any]]] = None
-                try:
-                    future = asyncio.create_task(upload_image_task(task_args))
-                    running_tasks.add(future)
+        while retry_count <= max_retries:
+            future: Optional[asyncio.Task[dict[str, Any]]] = None
+            try:
+                future = asyncio.create_task(upload_image_task(task_args))
+                # Uploads streamed during capture must outlive the cleanup() that ends screenshots()
+                protect_task(future)
+                running_tasks.add(future)
 
-                    try:
-                        result = await asyncio.wait_for(future, timeout=60.0)
-                        running_tasks.discard(future)
+                result = await future
+                running_tasks.discard(future)
 
-                        if result.get('status') == 'success':
-                            return (index, result)
-                        else:
-                            reason = result.get('reason', 'Unknown error')
-                            if "duplicate" in reason.lower():
-                                console.print(f"[yellow]Skipping host because duplicate image {index}: {reason}[/yellow]")
-                                return None
-                            elif "api key" in reason.lower():
-                                console.print(f"[red]API key error for {img_host}. Aborting further attempts.[/red]")
-                                return None
-                            if retry_count < max_retries:
-                                retry_count += 1
-                                console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {reason}[/yellow]")
-                                await asyncio.sleep(1.1 * retry_count)
-                                continue
-                            else:
-                                console.print(f"[red]Failed to upload image {index} after {max_retries} attempts: {reason}[/red]")
-                                return None
-
-                    except asyncio.TimeoutError:
-                        console.print(f"[red]Upload task {index} timed out after 60 seconds[/red]")
-                        if future in running_tasks:
-                            future.cancel()
-                            running_tasks.discard(future)
-
-                        if retry_count < max_retries:
-                            retry_count += 1
-                            console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index} after timeout[/yellow]")
-                            await asyncio.sleep(1.1 * retry_count)
-                            continue
+                if result.get('status') == 'success':
+                    return (index, result)
+                else:
+                    reason = result.get('reason', 'Unknown error')
+                    if "duplicate" in reason.lower():
+                        console.print(f"[yellow]Skipping host because duplicate image {index}: {reason}[/yellow]")
+                        return None
+                    elif "api key" in reason.lower():
+                        console.print(f"[red]API key error for {img_host}. Aborting further attempts.[/red]")
                         return None
-
-                except asyncio.CancelledError:
-                    console.print(f"[red]Upload task {index} cancelled.[/red]")
-                    if future and future in running_tasks:
-                        future.cancel()
-                        running_tasks.discard(future)
-                    return None
-
-                except Exception as e:
-                    console.print(f"[red]Error during upload for image {index}: {str(e)}[/red]")
                     if retry_count < max_retries:
                         retry_count += 1
-                        console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {str(e)}[/yellow]")
-                        await asyncio.sleep(1.5 * retry_count)
+                        console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {reason}[/yellow]")
+                        await asyncio.sleep(retry_delay(retry_count))
                         continue
                     else:
-                        console.print(f"[red]Error during upload for image {index} after {max_retries} attempts: {str(e)}[/red]")
+                        console.print(f"[red]Failed to upload image {index} after {max_retries} attempts: {reason}[/red]")
                         return None
 
+            except asyncio.CancelledError:
+                console.print(f"[red]Upload task {index} cancelled.[/red]")
+                if future and future in running_tasks:
+                    future.cancel()
+                    running_tasks.discard(future)
+                return None
+
+            except Exception as e:
+                console.print(f"[red]Error during upload for image {index}: {str(e)}[/red]")
+                if retry_count < max_retries:
+                    retry_count += 1
+                    console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {str(e)}[/yellow]")
+                    await asyncio.sleep(retry_delay(retry_count))
+                    continue
+                else:
+                    console.print(f"[red]Error during upload for image {index} after {max_retries} attempts: {str(e)}[/red]")
+                    return None
+
         return None
 
     try:
@@ -892,9 +893,89 @@ async def _upload_screens(
 
     finally:
         # Cleanup
+        await asyncio.to_thread(save_host_limits)
         gc.collect()
 
 
+class ScreenshotUploadStream:
+    """Upload screenshots to meta['imghost'] while the remaining frames are still being captured.
+
+    takescreens.screenshots() put()s each image once it has been optimized and passed the size
+    checks, and a pool of workers uploads it straight away. finish() appends the results to
+    meta['image_list'] in screenshot order, but only when every image made it: otherwise nothing
+    is recorded and the regular upload_screens() pass, with its image host fallback, takes over.
+    """
+
+    def __init__(self, config: dict[str, Any], meta: Meta, allowed_hosts: Optional[list[str]] = None) -> None:
+        self.config = config
+        self.meta = meta
+        self.allowed_hosts = allowed_hosts
+        self._queue: asyncio.Queue[Optional[tuple[int, str]]] = asyncio.Queue()
+        self._uploaded: dict[int, tuple[ImageDict, str]] = {}
+        self._failed = 0
+        self._workers: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        # Every screenshot gets a worker; the image host's controller decides how many upload at once
+        workers = max(1, int(self.meta.get('screens') or 1))
+        for worker in range(workers):
+            task = asyncio.create_task(self._worker(), name=f"screen-upload:{worker}")
+            protect_task(task)
+            self._workers.append(task)
+
+    def put(self, index: int, image_path: str) -> None:
+        self._queue.put_nowait((index, image_path))
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            index, image_path = item
+            try:
+                images, _ = await _upload_screens(self.config, self.meta, 1, 1, 0, 1, [image_path], {}, allowed_hosts=self.allowed_hosts)
+            except Exception as e:
+                images = []
+                if self.meta.get('debug'):
+                    console.print(f"[yellow]Streamed upload of {image_path} failed: {e}[/yellow]")
+            if images:
+                self._uploaded[index] = (images[0], image_path)
+            else:
+                self._failed += 1
+
+    async def finish(self, min_images: int) -> int:
+        """Wait for the queued uploads and record them; returns how many were added to meta['image_list']."""
+        for _ in self._workers:
+            self._queue.put_nowait(None)
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        if self._failed or len(self._uploaded) < min_images:
+            if self._uploaded or self._failed:
+                console.print(f"[yellow]Streamed {len(self._uploaded)} screenshot upload(s) with {self._failed} failure(s); uploading after capture instead.[/yellow]")
+            return 0
+
+        image_list = cast(list[ImageDict], self.meta.setdefault('image_list', []))
+        image_sizes = cast(dict[str, Any], self.meta.setdefault('image_sizes', {}))
+        known_urls = {img.get('raw_url') for img in image_list}
+        added = 0
+        for index in sorted(self._uploaded):
+            upload, image_path = self._uploaded[index]
+            if upload['raw_url'] in known_urls:
+                continue
+            image_list.append({'img_url': upload['img_url'], 'raw_url': upload['raw_url'], 'web_url': upload['web_url']})
+            with contextlib.suppress(OSError):
+                image_sizes[upload['raw_url']] = await asyncio.to_thread(os.path.getsize, image_path)
+            added += 1
+        console.print(f"[green]Successfully obtained and uploaded {added} images.")
+        return added
+
+    async def aclose(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+
 async def imgbox_upload(
     chdir: str,
     image_glob: list[str],
@@ -5,12 +5,11 @@ import re
 import sys
 from typing import Any, Optional, cast
 
-import aiofiles
 import cli_ui
 
 from src.cleanup import cleanup_manager
 from src.console import console
-from src.exportmi import mi_resolution
+from src.exportmi import get_mediainfo_json, mi_resolution
 
 
 class VideoManager:
@@ -252,8 +251,7 @@ class VideoManager:
                         mi = {}
                 dvd_mi_text = str(disc.get('vob_mi', '') or disc.get('ifo_mi', ''))
         else:
-            async with aiofiles.open(f'{base_dir}/tmp/{folder_id}/MediaInfo.json', encoding='utf-8') as f:
-                mi = cast(dict[str, Any], json.loads(await f.read()))
+            mi = await get_mediainfo_json(meta, base_dir, folder_id)
 
         tracks = mi.get('media', {}).get('track', []) if isinstance(mi, dict) else []
         video_track = tracks[1] if isinstance(tracks, list) and len(tracks) > 1 and isinstance(tracks[1], dict) else {}
@@ -20,7 +20,6 @@ from typing import Any, Optional, cast
 
 import aiofiles
 import cli_ui
-import discord
 import requests
 from packaging import version
 from torf import Torrent
@@ -28,7 +27,6 @@ from typing_extensions import TypeAlias
 
 from bin.get_mkbrr import MkbrrBinaryManager
 from cogs.redaction import Redaction
-from discordbot import DiscordNotifier
 from src.add_comparison import ComparisonManager
 from src.args import Args
 from src.cleanup import cleanup_manager
@@ -40,19 +38,20 @@ from src.get_desc import gen_desc
 from src.get_name import NameManager
 from src.get_tracker_data import TrackerDataManager
 from src.languages import languages_manager
+from src.metadatacache import configure_metadata_cache, print_metadata_cache_stats
 from src.nfo_link import NfoLinkManager
+from src.pipeline import await_stage, cancel_stage, print_stage_timings, record_stage, start_stage, timed_stage
 from src.qbitwait import Wait
 from src.queuemanage import QueueManager
+from src.queueprefetch import QueuePrefetcher, lookahead_torrent_meta, queue_lookahead_depth
 from src.takescreens import TakeScreensManager
 from src.torrentcreate import TorrentCreator
 from src.trackerhandle import process_trackers
-from src.trackers.AR import AR
 from src.trackers.COMMON import COMMON
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, api_trackers, http_trackers, other_api_trackers, tracker_class_map
 from src.trackerstatus import TrackerStatusManager
 from src.uphelper import UploadHelper
-from src.uploadscreens import UploadScreensManager
+from src.uploadscreens import ScreenshotUploadStream, UploadScreensManager
 
 cli_ui.setup(color='always', title="Upload Assistant")
 base_dir = os.path.abspath(os.path.dirname(__file__))
@@ -428,9 +427,119 @@ async def validate_tracker_logins(meta: Meta, trackers: Optional[list[str]] = No
         await asyncio.gather(*[validate_single_tracker(tracker) for tracker in valid_trackers])
 
 
+def resolve_image_hosts(meta: Meta) -> tuple[list[str], Optional[list[str]]]:
+    """Return (trackers with image host rules, hosts all of them accept) and switch meta['imghost'] to an accepted one."""
+    trackers_with_image_host_requirements = {'A4K', 'BHD', 'DC', 'GPW', 'HUNO', 'MTV', 'OE', 'PTP', 'STC', 'TVC'}
+
+    relevant_trackers = [
+        t for t in cast(list[Any], meta.get('trackers', []))
+        if isinstance(t, str) and t in trackers_with_image_host_requirements and t in tracker_class_map
+    ]
+
+    # If all relevant trackers share exactly one common approved host that the user has configured,
+    # and it's not the initially selected host, switch meta['imghost'] to that common host.
+    # If multiple common hosts exist, pick the first by config priority (img_host_1..img_host_9).
+    allowed_hosts: Optional[list[str]] = None
+    if relevant_trackers:
+        try:
+            tracker_instances = {
+                tracker_name: tracker_class_map[tracker_name](config=config)
+                for tracker_name in relevant_trackers
+            }
+
+            if meta.get('debug'):
+                console.print(f"[cyan]Image host debug: meta['imghost']={meta.get('imghost')} img_host_1={config['DEFAULT'].get('img_host_1')}[/cyan]")
+                console.print(f"[cyan]Image host debug: relevant_trackers={relevant_trackers}[/cyan]")
+
+            default_cfg_obj = config.get('DEFAULT', {})
+            default_cfg: dict[str, Any] = cast(dict[str, Any], default_cfg_obj) if isinstance(default_cfg_obj, dict) else {}
+            configured_hosts: list[str] = []
+            for host_index in range(1, 10):
+                host_key = f'img_host_{host_index}'
+                if host_key in default_cfg:
+                    host = default_cfg.get(host_key)
+                    if host and host not in configured_hosts:
+                        configured_hosts.append(str(host))
+
+            if meta.get('debug'):
+                console.print(f"[cyan]Image host debug: configured_hosts={configured_hosts}[/cyan]")
+
+            approved_sets: list[set[str]] = []
+            all_known = True
+            for tracker_name in relevant_trackers:
+                tracker_instance = tracker_instances[tracker_name]
+                approved_hosts = getattr(tracker_instance, 'approved_image_hosts', None)
+                if not approved_hosts:
+                    all_known = False
+                    break
+                if isinstance(approved_hosts, (list, set, tuple)):
+                    approved_hosts_list = [
+                        str(host)
+                        for host in cast(Iterable[Any], approved_hosts)
+                    ]
+                    approved_sets.append(set(approved_hosts_list))
+                else:
+                    all_known = False
+                    break
+
+                if meta.get('debug'):
+                    console.print(
+                        f"[cyan]Image host debug: {tracker_name}.approved_image_hosts={approved_hosts_list}[/cyan]"
+                    )
+
+            if all_known and approved_sets and configured_hosts:
+                common_hosts: set[str] = set()
+                for host_set in approved_sets:
+                    if not common_hosts:
+                        common_hosts = set(host_set)
+                    else:
+                        common_hosts &= host_set
+                common_configured_hosts = [h for h in configured_hosts if h in common_hosts]
+
+                if meta.get('debug'):
+                    console.print(f"[cyan]Image host debug: common_hosts={sorted(common_hosts)}[/cyan]")
+                    console.print(f"[cyan]Image host debug: common_configured_hosts={common_configured_hosts}[/cyan]")
+
+                # If we have any common hosts, use them as allowed_hosts for upload_screens
+                if common_configured_hosts:
+                    allowed_hosts = common_configured_hosts
+                elif common_hosts:
+                    allowed_hosts = sorted(common_hosts)
+
+                # Prefer the user-selected host if it's valid for all relevant trackers; otherwise
+                # fall back to the first common configured host by config priority (img_host_1..img_host_9).
+                current_img_host = str(meta.get('imghost') or config['DEFAULT'].get('img_host_1') or "")
+                preferred_host: Optional[str] = None
+
+                if common_configured_hosts and current_img_host not in common_configured_hosts:
+                    preferred_host = common_configured_hosts[0]
+                elif common_hosts and current_img_host not in common_hosts:
+                    preferred_host = sorted(common_hosts)[0]
+
+                if preferred_host and preferred_host != meta.get('imghost'):
+                    if meta.get('debug'):
+                        console.print(
+                            f"[cyan]Image host debug: current host '{current_img_host}' is not common to all trackers; "
+                            f"switching meta['imghost'] from '{meta.get('imghost')}' to '{preferred_host}'.[/cyan]"
+                        )
+                    meta['imghost'] = preferred_host
+
+            elif meta.get('debug'):
+                console.print(
+                    f"[cyan]Image host debug: cannot compute common host (all_known={all_known}, approved_sets={len(approved_sets)}, configured_hosts={len(configured_hosts)}).[/cyan]"
+                )
+
+        except Exception as e:
+            if meta.get('debug'):
+                console.print(f"[yellow]Could not determine a common approved image host: {e}[/yellow]")
+
+    return relevant_trackers, allowed_hosts
+
+
 async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
     """Process the metadata for each queued path."""
     if use_discord and bot:
+        from discordbot import DiscordNotifier
         await DiscordNotifier.send_discord_notification(
             config, bot, f"Starting upload process for: {meta['path']}", debug=meta.get('debug', False), meta=meta
         )
@@ -456,12 +565,15 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
             meta['unattended'] = True
             console.print("[yellow]Running in Auto Mode")
     prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
+    meta['stage_timings'] = {}
+    prep_started = time.perf_counter()
     try:
         meta = await prep.gather_prep(meta=meta, mode='cli')
     except Exception as e:
         console.print(f"Error in gather_prep: {e}")
         console.print(traceback.format_exc())
         return
+    record_stage(meta, 'prep', time.perf_counter() - prep_started)
 
     meta['emby_debug'] = meta.get('emby_debug') if meta.get('emby_debug', False) else config['DEFAULT'].get('emby_debug', False)
     if meta.get('emby_cat', None) == "movie" and meta.get('category', None) != "MOVIE":
@@ -646,7 +758,8 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
         except Exception as e:
             console.print(f"[yellow]Warning: Tracker validation encountered an error: {e}[/yellow]")
 
-        successful_trackers = await TrackerStatusManager(config=config).process_all_trackers(meta)
+        async with timed_stage(meta, 'dupe'):
+            successful_trackers = await TrackerStatusManager(config=config).process_all_trackers(meta)
 
         if meta.get('trackers_pass') is not None:
             meta['skip_uploading'] = meta.get('trackers_pass')
@@ -736,6 +849,8 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                 bdmv_mi_created = True
 
         progress_task = asyncio.create_task(print_progress("[yellow]Still processing, please wait...", interval=10))
+        torrent_stage: Optional[asyncio.Task[Optional[list[str]]]] = None
+        images_done = False
         try:
             if 'manual_frames' not in meta:
                 meta['manual_frames'] = ""
@@ -788,7 +903,23 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                     elif meta.get('path_to_menu_screenshots', ""):
                         await process_disc_menus(meta, config)
 
+                # When the image host is already settled, each screenshot is uploaded as soon as it passes the size checks
+                resolved_hosts: Optional[tuple[list[str], Optional[list[str]]]] = None
+                upload_stream: Optional[ScreenshotUploadStream] = None
+                if (
+                    config['DEFAULT'].get('stream_screenshot_uploads', True)
+                    and meta['is_disc'] not in ("BDMV", "DVD")
+                    and len(meta.get('image_list', []) or []) < int(meta.get('cutoff') or 1)
+                    and meta.get('skip_imghost_upload', False) is False
+                ):
+                    resolved_hosts = resolve_image_hosts(meta)
+                    if meta.get('imghost'):
+                        upload_stream = ScreenshotUploadStream(config, meta, allowed_hosts=resolved_hosts[1])
+                        upload_stream.start()
+
                 # Take Screenshots
+                screenshots_started = time.perf_counter()
+                screenshots_ok = False
                 try:
                     if meta['is_disc'] == "BDMV":
                         use_vs = meta.get('vapoursynth', False)
@@ -842,7 +973,8 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
 
                             await takescreens_manager.screenshots(
                                 videopath, filename, meta['uuid'], base_dir, meta,
-                                manual_frames=manual_frames  # Pass additional kwargs directly
+                                manual_frames=manual_frames,  # Pass additional kwargs directly
+                                on_screenshot=upload_stream.put if upload_stream is not None else None
                             )
                         except asyncio.CancelledError as e:
                             await cleanup_screenshot_temp_files(meta)
@@ -861,6 +993,7 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                             if "workers" in str(e):
                                 console.print("[red]max workers issue, see https://github.com/Audionut/Upload-Assistant/wiki/ffmpeg---max-workers-issues[/red]")
                             raise Exception(f"Error during screenshot capture: {e}") from e
+                    screenshots_ok = True
 
                 except asyncio.CancelledError as e:
                     await cleanup_screenshot_temp_files(meta)
@@ -877,10 +1010,19 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                     cleanup_manager.reset_terminal()
                     raise Exception("Error during screenshot capture") from e
                 finally:
+                    if upload_stream is not None and not screenshots_ok:
+                        await upload_stream.aclose()
                     await asyncio.sleep(0.1)
                     await cleanup_manager.cleanup()
                     gc.collect()
                     cleanup_manager.reset_terminal()
+                    record_stage(meta, 'screenshots', time.perf_counter() - screenshots_started)
+
+                # The frames are on disk, so BASE.torrent can hash while they upload
+                torrent_stage = start_stage(meta, 'torrent', prepare_base_torrent(meta))
+                images_started = time.perf_counter()
+                if upload_stream is not None and resolved_hosts is not None and await upload_stream.finish(int(meta.get('cutoff') or 1)):
+                    meta['image_host_checks'] = resolved_hosts[0]
 
                 if 'image_list' not in meta:
                     meta['image_list'] = []
@@ -897,109 +1039,9 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                 cutoff = int(meta.get('cutoff') or 1)
                 if len(meta.get('image_list', [])) < cutoff and meta.get('skip_imghost_upload', False) is False:
                     # Validate and (if needed) rehost images to tracker-approved hosts before uploading any new screenshots.
-                    trackers_with_image_host_requirements = {'A4K', 'BHD', 'DC', 'GPW', 'HUNO', 'MTV', 'OE', 'PTP', 'STC', 'TVC'}
-
-                    relevant_trackers = [
-                        t for t in cast(list[Any], meta.get('trackers', []))
-                        if isinstance(t, str) and t in trackers_with_image_host_requirements and t in tracker_class_map
-                    ]
-
-                    # If all relevant trackers share exactly one common approved host that the user has configured,
-                    # and it's not the initially selected host, switch meta['imghost'] to that common host.
-                    # If multiple common hosts exist, pick the first by config priority (img_host_1..img_host_9).
-                    allowed_hosts: Optional[list[str]] = None
-                    if relevant_trackers:
-                        try:
-                            tracker_instances = {
-                                tracker_name: tracker_class_map[tracker_name](config=config)
-                                for tracker_name in relevant_trackers
-                            }
-
-                            if meta.get('debug'):
-                                console.print(f"[cyan]Image host debug: meta['imghost']={meta.get('imghost')} img_host_1={config['DEFAULT'].get('img_host_1')}[/cyan]")
-                                console.print(f"[cyan]Image host debug: relevant_trackers={relevant_trackers}[/cyan]")
-
-                            default_cfg_obj = config.get('DEFAULT', {})
-                            default_cfg: dict[str, Any] = cast(dict[str, Any], default_cfg_obj) if isinstance(default_cfg_obj, dict) else {}
-                            configured_hosts: list[str] = []
-                            for host_index in range(1, 10):
-                                host_key = f'img_host_{host_index}'
-                                if host_key in default_cfg:
-                                    host = default_cfg.get(host_key)
-                                    if host and host not in configured_hosts:
-                                        configured_hosts.append(str(host))
-
-                            if meta.get('debug'):
-                                console.print(f"[cyan]Image host debug: configured_hosts={configured_hosts}[/cyan]")
-
-                            approved_sets: list[set[str]] = []
-                            all_known = True
-                            for tracker_name in relevant_trackers:
-                                tracker_instance = tracker_instances[tracker_name]
-                                approved_hosts = getattr(tracker_instance, 'approved_image_hosts', None)
-                                if not approved_hosts:
-                                    all_known = False
-                                    break
-                                if isinstance(approved_hosts, (list, set, tuple)):
-                                    approved_hosts_list = [
-                                        str(host)
-                                        for host in cast(Iterable[Any], approved_hosts)
-                                    ]
-                                    approved_sets.append(set(approved_hosts_list))
-                                else:
-                                    all_known = False
-                                    break
-
-                                if meta.get('debug'):
-                                    console.print(
-                                        f"[cyan]Image host debug: {tracker_name}.approved_image_hosts={approved_hosts_list}[/cyan]"
-                                    )
-
-                            if all_known and approved_sets and configured_hosts:
-                                common_hosts: set[str] = set()
-                                for host_set in approved_sets:
-                                    if not common_hosts:
-                                        common_hosts = set(host_set)
-                                    else:
-                                        common_hosts &= host_set
-                                common_configured_hosts = [h for h in configured_hosts if h in common_hosts]
-
-                                if meta.get('debug'):
-                                    console.print(f"[cyan]Image host debug: common_hosts={sorted(common_hosts)}[/cyan]")
-                                    console.print(f"[cyan]Image host debug: common_configured_hosts={common_configured_hosts}[/cyan]")
-
-                                # If we have any common hosts, use them as allowed_hosts for upload_screens
-                                if common_configured_hosts:
-                                    allowed_hosts = common_configured_hosts
-                                elif common_hosts:
-                                    allowed_hosts = sorted(common_hosts)
-
-                                # Prefer the user-selected host if it's valid for all relevant trackers; otherwise
-                                # fall back to the first common configured host by config priority (img_host_1..img_host_9).
-                                current_img_host = str(meta.get('imghost') or config['DEFAULT'].get('img_host_1') or "")
-                                preferred_host: Optional[str] = None
-
-                                if common_configured_hosts and current_img_host not in common_configured_hosts:
-                                    preferred_host = common_configured_hosts[0]
-                                elif common_hosts and current_img_host not in common_hosts:
-                                    preferred_host = sorted(common_hosts)[0]
-
-                                if preferred_host and preferred_host != meta.get('imghost'):
-                                    if meta.get('debug'):
-                                        console.print(
-                                            f"[cyan]Image host debug: current host '{current_img_host}' is not common to all trackers; "
-                                            f"switching meta['imghost'] from '{meta.get('imghost')}' to '{preferred_host}'.[/cyan]"
-                                        )
-                                    meta['imghost'] = preferred_host
-
-                            elif meta.get('debug'):
-                                console.print(
-                                    f"[cyan]Image host debug: cannot compute common host (all_known={all_known}, approved_sets={len(approved_sets)}, configured_hosts={len(configured_hosts)}).[/cyan]"
-                                )
-
-                        except Exception as e:
-                            if meta.get('debug'):
-                                console.print(f"[yellow]Could not determine a common approved image host: {e}[/yellow]")
+                    if resolved_hosts is None:
+                        resolved_hosts = resolve_image_hosts(meta)
+                    relevant_trackers, allowed_hosts = resolved_hosts
 
                     if meta.get('debug'):
                         image_list_for_debug = cast(list[Any], meta.get('image_list') or [])
@@ -1061,20 +1103,9 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                                 f"{image_list_count} were uploaded."
                             )
 
-                        # Now that image_list exists, populate tracker-specific keys (and only reupload if required)
-                        for tracker_name in relevant_trackers:
-                            tracker_instance = tracker_class_map[tracker_name](config=config)
-                            if meta.get('debug'):
-                                key = f"{tracker_name}_images_key"
-                                console.print(
-                                    f"[cyan]Image host debug: post-upload before {tracker_name}.check_image_hosts() image_list={len(meta.get('image_list', []) or [])} {key}={len(meta.get(key, []) or [])}[/cyan]"  # noqa: E501
-                                )
-                            await tracker_instance.check_image_hosts(meta)
-                            if meta.get('debug'):
-                                key = f"{tracker_name}_images_key"
-                                console.print(
-                                    f"[cyan]Image host debug: post-upload after  {tracker_name}.check_image_hosts() image_list={len(meta.get('image_list', []) or [])} {key}={len(meta.get(key, []) or [])}[/cyan]"  # noqa: E501
-                                )
+                        # Tracker-specific keys are populated (and reuploaded if required) at the start of
+                        # each tracker's own upload chain, so one tracker's rehost doesn't delay the others
+                        meta['image_host_checks'] = relevant_trackers
                     except asyncio.CancelledError:
                         console.print("\n[red]Upload process interrupted! Cancelling tasks...[/red]")
                         return
@@ -1108,71 +1139,94 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                             console.print(f"[cyan]Saved {len(image_list)} images to image_data.json")
                     except Exception as e:
                         console.print(f"[yellow]Failed to save image data: {str(e)}")
+                record_stage(meta, 'images', time.perf_counter() - images_started)
+            images_done = True
         finally:
             progress_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await progress_task
+            if not images_done:
+                await cancel_stage(torrent_stage)
+
+        if torrent_stage is None:
+            torrent_stage = start_stage(meta, 'torrent', prepare_base_torrent(meta))
+        # The stage runs alongside image uploads that read meta['trackers'], so it only reports
+        # the trackers that remain and the list is replaced here, once nothing else is reading it
+        remaining_trackers = await await_stage(torrent_stage)
+        if remaining_trackers is not None:
+            meta['trackers'] = remaining_trackers
+            if meta.get('debug', False):
+                console.print("[yellow]Removed MTV from trackers due to skip_if_rehash config and 8 MiB limit.[/yellow]")
+            if not remaining_trackers:
+                console.print("[red]No trackers remain after removing MTV for skip_if_rehash.[/red]")
+                meta['we_are_uploading'] = False
+                return
+
+        async with timed_stage(meta, 'description'):
+            meta = await gen_desc(meta, takescreens_manager, uploadscreens_manager)
 
-        torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
-        if meta.get('force_recheck', False):
-            waiter = Wait(config)
-            await waiter.select_and_recheck_best_torrent(meta, meta['path'], check_interval=5)
-        if not os.path.exists(torrent_path):
-            reuse_torrent = None
-            if meta.get('rehash', False) is False and not meta['base_torrent_created'] and not meta['we_checked_them_all']:
-                reuse_torrent = await client.find_existing_torrent(meta)
-                if reuse_torrent is not None:
-                    await TorrentCreator.create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
-
-            if meta['nohash'] is False and reuse_torrent is None:
-                await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
-            if meta['nohash']:
-                meta['client'] = "none"
-
-        elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
-            await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
+        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
+            await f.write(json.dumps(meta, indent=4))
 
-        if os.path.exists(torrent_path):
-            raw_trackers = meta.get('trackers')
-            if isinstance(raw_trackers, str):
-                trackers_list = [raw_trackers]
-            elif isinstance(raw_trackers, list):
-                trackers_list = [str(t) for t in cast(list[Any], raw_trackers) if str(t).strip()]
-            else:
-                trackers_list = []
-            trackers_upper = [str(t).strip().upper() for t in trackers_list if str(t).strip()]
 
-            base_piece_mb: Optional[int] = cast(Optional[int], meta.get('base_torrent_piece_mb'))
-            if base_piece_mb is None and any(t in {"HDB", "MTV", "PTP"} for t in trackers_upper):
-                try:
-                    torrent = await asyncio.to_thread(Torrent.read, torrent_path)
-                    base_piece_mb = int(torrent.piece_size // (1024 * 1024))
-                    meta['base_torrent_piece_mb'] = base_piece_mb
-                except Exception as e:
-                    if meta.get('debug', False):
-                        console.print(f"[yellow]Unable to cache BASE.torrent piece size: {e}")
-                    base_piece_mb = None
-
-            if "MTV" in trackers_upper:
-                mtv_cfg = config.get('TRACKERS', {}).get('MTV', {})
-                if str(mtv_cfg.get('skip_if_rehash', 'false')).lower() == 'true' and base_piece_mb and base_piece_mb > 8:
-                    meta['trackers'] = [t for t in trackers_list if str(t).strip().upper() != "MTV"]
-                    trackers_list = [str(t) for t in cast(list[Any], meta.get('trackers') or []) if str(t).strip()]
-                    trackers_upper = [str(t).strip().upper() for t in trackers_list if str(t).strip()]
-                    if meta.get('debug', False):
-                        console.print("[yellow]Removed MTV from trackers due to skip_if_rehash config and 8 MiB limit.[/yellow]")
-                    if not meta['trackers']:
-                        console.print("[red]No trackers remain after removing MTV for skip_if_rehash.[/red]")
-                        meta['we_are_uploading'] = False
-                        return
+async def prepare_base_torrent(meta: Meta) -> Optional[list[str]]:
+    """Create or reuse BASE.torrent.
+
+    Returns the trackers left once MTV is dropped for its piece size limit, or None when the
+    tracker list is unchanged. meta['trackers'] itself is left for the caller to update.
+    """
+    torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/BASE.torrent")
+    if meta.get('force_recheck', False):
+        waiter = Wait(config)
+        await waiter.select_and_recheck_best_torrent(meta, meta['path'], check_interval=5)
+    if not os.path.exists(torrent_path):
+        reuse_torrent = None
+        if meta.get('rehash', False) is False and not meta['base_torrent_created'] and not meta['we_checked_them_all']:
+            reuse_torrent = await client.find_existing_torrent(meta)
+            if reuse_torrent is not None:
+                await TorrentCreator.create_base_from_existing_torrent(reuse_torrent, meta['base_dir'], meta['uuid'])
+
+        if meta['nohash'] is False and reuse_torrent is None:
+            await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
+        if meta['nohash']:
+            meta['client'] = "none"
+
+    elif os.path.exists(torrent_path) and meta.get('rehash', False) is True and meta['nohash'] is False:
+        await TorrentCreator.create_torrent(meta, Path(meta['path']), "BASE")
+
+    remaining_trackers: Optional[list[str]] = None
+    if os.path.exists(torrent_path):
+        raw_trackers = meta.get('trackers')
+        if isinstance(raw_trackers, str):
+            trackers_list = [raw_trackers]
+        elif isinstance(raw_trackers, list):
+            trackers_list = [str(t) for t in cast(list[Any], raw_trackers) if str(t).strip()]
+        else:
+            trackers_list = []
+        trackers_upper = [str(t).strip().upper() for t in trackers_list if str(t).strip()]
 
-        if int(meta.get('randomized', 0)) >= 1 and not meta['mkbrr']:
-            TorrentCreator.create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
+        base_piece_mb: Optional[int] = cast(Optional[int], meta.get('base_torrent_piece_mb'))
+        if base_piece_mb is None and any(t in {"HDB", "MTV", "PTP"} for t in trackers_upper):
+            try:
+                torrent = await asyncio.to_thread(Torrent.read, torrent_path)
+                base_piece_mb = int(torrent.piece_size // (1024 * 1024))
+                meta['base_torrent_piece_mb'] = base_piece_mb
+            except Exception as e:
+                if meta.get('debug', False):
+                    console.print(f"[yellow]Unable to cache BASE.torrent piece size: {e}")
+                base_piece_mb = None
 
-        meta = await gen_desc(meta, takescreens_manager, uploadscreens_manager)
+        if "MTV" in trackers_upper:
+            mtv_cfg = config.get('TRACKERS', {}).get('MTV', {})
+            if str(mtv_cfg.get('skip_if_rehash', 'false')).lower() == 'true' and base_piece_mb and base_piece_mb > 8:
+                remaining_trackers = [t for t in trackers_list if str(t).strip().upper() != "MTV"]
+                if not remaining_trackers:
+                    return remaining_trackers
 
-        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(meta, indent=4))
+    if int(meta.get('randomized', 0)) >= 1 and not meta['mkbrr']:
+        TorrentCreator.create_random_torrents(meta['base_dir'], meta['uuid'], meta['randomized'], meta['path'])
+
+    return remaining_trackers
 
 
 async def cleanup_screenshot_temp_files(meta: Meta) -> None:
@@ -1375,6 +1429,7 @@ async def do_the_thing(base_dir: str) -> None:
             meta['path'] = None  # Clear the dummy path after parsing
         else:
             meta, _help, _before_args = cast(tuple[Meta, Any, Any], parser.parse(list(' '.join(sys.argv[1:]).split(' ')), meta))
+        configure_metadata_cache(base_dir, config, refresh=bool(meta.get('refresh_metadata')))
 
         # Start web UI if requested (exclusive mode - doesn't continue with uploads)
         if meta.get('webui'):
@@ -1522,8 +1577,20 @@ async def do_the_thing(base_dir: str) -> None:
         skipped_files_count = 0
         base_meta = dict(meta.items())
 
-        for queue_item in queue_list:
+        prefetcher: Optional[QueuePrefetcher] = None
+        lookahead = queue_lookahead_depth(config, meta)
+        if len(queue_list) > 1 and lookahead > 0 and not meta.get('site_upload_queue'):
+            prefetcher = QueuePrefetcher(
+                base_dir,
+                lookahead,
+                debug=bool(meta.get('debug', False)),
+                torrent_meta=lookahead_torrent_meta(config, meta),
+            )
+
+        for queue_index, queue_item in enumerate(queue_list):
             total_files = len(queue_list)
+            if prefetcher is not None:
+                prefetcher.schedule(queue_list[queue_index + 1:])
             bot = None
             current_item_path = ""
             tmp_path = ""
@@ -1602,6 +1669,8 @@ async def do_the_thing(base_dir: str) -> None:
                 and not meta['debug']
                 and ((only_unattended and meta.get('unattended', False)) or not only_unattended)
             ):
+                # discord.py is the single largest import; only load it when the bot is actually used
+                import discord
                 try:
                     console.print("[cyan]Starting Discord bot initialization...")
                     intents = discord.Intents.default()
@@ -1729,6 +1798,7 @@ async def do_the_thing(base_dir: str) -> None:
                         list(other_api_trackers),
                     )
                     if use_discord and bot:
+                        from discordbot import DiscordNotifier
                         await DiscordNotifier.send_upload_status_notification(config, bot, meta)
 
                     if config['DEFAULT'].get('cross_seeding', True):
@@ -1749,6 +1819,9 @@ async def do_the_thing(base_dir: str) -> None:
             if meta['debug']:
                 finish_time = time.time()
                 console.print(f"Uploads processed in {finish_time - start_time:.4f} seconds")
+            if meta['debug'] or config['DEFAULT'].get('show_stage_timings', False):
+                print_stage_timings(meta)
+                print_metadata_cache_stats()
 
             def build_tracker_status_line(tracker: str, status: Any) -> str:
                 try:
@@ -1780,6 +1853,7 @@ async def do_the_thing(base_dir: str) -> None:
                     return f"Error printing {tracker} data: {exc}\n"
 
             if use_discord and bot:
+                from discordbot import DiscordNotifier
                 send_upload_links = bool(discord_config.get('send_upload_links', False)) if discord_config is not None else False
                 if send_upload_links:
                     try:
@@ -1854,6 +1928,9 @@ async def do_the_thing(base_dir: str) -> None:
             gc.collect()
             cleanup_manager.reset_terminal()
 
+        if prefetcher is not None:
+            await prefetcher.aclose()
+
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred: {e}")
         if sanitize_meta:
@@ -1940,23 +2017,18 @@ async def process_cross_seeds(meta: Meta) -> None:
         helper = UploadHelper(config)
         dupe_checker = DupeChecker(config)
 
-        async def check_tracker_for_dupes(tracker: str) -> None:
+        async def check_tracker_for_dupes(tracker: str, tracker_class: Any) -> None:
             try:
-                tracker_class = tracker_class_map[tracker](config=config)
                 disctype = meta.get('disctype', '')
 
                 # Search for existing torrents
                 if tracker != "PTP":
                     dupes = await tracker_class.search_existing(meta, disctype)
                 else:
-                    ptp = PTP(config=config)
                     group_id = meta.get('ptp_groupID')
-                    if not group_id:
-                        group_id = await ptp.get_group_by_imdb(meta['imdb'])
-                        meta['ptp_groupID'] = group_id
                     if group_id is None:
                         return
-                    dupes = await ptp.search_existing(group_id, meta, disctype)
+                    dupes = await tracker_class.search_existing(group_id, meta, disctype)
 
                 if dupes:
                     dupes = await dupe_checker.filter_dupes(dupes, meta, tracker)
@@ -1969,8 +2041,20 @@ async def process_cross_seeds(meta: Meta) -> None:
                 if meta.get('debug'):
                     console.print(f"[yellow]Error checking {tracker} for cross-seeds: {e}[/yellow]")
 
+        # Checks that may prompt run one tracker at a time, before the concurrent searches
+        searchable_trackers: list[tuple[str, Any]] = []
+        for tracker in valid_unchecked_trackers:
+            try:
+                tracker_class = tracker_class_map[tracker](config=config)
+                pre_search_checks = getattr(tracker_class, 'pre_search_checks', None)
+                if pre_search_checks is None or await pre_search_checks(meta):
+                    searchable_trackers.append((tracker, tracker_class))
+            except Exception as e:  # noqa: PERF203 - one failing tracker must not stop the others
+                if meta.get('debug'):
+                    console.print(f"[yellow]Error checking {tracker} for cross-seeds: {e}[/yellow]")
+
         # Run all dupe checks concurrently
-        await asyncio.gather(*[check_tracker_for_dupes(tracker) for tracker in valid_unchecked_trackers], return_exceptions=True)
+        await asyncio.gather(*[check_tracker_for_dupes(tracker, tracker_class) for tracker, tracker_class in searchable_trackers], return_exceptions=True)
 
         # Restore original unattended value
         meta['unattended'] = original_unattended
@@ -2023,7 +2107,7 @@ async def process_cross_seeds(meta: Meta) -> None:
 
         if tracker == "AR" and download_url:
             try:
-                ar = AR(config=config)
+                ar = tracker_class_map['AR'](config=config)
                 auth_key = await ar.get_auth_key(meta)
 
                 # Extract torrent_pass from announce_url
@@ -41,6 +41,7 @@ except Exception:
     ansi_to_html = None
 
 from src.console import console
+from src.nameindex import shared_name_index
 
 cfg_dir = auth_mod.get_config_dir()
 cfg_dir.mkdir(parents=True, exist_ok=True)
@@ -2418,6 +2419,11 @@ def browse_roots():
     if bearer and not _token_is_valid(bearer):
         return jsonify({"success": False, "error": "Forbidden (invalid token)"}), 403
 
+    # Start indexing the roots now so the first browse search does not wait for a full walk
+    for root in roots:
+        if os.path.isdir(root):
+            shared_name_index(root)
+
     return jsonify({"items": items, "success": True})
 
 
@@ -2864,22 +2870,6 @@ def browse_search():
     if not query_tokens:
         return jsonify({"success": True, "items": [], "query": query})
 
-    def name_matches(name: str) -> bool:
-        """Check if query tokens appear as whole-word ordered subsequence in the name."""
-        name_tokens = [t for t in _BROWSE_SEARCH_SEP_RE.split(name.lower()) if t]
-        pos = 0
-        for qt in query_tokens:
-            found = False
-            while pos < len(name_tokens):
-                if name_tokens[pos] == qt:
-                    pos += 1
-                    found = True
-                    break
-                pos += 1
-            if not found:
-                return False
-        return True
-
     allowed_exts = SUPPORTED_DESC_EXTS if file_filter == "desc" else SUPPORTED_VIDEO_EXTS
     items: list[BrowseItem] = []
 
@@ -2889,51 +2879,33 @@ def browse_search():
             if not os.path.isdir(root_abs):
                 continue
             try:
-                for dirpath, dirnames, filenames in os.walk(root_abs):
-                    # Skip hidden dirs
-                    dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-
-                    # Check dirs
-                    for dirname in dirnames:
-                        if name_matches(dirname):
-                            full_path = os.path.join(dirpath, dirname)
-                            try:
-                                _assert_safe_resolved_path(full_path)
-                            except ValueError:
-                                continue
-                            items.append({"name": dirname, "path": full_path, "type": "folder", "children": []})
-                            if len(items) >= max_results:
-                                break
-
-                    if len(items) >= max_results:
-                        break
-
-                    # Check files
-                    for filename in filenames:
-                        if filename.startswith("."):
-                            continue
-                        if not name_matches(filename):
-                            continue
-                        _, ext = os.path.splitext(filename.lower())
-                        if ext not in allowed_exts:
-                            continue
-                        full_path = os.path.join(dirpath, filename)
-                        try:
-                            _assert_safe_resolved_path(full_path)
-                        except ValueError:
-                            continue
-                        items.append({"name": filename, "path": full_path, "type": "file", "children": None})
-                        if len(items) >= max_results:
-                            break
-
-                    if len(items) >= max_results:
-                        break
-            except PermissionError:
-                continue
+                # Names come from the background index; query tokens must appear as whole-word ordered subsequence
+                index = shared_name_index(root_abs)
+                index.sync()
+                matches = sorted(index.match_tokens(query), key=lambda entry: (not entry.is_dir, entry.lower, entry.path))
             except Exception as e:
                 console.print(f"Error searching in {root}: {e}", markup=False)
                 continue
 
+            for entry in matches:
+                # Skip hidden files and anything inside hidden dirs
+                if entry.hidden:
+                    continue
+                if not entry.is_dir:
+                    _, ext = os.path.splitext(entry.lower)
+                    if ext not in allowed_exts:
+                        continue
+                try:
+                    _assert_safe_resolved_path(entry.path)
+                except ValueError:
+                    continue
+                if entry.is_dir:
+                    items.append({"name": entry.name, "path": entry.path, "type": "folder", "children": []})
+                else:
+                    items.append({"name": entry.name, "path": entry.path, "type": "file", "children": None})
+                if len(items) >= max_results:
+                    break
+
             if len(items) >= max_results:
                 break
 